@@ -0,0 +1,17 @@
+from django.core.management.base import BaseCommand
+
+from api.schema import write_schema_documents
+
+
+class Command(BaseCommand):
+    help = (
+        "Generate the OpenAPI schema into OPENAPI_SCHEMA_DIR, to be served "
+        "from memory instead of being generated on request"
+    )
+
+    def handle(self, *args, **options):
+        for document in write_schema_documents():
+            self.stdout.write(
+                f"Wrote openapi.{document.format} "
+                f"({len(document.content):,} bytes, ETag {document.etag})"
+            )
@@ -0,0 +1,102 @@
+import threading
+from hashlib import md5
+from pathlib import Path
+
+from django.conf import settings
+from drf_yasg import openapi
+from drf_yasg.codecs import OpenAPICodecJson, OpenAPICodecYaml
+from drf_yasg.generators import OpenAPISchemaGenerator
+
+API_INFO = openapi.Info(
+    title="Taskforce HQ API",
+    default_version="v1",
+    description="Your intelligent AI-powered task management HQ.",
+    contact=openapi.Contact(email="muttakinhasib@outlook.com"),
+    license=openapi.License(name="MIT License"),
+)
+
+# Encoders and content types of the schema formats
+SCHEMA_FORMATS = {
+    "json": (OpenAPICodecJson, "application/json"),
+    "yaml": (OpenAPICodecYaml, "application/yaml"),
+}
+
+_documents = {}
+_lock = threading.Lock()
+
+
+class SchemaDocument:
+    """
+    The encoded OpenAPI schema in one format, with a strong ETag of its
+    content.
+    """
+
+    def __init__(self, format, content):
+        self.format = format
+        self.content = content
+        self.etag = f'"{md5(content, usedforsecurity=False).hexdigest()}"'
+
+    @property
+    def content_type(self):
+        return SCHEMA_FORMATS[self.format][1]
+
+
+def generate_schema():
+    """
+    Introspect every API view into an ``openapi.Swagger`` document.
+
+    Generated without a request, so the schema has no host and clients
+    resolve its paths against the server they fetched it from.
+    """
+    return OpenAPISchemaGenerator(API_INFO).get_schema(request=None, public=True)
+
+
+def encode_schema(schema, format):
+    codec_class, _ = SCHEMA_FORMATS[format]
+    return codec_class(validators=[]).encode(schema)
+
+
+def get_schema_path(format):
+    return Path(settings.OPENAPI_SCHEMA_DIR) / f"openapi.{format}"
+
+
+def write_schema_documents():
+    """
+    Generate the schema and write it in every format to
+    ``OPENAPI_SCHEMA_DIR``. Returns the written documents.
+    """
+    schema = generate_schema()
+    documents = []
+    for format in SCHEMA_FORMATS:
+        document = SchemaDocument(format, encode_schema(schema, format))
+        path = get_schema_path(format)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(document.content)
+        documents.append(document)
+    return documents
+
+
+def get_schema_document(format):
+    """
+    Return the schema document of a format, kept in memory for the life of
+    the process.
+
+    It is read from the artifact written at build time by
+    ``python manage.py generate_openapi_schema``, or generated on first use
+    when there is none.
+    """
+    document = _documents.get(format)
+    if document is not None:
+        return document
+
+    with _lock:
+        # Another thread may have loaded it while this one was waiting
+        if format not in _documents:
+            path = get_schema_path(format)
+            if path.exists():
+                _documents[format] = SchemaDocument(format, path.read_bytes())
+            else:
+                _documents[format] = SchemaDocument(
+                    format, encode_schema(generate_schema(), format)
+                )
+        return _documents[format]
@@ -1,7 +1,14 @@
 from django.urls import include, path
 
+from api.views import CacheStatsView
+
 urlpatterns = [
     path("auth/", include("apps.authentication.urls")),
     path("teams/", include("apps.teams.urls")),
+    path("tasks/", include("apps.tasks.urls")),
     path("users/", include("apps.users.urls")),
+    path("activity/", include("apps.activity.urls")),
+    path("worklogs/", include("apps.worklogs.urls")),
+    path("search/", include("apps.search.urls")),
+    path("cache/stats/", CacheStatsView.as_view(), name="cache-stats"),
 ]
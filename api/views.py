@@ -1,3 +1,58 @@
-from django.shortcuts import render
+from django.http import Http404, HttpResponse
+from django.utils.cache import get_conditional_response, patch_cache_control
+from django.views import View
+from drf_yasg.utils import swagger_auto_schema
+from rest_framework import status
+from rest_framework.permissions import IsAdminUser
+from rest_framework.response import Response
+from rest_framework.views import APIView
 
-# Create your views here.
+from api.schema import SCHEMA_FORMATS, get_schema_document
+from common.cache import registry
+
+
+class CacheStatsView(APIView):
+    """Response cache hit/miss counters"""
+
+    permission_classes = [IsAdminUser]
+
+    @swagger_auto_schema(
+        tags=["Cache"],
+        operation_description="Get hit/miss counters for every response cache",
+        responses={200: "Counters keyed by cache namespace"},
+    )
+    def get(self, request):
+        return Response(
+            {namespace: cache.stats() for namespace, cache in registry.items()},
+            status=status.HTTP_200_OK,
+        )
+
+    @swagger_auto_schema(
+        tags=["Cache"],
+        operation_description="Reset the hit/miss counters",
+        responses={204: "Counters reset"},
+    )
+    def delete(self, request):
+        for cache in registry.values():
+            cache.reset_stats()
+        return Response(status=status.HTTP_204_NO_CONTENT)
+
+
+class SchemaView(View):
+    """OpenAPI schema, served from memory (see api.schema)"""
+
+    def get(self, request, format):
+        format = format.lstrip(".")
+        if format not in SCHEMA_FORMATS:
+            raise Http404
+        document = get_schema_document(format)
+
+        response = get_conditional_response(request, etag=document.etag)
+        if response is None:
+            response = HttpResponse(
+                document.content, content_type=document.content_type
+            )
+        response["ETag"] = document.etag
+        # Public, but revalidated on every use as a deploy can change it
+        patch_cache_control(response, public=True, no_cache=True)
+        return response
@@ -0,0 +1,20 @@
+from django.contrib import admin
+
+from apps.activity.models import Activity
+from common.admin import EstimatedCountAdminMixin
+
+
+class ActivityAdmin(EstimatedCountAdminMixin, admin.ModelAdmin):
+    list_display = ("created_at", "action", "target_type", "target_id", "team_id")
+    list_filter = ("action", "target_type")
+    list_per_page = 10
+
+    # The log is append-only
+    def has_add_permission(self, request):
+        return False
+
+    def has_change_permission(self, request, obj=None):
+        return False
+
+
+admin.site.register(Activity, ActivityAdmin)
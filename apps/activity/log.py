@@ -0,0 +1,112 @@
+import logging
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from django.db import DatabaseError, transaction
+
+from apps.activity.models import Activity
+from apps.projects.models import Project
+
+logger = logging.getLogger(__name__)
+
+BATCH_SIZE = 1000
+
+_buffer = ContextVar("activity_buffer", default=None)
+
+
+class ActivityBuffer:
+    """
+    Activities recorded while handling one request (or command), written
+    with a single ``bulk_create()`` at the end.
+
+    Only committed changes reach the buffer. The actor and the team of
+    events recorded without one are filled in when the buffer is written:
+    the actor from the authenticated user, the team from the project with
+    one query for the whole buffer.
+    """
+
+    def __init__(self, actor_id=None):
+        self.actor_id = actor_id
+        self.events = []
+
+    def flush(self):
+        events = self.events
+        project_ids = {event.project_id for event in events if event.team_id is None}
+        team_ids = dict(
+            Project.objects.filter(pk__in=project_ids).values_list("id", "team_id")
+            if project_ids
+            else ()
+        )
+
+        rows = []
+        for event in events:
+            if event.team_id is None:
+                # The project was deleted since; its own deletion is logged
+                if event.project_id not in team_ids:
+                    continue
+                event.team_id = team_ids[event.project_id]
+            if event.actor_id is None:
+                event.actor_id = self.actor_id
+            rows.append(event)
+        Activity.objects.bulk_create(rows, batch_size=BATCH_SIZE)
+        self.events = []
+        return len(rows)
+
+
+@contextmanager
+def buffer_activity(actor_id=None):
+    """
+    Buffer the activities recorded in the block and write them on exit.
+
+    The log is best-effort: a failed write is logged, not raised, as the
+    changes themselves are already committed.
+    """
+    buffer = ActivityBuffer(actor_id)
+    token = _buffer.set(buffer)
+    try:
+        yield buffer
+    finally:
+        _buffer.reset(token)
+        try:
+            buffer.flush()
+        except DatabaseError:
+            logger.exception("Could not write %d activities", len(buffer.events))
+
+
+def record(action, target_type, target_id, team_id=None, project_id=None, **kwargs):
+    """
+    Record an activity once the current transaction commits (at once outside
+    of a transaction). Pass the team, or the project to find it from.
+
+    Within ``buffer_activity()`` the activity is written with the rest of the
+    buffer, otherwise on its own.
+    """
+    record_all(
+        [
+            Activity(
+                action=action,
+                target_type=target_type,
+                target_id=target_id,
+                team_id=team_id,
+                project_id=project_id,
+                **kwargs,
+            )
+        ]
+    )
+
+
+def record_all(events):
+    """
+    Record unsaved ``Activity`` instances once the current transaction
+    commits, like ``record()``.
+    """
+    transaction.on_commit(lambda: add(events))
+
+
+def add(events):
+    buffer = _buffer.get()
+    if buffer is not None:
+        buffer.events.extend(events)
+        return
+    with buffer_activity() as buffer:
+        buffer.events.extend(events)
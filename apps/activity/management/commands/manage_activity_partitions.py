@@ -0,0 +1,51 @@
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.activity.partitions import (
+    DEFAULT_PARTITION,
+    create_partitions,
+    delete_expired_default_rows,
+    drop_expired_partitions,
+)
+
+
+class Command(BaseCommand):
+    help = (
+        "Create the activity log partitions of the coming months and drop the "
+        "months past the retention, with the expired rows of the DEFAULT "
+        "partition (deletes the rows on databases without partitioning)"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--retention-months",
+            type=int,
+            default=settings.ACTIVITY_RETENTION_MONTHS,
+            help="Months of activity to keep, the current month included",
+        )
+        parser.add_argument(
+            "--months-ahead",
+            type=int,
+            default=settings.ACTIVITY_PARTITIONS_AHEAD,
+            help="Months to create partitions for, after the current month",
+        )
+
+    def handle(self, *args, **options):
+        if options["retention_months"] < 1:
+            raise CommandError("--retention-months must be at least 1")
+
+        for name in create_partitions(options["months_ahead"]):
+            self.stdout.write(f"Created partition {name}")
+
+        dropped = drop_expired_partitions(options["retention_months"])
+        if isinstance(dropped, int):
+            self.stdout.write(f"Deleted {dropped:,} expired activity row(s)")
+            return
+        for name in dropped:
+            self.stdout.write(f"Dropped partition {name}")
+
+        deleted = delete_expired_default_rows(options["retention_months"])
+        if deleted:
+            self.stdout.write(
+                f"Deleted {deleted:,} expired activity row(s) from {DEFAULT_PARTITION}"
+            )
@@ -0,0 +1,20 @@
+from apps.activity.log import buffer_activity
+
+
+class ActivityMiddleware:
+    """
+    Buffers the activities recorded during a request and writes them in one
+    batch once the response is ready, attributed to the authenticated user.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        with buffer_activity() as buffer:
+            response = self.get_response(request)
+            # DRF sets the user it authenticated on the underlying request
+            user = getattr(request, "user", None)
+            if user is not None and user.is_authenticated:
+                buffer.actor_id = user.pk
+        return response
@@ -0,0 +1,92 @@
+# Generated by Django 5.2 on 2026-10-18 00:06
+
+import django.core.serializers.json
+import django.db.models.deletion
+import django.utils.timezone
+import uuid
+from datetime import UTC, datetime
+
+from django.conf import settings
+from django.db import migrations, models
+
+# The primary key of a partitioned table must include the partition key
+PARTITIONED_TABLE_SQL = """
+CREATE TABLE "activity_activity" (
+    "id" uuid NOT NULL,
+    "team_id" uuid NOT NULL,
+    "project_id" uuid NULL,
+    "actor_id" uuid NULL,
+    "action" varchar(20) NOT NULL,
+    "target_type" varchar(20) NOT NULL,
+    "target_id" uuid NOT NULL,
+    "data" jsonb NOT NULL,
+    "created_at" timestamp with time zone NOT NULL,
+    PRIMARY KEY ("id", "created_at")
+) PARTITION BY RANGE ("created_at")
+"""
+
+
+def get_month(now, months):
+    index = now.year * 12 + now.month - 1 + months
+    return datetime(index // 12, index % 12 + 1, 1, tzinfo=UTC)
+
+
+def create_activity_table(apps, schema_editor):
+    Activity = apps.get_model('activity', 'Activity')
+    if schema_editor.connection.vendor != 'postgresql':
+        schema_editor.create_model(Activity)
+        return
+
+    schema_editor.execute(PARTITIONED_TABLE_SQL)
+    for index in Activity._meta.indexes:
+        schema_editor.add_index(Activity, index)
+    schema_editor.execute('CREATE TABLE "activity_activity_default" PARTITION OF "activity_activity" DEFAULT')
+    # The coming months are created by the manage_activity_partitions command
+    now = django.utils.timezone.now()
+    for offset in range(3):
+        month, next_month = get_month(now, offset), get_month(now, offset + 1)
+        schema_editor.execute(
+            f'CREATE TABLE "activity_activity_p{month:%Y_%m}" PARTITION OF "activity_activity" FOR VALUES FROM (%s) TO (%s)',
+            [month.isoformat(), next_month.isoformat()],
+        )
+
+
+def drop_activity_table(apps, schema_editor):
+    schema_editor.delete_model(apps.get_model('activity', 'Activity'))
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        ('projects', '0001_initial'),
+        ('teams', '0004_team_is_deleting'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.SeparateDatabaseAndState(
+            state_operations=[
+                migrations.CreateModel(
+                    name='Activity',
+                    fields=[
+                        ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                        ('action', models.CharField(choices=[('created', 'Created'), ('updated', 'Updated'), ('deleted', 'Deleted'), ('imported', 'Imported')], max_length=20)),
+                        ('target_type', models.CharField(choices=[('team', 'Team'), ('member', 'Member'), ('project', 'Project'), ('task', 'Task')], max_length=20)),
+                        ('target_id', models.UUIDField()),
+                        ('data', models.JSONField(blank=True, default=dict, encoder=django.core.serializers.json.DjangoJSONEncoder)),
+                        ('created_at', models.DateTimeField(default=django.utils.timezone.now)),
+                        ('actor', models.ForeignKey(blank=True, db_constraint=False, db_index=False, null=True, on_delete=django.db.models.deletion.DO_NOTHING, related_name='+', to=settings.AUTH_USER_MODEL)),
+                        ('project', models.ForeignKey(blank=True, db_constraint=False, db_index=False, null=True, on_delete=django.db.models.deletion.DO_NOTHING, related_name='+', to='projects.project')),
+                        ('team', models.ForeignKey(db_constraint=False, db_index=False, on_delete=django.db.models.deletion.DO_NOTHING, related_name='+', to='teams.team')),
+                    ],
+                    options={
+                        'verbose_name_plural': 'activities',
+                        'indexes': [models.Index(fields=['team', '-created_at', '-id'], name='activity_team_created_idx'), models.Index(fields=['project', '-created_at', '-id'], name='activity_project_created_idx')],
+                    },
+                ),
+            ],
+        ),
+        migrations.RunPython(create_activity_table, drop_activity_table),
+    ]
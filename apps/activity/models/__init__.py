@@ -0,0 +1,3 @@
+from apps.activity.models.activity import Activity
+
+__all__ = ["Activity"]
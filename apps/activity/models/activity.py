@@ -0,0 +1,74 @@
+from uuid import uuid4
+
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import models
+from django.utils import timezone
+
+from apps.projects.models import Project
+from apps.teams.models import Team
+from apps.users.models import User
+from common.models import ActivityAction, ActivityTarget
+
+
+class Activity(models.Model):
+    """
+    Append-only log of team, project and task changes.
+
+    On PostgreSQL the table is partitioned by month of ``created_at`` (see
+    apps.activity.partitions), so its primary key is ``(id, created_at)``
+    and old months are dropped as whole partitions. The references are not
+    enforced by the database: rows are only ever inserted, and removed by
+    team purges and retention.
+    """
+
+    id = models.UUIDField(primary_key=True, default=uuid4, editable=False)
+    # Indexed as the leading column of the feed indexes below
+    team = models.ForeignKey(
+        Team,
+        on_delete=models.DO_NOTHING,
+        db_constraint=False,
+        db_index=False,
+        related_name="+",
+    )
+    project = models.ForeignKey(
+        Project,
+        on_delete=models.DO_NOTHING,
+        db_constraint=False,
+        db_index=False,
+        null=True,
+        blank=True,
+        related_name="+",
+    )
+    actor = models.ForeignKey(
+        User,
+        on_delete=models.DO_NOTHING,
+        db_constraint=False,
+        db_index=False,
+        null=True,
+        blank=True,
+        related_name="+",
+    )
+    action = models.CharField(max_length=20, choices=ActivityAction.choices)
+    target_type = models.CharField(max_length=20, choices=ActivityTarget.choices)
+    target_id = models.UUIDField()
+    data = models.JSONField(default=dict, blank=True, encoder=DjangoJSONEncoder)
+    # Set when the change is recorded, not when the buffer is written
+    created_at = models.DateTimeField(default=timezone.now)
+
+    class Meta:
+        verbose_name_plural = "activities"
+        indexes = [
+            # Team feed, newest first
+            models.Index(
+                fields=["team", "-created_at", "-id"],
+                name="activity_team_created_idx",
+            ),
+            # Project feed, newest first
+            models.Index(
+                fields=["project", "-created_at", "-id"],
+                name="activity_project_created_idx",
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.action} {self.target_type} {self.target_id}"
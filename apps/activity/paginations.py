@@ -0,0 +1,8 @@
+from common.paginations import KeysetPagination
+
+
+class ActivityPagination(KeysetPagination):
+    page_size = 50
+    page_size_query_param = "page_size"
+    max_page_size = 200
+    ordering = ("-created_at", "-id")
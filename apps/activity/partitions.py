@@ -0,0 +1,148 @@
+from datetime import UTC, datetime
+
+from django.db import connection, transaction
+from django.utils import timezone
+
+from apps.activity.models import Activity
+from common.db import delete_in_chunks
+
+TABLE = Activity._meta.db_table
+# Catches rows outside of every monthly partition, normally empty
+DEFAULT_PARTITION = f"{TABLE}_default"
+
+
+def get_month(value=None, months=0):
+    """
+    Return the first instant (UTC) of the month of ``value`` (now by
+    default), shifted by ``months``.
+    """
+    value = value or timezone.now()
+    index = value.year * 12 + value.month - 1 + months
+    return datetime(index // 12, index % 12 + 1, 1, tzinfo=UTC)
+
+
+def get_partition_name(month):
+    return f"{TABLE}_p{month:%Y_%m}"
+
+
+def is_partitioned():
+    return connection.vendor == "postgresql"
+
+
+def get_partitions():
+    """
+    Return the names of the table's monthly partitions, oldest first.
+    """
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT child.relname FROM pg_inherits "
+            "JOIN pg_class parent ON parent.oid = pg_inherits.inhparent "
+            "JOIN pg_class child ON child.oid = pg_inherits.inhrelid "
+            "WHERE parent.relname = %s",
+            [TABLE],
+        )
+        names = [name for (name,) in cursor.fetchall()]
+    return sorted(name for name in names if name != DEFAULT_PARTITION)
+
+
+def create_partitions(months_ahead):
+    """
+    Create the partitions of the current month and of the next
+    ``months_ahead`` months, returning the names of the created ones.
+    """
+    if not is_partitioned():
+        return []
+
+    existing = set(get_partitions())
+    created = []
+    for offset in range(months_ahead + 1):
+        month = get_month(months=offset)
+        name = get_partition_name(month)
+        if name in existing:
+            continue
+        create_partition(name, month, get_month(month, 1))
+        created.append(name)
+    return created
+
+
+def create_partition(name, start, end):
+    """
+    Create the partition of ``[start, end)``.
+
+    A partition cannot be added while the DEFAULT partition holds rows of
+    its range (written while it was missing), so the partition is created as
+    a plain table, those rows are moved into it and it is then attached, in
+    one transaction.
+    """
+    quote_name = connection.ops.quote_name
+    table, default, partition = (
+        quote_name(TABLE),
+        quote_name(DEFAULT_PARTITION),
+        quote_name(name),
+    )
+    bounds = [start.isoformat(), end.isoformat()]
+    with transaction.atomic(), connection.cursor() as cursor:
+        cursor.execute(
+            f"CREATE TABLE {partition} "
+            f"(LIKE {table} INCLUDING DEFAULTS INCLUDING CONSTRAINTS)"
+        )
+        cursor.execute(
+            f"WITH moved AS (DELETE FROM {default} "
+            'WHERE "created_at" >= %s AND "created_at" < %s RETURNING *) '
+            f"INSERT INTO {partition} SELECT * FROM moved",
+            bounds,
+        )
+        # The table's indexes are created on the partition as it is attached
+        cursor.execute(
+            f"ALTER TABLE {table} ATTACH PARTITION {partition} "
+            "FOR VALUES FROM (%s) TO (%s)",
+            bounds,
+        )
+
+
+def get_retention_cutoff(retention_months):
+    # The current month counts as one of the months kept
+    return get_month(months=-(retention_months - 1))
+
+
+def drop_expired_partitions(retention_months):
+    """
+    Drop the months older than the current month and the previous
+    ``retention_months - 1`` months. Returns the names of the dropped
+    partitions, or the number of deleted rows on databases without
+    partitioning.
+    """
+    cutoff = get_retention_cutoff(retention_months)
+    if not is_partitioned():
+        return delete_in_chunks(Activity.objects.filter(created_at__lt=cutoff))
+
+    expired = [name for name in get_partitions() if name < get_partition_name(cutoff)]
+    with connection.cursor() as cursor:
+        for name in expired:
+            cursor.execute(f"DROP TABLE {connection.ops.quote_name(name)}")
+    return expired
+
+
+def delete_expired_default_rows(retention_months, chunk_size=5000):
+    """
+    Delete the rows of the DEFAULT partition past the retention, which
+    dropping monthly partitions never reaches, in chunks of ``chunk_size``
+    rows. Returns the number of deleted rows.
+    """
+    if not is_partitioned():
+        return 0
+
+    default = connection.ops.quote_name(DEFAULT_PARTITION)
+    cutoff = get_retention_cutoff(retention_months).isoformat()
+    deleted = 0
+    while True:
+        with transaction.atomic(), connection.cursor() as cursor:
+            cursor.execute(
+                f"DELETE FROM {default} WHERE ctid IN (SELECT ctid FROM {default} "
+                'WHERE "created_at" < %s LIMIT %s)',
+                [cutoff, chunk_size],
+            )
+            count = cursor.rowcount
+        deleted += count
+        if count < chunk_size:
+            return deleted
@@ -0,0 +1,33 @@
+from rest_framework import serializers
+
+from apps.activity.models import Activity
+from common.serializers import DynamicFieldsMixin
+
+
+class ActivitySerializer(DynamicFieldsMixin, serializers.ModelSerializer):
+    class Meta:
+        model = Activity
+        fields = "__all__"
+
+
+class ActivityFeedSerializer(serializers.Serializer):
+    """
+    Query parameters of the activity feed.
+    """
+
+    team = serializers.UUIDField()
+    project = serializers.UUIDField(required=False)
+
+
+class ActivityListSerializer(serializers.Serializer):
+    """
+    Serializer for documenting activity feed pages in Swagger.
+    """
+
+    next = serializers.URLField(
+        allow_null=True, help_text="URL to the next (older) page, if any"
+    )
+    previous = serializers.URLField(
+        allow_null=True, help_text="URL to the previous (newer) page, if any"
+    )
+    results = ActivitySerializer(many=True)
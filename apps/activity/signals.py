@@ -0,0 +1,138 @@
+from django.db.models.signals import post_delete, post_save, pre_save
+from django.dispatch import receiver
+
+from apps.activity.log import record, record_all
+from apps.activity.models import Activity
+from apps.projects.models import Project
+from apps.tasks.models import Task
+from apps.tasks.signals import tasks_imported, tasks_updated
+from apps.teams.models import Team, TeamMember
+from common.models import ActivityAction, ActivityTarget
+
+
+def get_action(created):
+    return ActivityAction.CREATED if created else ActivityAction.UPDATED
+
+
+@receiver(post_save, sender=Team)
+def log_team_saved(sender, instance, created, **kwargs):
+    record(
+        get_action(created),
+        ActivityTarget.TEAM,
+        instance.pk,
+        team_id=instance.pk,
+        data={"name": instance.name},
+    )
+
+
+@receiver(post_save, sender=TeamMember)
+def log_member_saved(sender, instance, created, **kwargs):
+    record(
+        get_action(created),
+        ActivityTarget.MEMBER,
+        instance.user_id,
+        team_id=instance.team_id,
+        data={"role": instance.role},
+    )
+
+
+@receiver(post_delete, sender=TeamMember)
+def log_member_deleted(sender, instance, **kwargs):
+    record(
+        ActivityAction.DELETED,
+        ActivityTarget.MEMBER,
+        instance.user_id,
+        team_id=instance.team_id,
+        data={"role": instance.role},
+    )
+
+
+@receiver(post_save, sender=Project)
+def log_project_saved(sender, instance, created, **kwargs):
+    record(
+        get_action(created),
+        ActivityTarget.PROJECT,
+        instance.pk,
+        team_id=instance.team_id,
+        project_id=instance.pk,
+        data={"name": instance.name},
+    )
+
+
+@receiver(post_delete, sender=Project)
+def log_project_deleted(sender, instance, **kwargs):
+    record(
+        ActivityAction.DELETED,
+        ActivityTarget.PROJECT,
+        instance.pk,
+        team_id=instance.team_id,
+        project_id=instance.pk,
+        data={"name": instance.name},
+    )
+
+
+# The loaded status is reset by the counters' post_save receiver, so it is
+# read before the save
+@receiver(pre_save, sender=Task)
+def remember_task_status(sender, instance, **kwargs):
+    instance._previous_status = getattr(instance, "_loaded_status", None)
+
+
+@receiver(post_save, sender=Task)
+def log_task_saved(sender, instance, created, **kwargs):
+    data = {"title": instance.title}
+    previous_status = getattr(instance, "_previous_status", None)
+    if not created and previous_status not in (None, instance.status):
+        data["changes"] = {"status": instance.status}
+        data["previous"] = {"status": previous_status}
+    record(
+        get_action(created),
+        ActivityTarget.TASK,
+        instance.pk,
+        project_id=instance.project_id,
+        data=data,
+    )
+
+
+@receiver(post_delete, sender=Task)
+def log_task_deleted(sender, instance, **kwargs):
+    record(
+        ActivityAction.DELETED,
+        ActivityTarget.TASK,
+        instance.pk,
+        project_id=instance.project_id,
+        data={"title": instance.title},
+    )
+
+
+@receiver(tasks_updated, sender=Task)
+def log_tasks_updated(sender, changes, values, **kwargs):
+    changed = {name: getattr(value, "pk", value) for name, value in values.items()}
+    events = []
+    for task_id, project_id, status in changes:
+        data = {"changes": changed}
+        if "status" in values:
+            data["previous"] = {"status": status}
+        events.append(
+            Activity(
+                action=ActivityAction.UPDATED,
+                target_type=ActivityTarget.TASK,
+                target_id=task_id,
+                project_id=project_id,
+                data=data,
+            )
+        )
+    record_all(events)
+
+
+@receiver(tasks_imported, sender=Task)
+def log_tasks_imported(sender, project, created_by, count, **kwargs):
+    record(
+        ActivityAction.IMPORTED,
+        ActivityTarget.PROJECT,
+        project.pk,
+        team_id=project.team_id,
+        project_id=project.pk,
+        actor_id=getattr(created_by, "pk", None),
+        data={"name": project.name, "tasks": count},
+    )
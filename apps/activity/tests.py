@@ -0,0 +1,109 @@
+from datetime import UTC, datetime
+from io import StringIO
+from unittest import skipIf, skipUnless
+from uuid import uuid4
+
+from django.core.management import call_command
+from django.db import connection
+from django.test import SimpleTestCase, TestCase
+
+from apps.activity.models import Activity
+from apps.activity.partitions import (
+    DEFAULT_PARTITION,
+    create_partition,
+    create_partitions,
+    delete_expired_default_rows,
+    drop_expired_partitions,
+    get_month,
+    get_partition_name,
+    get_partitions,
+    is_partitioned,
+)
+from common.models import ActivityAction, ActivityTarget
+
+
+class MonthTests(SimpleTestCase):
+    def test_get_month(self):
+        value = datetime(2026, 12, 15, 10, tzinfo=UTC)
+        self.assertEqual(get_month(value), datetime(2026, 12, 1, tzinfo=UTC))
+        self.assertEqual(get_month(value, 1), datetime(2027, 1, 1, tzinfo=UTC))
+        self.assertEqual(get_month(value, -12), datetime(2025, 12, 1, tzinfo=UTC))
+
+    def test_partition_names_sort_by_month(self):
+        names = [get_partition_name(datetime(2026, month, 1)) for month in (2, 11)]
+        self.assertEqual(
+            names, ["activity_activity_p2026_02", "activity_activity_p2026_11"]
+        )
+        self.assertEqual(sorted(names), names)
+
+
+class ActivityRetentionTestCase(TestCase):
+    def add_activity(self, months_ago):
+        return Activity.objects.create(
+            team_id=uuid4(),
+            action=ActivityAction.CREATED,
+            target_type=ActivityTarget.TASK,
+            target_id=uuid4(),
+            created_at=get_month(months=-months_ago).replace(day=2),
+        )
+
+    def count(self, table):
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"SELECT COUNT(*) FROM ONLY {connection.ops.quote_name(table)}"
+            )
+            return cursor.fetchone()[0]
+
+
+@skipIf(is_partitioned(), "the table is partitioned")
+class UnpartitionedRetentionTests(ActivityRetentionTestCase):
+    def test_expired_rows_are_deleted(self):
+        self.add_activity(13)
+        kept = [self.add_activity(months_ago) for months_ago in (0, 11)]
+
+        self.assertEqual(create_partitions(3), [])
+        self.assertEqual(drop_expired_partitions(12), 1)
+        self.assertEqual(delete_expired_default_rows(12), 0)
+        self.assertCountEqual(Activity.objects.all(), kept)
+
+    def test_command(self):
+        self.add_activity(13)
+        stdout = StringIO()
+        call_command("manage_activity_partitions", retention_months=12, stdout=stdout)
+        self.assertEqual(stdout.getvalue(), "Deleted 1 expired activity row(s)\n")
+
+
+@skipUnless(is_partitioned(), "the table is not partitioned")
+class PartitionTests(ActivityRetentionTestCase):
+    def test_creates_the_coming_months(self):
+        names = [get_partition_name(get_month(months=offset)) for offset in range(4)]
+        created = create_partitions(3)
+
+        self.assertEqual(created, [name for name in names if name in created])
+        self.assertTrue(set(names) <= set(get_partitions()))
+        self.assertEqual(create_partitions(3), [])
+
+    def test_rows_in_the_default_partition_move_to_a_new_partition(self):
+        activity = self.add_activity(30)
+        self.assertEqual(self.count(DEFAULT_PARTITION), 1)
+
+        month = get_month(activity.created_at)
+        name = get_partition_name(month)
+        create_partition(name, month, get_month(month, 1))
+
+        self.assertEqual(self.count(DEFAULT_PARTITION), 0)
+        self.assertEqual(self.count(name), 1)
+        self.assertIn(name, get_partitions())
+        self.assertEqual(Activity.objects.get(), activity)
+
+    def test_expired_months_are_dropped(self):
+        expired = self.add_activity(14)
+        month = get_month(expired.created_at)
+        create_partition(get_partition_name(month), month, get_month(month, 1))
+        # A month without a partition, whose row lands in the DEFAULT partition
+        self.add_activity(13)
+        kept = self.add_activity(0)
+
+        self.assertEqual(drop_expired_partitions(12), [get_partition_name(month)])
+        self.assertEqual(delete_expired_default_rows(12, chunk_size=1), 1)
+        self.assertEqual(list(Activity.objects.all()), [kept])
@@ -0,0 +1,7 @@
+from django.urls import path
+
+from apps.activity.views import ActivityView
+
+urlpatterns = [
+    path("", ActivityView.as_view(), name="activity"),
+]
@@ -0,0 +1,91 @@
+from drf_yasg import openapi
+from drf_yasg.utils import swagger_auto_schema
+from rest_framework import status
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from apps.activity.models import Activity
+from apps.activity.paginations import ActivityPagination
+from apps.activity.serializers import (
+    ActivityFeedSerializer,
+    ActivityListSerializer,
+    ActivitySerializer,
+)
+from apps.teams.access import get_team_access
+from common.fast_serializers import get_compiled_serializer
+
+
+class ActivityView(APIView):
+    permission_classes = [IsAuthenticated]
+    serializer_class = ActivitySerializer
+    pagination_class = ActivityPagination
+
+    @swagger_auto_schema(
+        tags=["Activity"],
+        operation_description=(
+            "Get the activity feed of a team (or of one of its projects), "
+            "newest first, with keyset pagination"
+        ),
+        manual_parameters=[
+            openapi.Parameter(
+                "team",
+                openapi.IN_QUERY,
+                description="Team ID",
+                type=openapi.TYPE_STRING,
+                format=openapi.FORMAT_UUID,
+                required=True,
+            ),
+            openapi.Parameter(
+                "project",
+                openapi.IN_QUERY,
+                description="Project ID",
+                type=openapi.TYPE_STRING,
+                format=openapi.FORMAT_UUID,
+            ),
+            openapi.Parameter(
+                "cursor",
+                openapi.IN_QUERY,
+                description="Opaque pagination cursor",
+                type=openapi.TYPE_STRING,
+            ),
+            openapi.Parameter(
+                "page_size",
+                openapi.IN_QUERY,
+                description="Number of activities per page (max 200)",
+                type=openapi.TYPE_INTEGER,
+            ),
+        ],
+        responses={
+            200: ActivityListSerializer,
+            400: "Bad Request - Invalid query parameters",
+            401: "Unauthorized - Authentication credentials were not provided",
+            404: "Not Found - Team not found or you don't have permission to access it",
+        },
+    )
+    def get(self, request):
+        serializer = ActivityFeedSerializer(data=request.query_params)
+        if not serializer.is_valid():
+            return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+
+        team_id = serializer.validated_data["team"]
+        if not get_team_access(request).can_view(team_id):
+            return Response(
+                {"error": "Team not found or you don't have permission to access it"},
+                status=status.HTTP_404_NOT_FOUND,
+            )
+
+        # Served by the (team|project, created_at, id) indexes
+        activities = Activity.objects.filter(team_id=team_id)
+        if "project" in serializer.validated_data:
+            activities = activities.filter(
+                project_id=serializer.validated_data["project"]
+            )
+
+        field_params = self.serializer_class.get_field_params(request)
+        reader = get_compiled_serializer(self.serializer_class, **field_params)
+        activities = activities.values(*{*reader.value_names, "created_at", "id"})
+
+        paginator = self.pagination_class()
+        page = paginator.paginate_queryset(activities, request)
+        return paginator.get_paginated_response(reader.serialize(page))
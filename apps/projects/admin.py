@@ -1,11 +1,18 @@
 from django.contrib import admin
 
 from apps.projects.models.project import Project
+from apps.search.admin import FullTextSearchAdminMixin
+from common.admin import EstimatedCountAdminMixin
 
 
-class ProjectAdmin(admin.ModelAdmin):
-    list_display = ("id", "name", "description")
+class ProjectAdmin(
+    FullTextSearchAdminMixin, EstimatedCountAdminMixin, admin.ModelAdmin
+):
+    list_display = ("id", "name", "description", "team", "created_by")
+    list_select_related = ("team", "created_by")
     search_fields = ("name", "description")
+    search_title_field = "name"
+    raw_id_fields = ("team", "created_by")
     list_per_page = 10
 
 
@@ -0,0 +1,36 @@
+# Generated by Django 5.2 on 2026-10-18 00:20
+
+from django.db import migrations
+
+# Stored generated column, kept up to date by PostgreSQL on every write. It
+# is not a model field: it is only read through apps.search.query.
+ADD_SEARCH_VECTOR_SQL = """
+ALTER TABLE "projects_project" ADD COLUMN "search_vector" tsvector GENERATED ALWAYS AS (
+    setweight(to_tsvector('english'::regconfig, coalesce("name", '')), 'A')
+    || setweight(to_tsvector('english'::regconfig, coalesce("description", '')), 'B')
+) STORED
+"""
+
+
+def add_search_vector(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute(ADD_SEARCH_VECTOR_SQL)
+    schema_editor.execute('CREATE INDEX "project_search_idx" ON "projects_project" USING gin ("search_vector")')
+
+
+def remove_search_vector(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute('ALTER TABLE "projects_project" DROP COLUMN "search_vector"')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('projects', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.RunPython(add_search_vector, remove_search_vector),
+    ]
@@ -2,7 +2,6 @@ from uuid import uuid4
 
 from django.db import models
 
-from apps.tasks.models import Task
 from apps.teams.models import Team
 from apps.users.models import User
 
@@ -19,6 +18,3 @@ class Project(models.Model):
 
     def __str__(self):
         return self.name
-
-
-Task()
@@ -0,0 +1,112 @@
+from django.contrib.postgres.search import (
+    SearchHeadline,
+    SearchQuery,
+    SearchRank,
+    SearchVectorField,
+)
+from django.db import connections
+from django.db.models import Expression, Q
+
+# Text search configuration of the generated search_vector columns (see the
+# tasks and projects migrations); queries must use the same one to match
+SEARCH_CONFIG = "english"
+SEARCH_COLUMN = "search_vector"
+
+# Marks around the matched words in highlighted titles and snippets
+START_SEL, STOP_SEL = "<mark>", "</mark>"
+SNIPPET_LENGTH = 200
+
+
+class SearchDocument(Expression):
+    """
+    The stored ``search_vector`` column of a queryset's base table.
+
+    PostgreSQL generates the column from the weighted title (A) and
+    description (B), and a GIN index makes it searchable. It is not a model
+    field, so the vectors are never loaded or returned along with the rows.
+    """
+
+    output_field = SearchVectorField()
+
+    def as_sql(self, compiler, connection):
+        alias = compiler.quote_name_unless_alias(compiler.query.get_initial_alias())
+        return f"{alias}.{connection.ops.quote_name(SEARCH_COLUMN)}", []
+
+
+def is_full_text(using):
+    return connections[using].vendor == "postgresql"
+
+
+def get_search_query(text):
+    # Web search syntax: "quoted phrases", OR and -excluded words
+    return SearchQuery(text, config=SEARCH_CONFIG, search_type="websearch")
+
+
+def filter_search(queryset, text, title_field="title"):
+    """
+    Filter a queryset of tasks or projects down to the rows matching
+    ``text``. Uses the GIN index of the search vector on PostgreSQL, and
+    ``icontains`` on other databases.
+    """
+    if is_full_text(queryset.db):
+        return queryset.alias(document=SearchDocument()).filter(
+            document=get_search_query(text)
+        )
+    return queryset.filter(
+        Q(**{f"{title_field}__icontains": text}) | Q(description__icontains=text)
+    )
+
+
+def search(queryset, text, limit, title_field="title", values=()):
+    """
+    Return the ``limit`` best matches of ``text`` in a queryset of tasks or
+    projects, best first, as dicts with the ``id``, ``rank``, highlighted
+    ``title`` and ``snippet`` of the description, and the ``values`` fields.
+
+    Only the ids and ranks are computed for every match; the highlights,
+    which are much more expensive, are only computed for the returned rows.
+    """
+    matches = filter_search(queryset, text, title_field)
+    if not is_full_text(queryset.db):
+        rows = matches.order_by("-created_at", "-pk").values(
+            "id", title_field, "description", *values
+        )[:limit]
+        return [
+            {
+                **row,
+                "title": row.pop(title_field),
+                "snippet": row.pop("description")[:SNIPPET_LENGTH],
+                "rank": 0.0,
+            }
+            for row in rows
+        ]
+
+    query = get_search_query(text)
+    ranks = dict(
+        matches.annotate(rank=SearchRank(SearchDocument(), query))
+        .order_by("-rank", "pk")
+        .values_list("pk", "rank")[:limit]
+    )
+    headline_options = {
+        "config": SEARCH_CONFIG,
+        "start_sel": START_SEL,
+        "stop_sel": STOP_SEL,
+    }
+    rows = (
+        queryset.model._base_manager.using(queryset.db)
+        .filter(pk__in=ranks)
+        .annotate(
+            title_highlight=SearchHeadline(
+                title_field, query, highlight_all=True, **headline_options
+            ),
+            snippet=SearchHeadline(
+                "description", query, max_fragments=2, **headline_options
+            ),
+        )
+        .values("id", "title_highlight", "snippet", *values)
+    )
+    results = [
+        {**row, "title": row.pop("title_highlight"), "rank": ranks[row["id"]]}
+        for row in rows
+    ]
+    return sorted(results, key=lambda row: (-row["rank"], row["id"]))
@@ -0,0 +1,52 @@
+from rest_framework import serializers
+
+# Searchable types, in the order their results are merged on equal rank
+SEARCH_TYPES = ("task", "project")
+
+
+class SearchSerializer(serializers.Serializer):
+    """
+    Query parameters of the search endpoint.
+    """
+
+    q = serializers.CharField(max_length=200)
+    type = serializers.CharField(
+        required=False,
+        help_text=f"Comma-separated list of {', '.join(SEARCH_TYPES)}",
+    )
+    team = serializers.UUIDField(required=False)
+    project = serializers.UUIDField(required=False)
+    limit = serializers.IntegerField(min_value=1, max_value=50, default=20)
+
+    def validate_type(self, value):
+        types = {name.strip() for name in value.split(",") if name.strip()}
+        unknown = sorted(types - set(SEARCH_TYPES))
+        if unknown:
+            raise serializers.ValidationError(f"Unknown type(s): {', '.join(unknown)}.")
+        return [name for name in SEARCH_TYPES if name in types]
+
+    def validate(self, attrs):
+        attrs.setdefault("type", list(SEARCH_TYPES))
+        return attrs
+
+
+class SearchResultSerializer(serializers.Serializer):
+    type = serializers.ChoiceField(choices=SEARCH_TYPES)
+    id = serializers.UUIDField()
+    title = serializers.CharField(
+        help_text="Task title or project name, matches wrapped in <mark>"
+    )
+    snippet = serializers.CharField(
+        help_text="Best matching fragments of the description"
+    )
+    rank = serializers.FloatField()
+    project = serializers.UUIDField(allow_null=True)
+    team = serializers.UUIDField()
+
+
+class SearchResultListSerializer(serializers.Serializer):
+    """
+    Serializer for documenting search responses in Swagger.
+    """
+
+    results = SearchResultSerializer(many=True)
@@ -0,0 +1,112 @@
+from unittest import skipUnless
+from uuid import uuid4
+
+from django.db import connection
+from django.test import TestCase
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from apps.projects.models import Project
+from apps.search.query import is_full_text
+from apps.tasks.models import Task
+from apps.teams.models import Team
+from apps.users.models import User
+
+
+class SearchTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(
+            email="owner@example.com", username="owner", password="password"
+        )
+        stranger = User.objects.create_user(
+            email="stranger@example.com", username="stranger", password="password"
+        )
+        cls.team = Team.objects.create(name="Team", owner=cls.user)
+        cls.project = Project.objects.create(
+            name="Release", team=cls.team, description="Deploy the billing service"
+        )
+        cls.other_project = Project.objects.create(name="Docs", team=cls.team)
+        cls.deploy = Task.objects.create(
+            project=cls.project,
+            title="Deploy billing",
+            description="Roll out to production",
+        )
+        cls.review = Task.objects.create(
+            project=cls.other_project,
+            title="Review the guide",
+            description="Check the billing section before we deploy",
+        )
+        other_team = Team.objects.create(name="Other", owner=stranger)
+        Task.objects.create(
+            project=Project.objects.create(name="Other", team=other_team),
+            title="Deploy billing",
+        )
+
+    def setUp(self):
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+
+    def search(self, **params):
+        response = self.client.get(reverse("search"), params)
+        self.assertEqual(response.status_code, 200, response.content)
+        return [(row["type"], row["id"]) for row in response.json()["results"]]
+
+    def test_finds_tasks_and_projects_of_the_user_teams(self):
+        self.assertCountEqual(
+            self.search(q="billing"),
+            [
+                ("task", str(self.deploy.pk)),
+                ("task", str(self.review.pk)),
+                ("project", str(self.project.pk)),
+            ],
+        )
+
+    def test_filters(self):
+        self.assertEqual(
+            self.search(q="billing", type="project"),
+            [("project", str(self.project.pk))],
+        )
+        self.assertEqual(
+            self.search(q="billing", type="task", project=self.other_project.pk),
+            [("task", str(self.review.pk))],
+        )
+        self.assertEqual(len(self.search(q="billing", team=self.team.pk, limit=1)), 1)
+
+    def test_invalid_parameters(self):
+        for params, code in [
+            ({}, 400),
+            ({"q": "billing", "type": "user"}, 400),
+            ({"q": "billing", "limit": 0}, 400),
+            ({"q": "billing", "team": uuid4()}, 404),
+            ({"q": "billing", "project": uuid4()}, 404),
+        ]:
+            with self.subTest(params=params):
+                response = self.client.get(reverse("search"), params)
+                self.assertEqual(response.status_code, code)
+
+    @skipUnless(is_full_text(connection.alias), "full-text search needs PostgreSQL")
+    def test_full_text_ranking_and_highlights(self):
+        response = self.client.get(
+            reverse("search"), {"q": "deploying", "type": "task"}
+        )
+        results = response.json()["results"]
+
+        # Stemmed, and a match in the title ranks above one in the description
+        self.assertEqual(
+            [row["id"] for row in results], [str(self.deploy.pk), str(self.review.pk)]
+        )
+        self.assertEqual(results[0]["title"], "<mark>Deploy</mark> billing")
+        self.assertIn("<mark>deploy</mark>", results[1]["snippet"])
+        self.assertGreater(results[0]["rank"], results[1]["rank"])
+
+    @skipUnless(is_full_text(connection.alias), "full-text search needs PostgreSQL")
+    def test_web_search_syntax(self):
+        self.assertEqual(
+            self.search(q="billing -guide", type="task"),
+            [("task", str(self.deploy.pk))],
+        )
+        self.assertEqual(
+            self.search(q='"billing section"', type="task"),
+            [("task", str(self.review.pk))],
+        )
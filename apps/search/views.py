@@ -0,0 +1,112 @@
+from drf_yasg import openapi
+from drf_yasg.utils import swagger_auto_schema
+from rest_framework import status
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from apps.projects.models import Project
+from apps.search.query import search
+from apps.search.serializers import (
+    SEARCH_TYPES,
+    SearchResultListSerializer,
+    SearchSerializer,
+)
+from apps.tasks.models import Task
+from apps.teams.access import get_team_access
+
+
+def get_query_parameter(name, description, type=openapi.TYPE_STRING, **kwargs):
+    return openapi.Parameter(
+        name, openapi.IN_QUERY, description=description, type=type, **kwargs
+    )
+
+
+class SearchView(APIView):
+    permission_classes = [IsAuthenticated]
+
+    @swagger_auto_schema(
+        tags=["Search"],
+        operation_description=(
+            "Full-text search over the tasks and projects of your teams, best "
+            "match first, with the matched words highlighted. Supports "
+            '"quoted phrases", OR and -excluded words.'
+        ),
+        manual_parameters=[
+            get_query_parameter("q", "Search text", required=True),
+            get_query_parameter(
+                "type", f"Comma-separated list of {', '.join(SEARCH_TYPES)}"
+            ),
+            get_query_parameter("team", "Team ID", format=openapi.FORMAT_UUID),
+            get_query_parameter("project", "Project ID", format=openapi.FORMAT_UUID),
+            get_query_parameter(
+                "limit", "Number of results (default 20, max 50)", openapi.TYPE_INTEGER
+            ),
+        ],
+        responses={
+            200: SearchResultListSerializer,
+            400: "Bad Request - Invalid query parameters",
+            401: "Unauthorized - Authentication credentials were not provided",
+            404: "Not Found - Project or team not found or you don't have permission to access it",
+        },
+    )
+    def get(self, request):
+        serializer = SearchSerializer(data=request.query_params)
+        if not serializer.is_valid():
+            return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+        params = serializer.validated_data
+
+        access = get_team_access(request)
+        tasks = access.filter_by_team(Task.objects.all(), lookup="project__team")
+        projects = access.filter_by_team(Project.objects.all())
+        if "team" in params:
+            if not access.can_view(params["team"]):
+                return Response(
+                    {
+                        "error": "Team not found or you don't have permission to access it"
+                    },
+                    status=status.HTTP_404_NOT_FOUND,
+                )
+            tasks = tasks.filter(project__team_id=params["team"])
+            projects = projects.filter(team_id=params["team"])
+        if "project" in params:
+            if not projects.filter(pk=params["project"]).exists():
+                return Response(
+                    {
+                        "error": "Project not found or you don't have permission to access it"
+                    },
+                    status=status.HTTP_404_NOT_FOUND,
+                )
+            tasks = tasks.filter(project_id=params["project"])
+            projects = projects.filter(pk=params["project"])
+
+        text, limit, results = params["q"], params["limit"], []
+        if "task" in params["type"]:
+            rows = search(tasks, text, limit, values=("project_id", "project__team_id"))
+            results += (
+                get_result("task", row, row["project_id"], row["project__team_id"])
+                for row in rows
+            )
+        if "project" in params["type"]:
+            rows = search(
+                projects, text, limit, title_field="name", values=("team_id",)
+            )
+            results += (
+                get_result("project", row, row["id"], row["team_id"]) for row in rows
+            )
+
+        # Ranks of both types are computed the same way, so they compare
+        results.sort(key=lambda row: -row["rank"])
+        return Response({"results": results[:limit]}, status=status.HTTP_200_OK)
+
+
+def get_result(type, row, project_id, team_id):
+    return {
+        "type": type,
+        "id": row["id"],
+        "title": row["title"],
+        "snippet": row["snippet"],
+        "rank": row["rank"],
+        "project": project_id,
+        "team": team_id,
+    }
@@ -1,12 +1,16 @@
 from django.contrib import admin
 
+from apps.search.admin import FullTextSearchAdminMixin
 from apps.tasks.models.task import Task
+from common.admin import EstimatedCountAdminMixin
 
 
-class TaskAdmin(admin.ModelAdmin):
-    list_display = ("id", "title", "status", "priority", "due_date")
+class TaskAdmin(FullTextSearchAdminMixin, EstimatedCountAdminMixin, admin.ModelAdmin):
+    list_display = ("id", "title", "status", "priority", "due_date", "project")
     list_filter = ("status", "priority")
+    list_select_related = ("project",)
     search_fields = ("title", "description")
+    raw_id_fields = ("project", "parent", "assignee", "created_by")
     list_per_page = 10
 
 
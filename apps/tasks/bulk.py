@@ -0,0 +1,72 @@
+from django.db import connections, transaction
+from django.utils import timezone
+
+from apps.tasks.models import Task
+from apps.tasks.signals import tasks_updated
+
+# Fields that can be changed on many tasks at once
+BULK_UPDATE_FIELDS = ("status", "priority", "due_date", "assignee")
+
+
+def update_tasks(queryset, values):
+    """
+    Apply ``values`` (``{field_name: value}``) to the tasks of a queryset
+    and refresh their ``updated_at``. Tasks that already have these values
+    are left alone.
+
+    The ``(id, project_id, status)`` of every updated row, as they were
+    before the update, are sent once with the ``tasks_updated`` signal.
+    Returns the ids of the updated tasks.
+    """
+    using = queryset.db
+    # Rows are locked in primary key order, so that concurrent bulk updates
+    # cannot deadlock on each other
+    selected = queryset.exclude(**values)
+    rows = selected.order_by("pk").select_for_update(of=("self",))
+    values = {**values, "updated_at": timezone.now()}
+
+    with transaction.atomic(using=using):
+        if connections[using].vendor == "postgresql":
+            changes = update_returning(rows, values)
+        else:
+            # Writers are serialized, so the rows read are the rows updated
+            changes = list(rows.values_list("pk", "project_id", "status"))
+            Task._base_manager.using(using).filter(pk__in=selected.values("pk")).update(
+                **values
+            )
+
+        if changes:
+            values.pop("updated_at")
+            tasks_updated.send(sender=Task, changes=changes, values=values)
+    return [task_id for task_id, _, _ in changes]
+
+
+def update_returning(rows, values):
+    """
+    Update the rows with a single ``UPDATE ... FROM (SELECT ... FOR UPDATE)
+    ... RETURNING`` statement, which also returns the previous project and
+    status of each row.
+    """
+    connection = connections[rows.db]
+    quote = connection.ops.quote_name
+    table, pk = quote(Task._meta.db_table), quote(Task._meta.pk.column)
+    old_sql, old_params = rows.values(
+        "id", "project_id", "status"
+    ).query.sql_with_params()
+
+    assignments, params = [], []
+    for name, value in values.items():
+        field = Task._meta.get_field(name)
+        if field.is_relation and value is not None:
+            value = value.pk
+        assignments.append(f"{quote(field.column)} = %s")
+        params.append(field.get_db_prep_save(value, connection))
+
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f"UPDATE {table} SET {', '.join(assignments)} "
+            f"FROM ({old_sql}) AS old WHERE {table}.{pk} = old.id "
+            "RETURNING old.id, old.project_id, old.status",
+            [*params, *old_params],
+        )
+        return cursor.fetchall()
@@ -0,0 +1,18 @@
+from django.conf import settings
+
+from common.cache import VersionedCache
+
+# Dependency graphs, scoped by project id
+graph_cache = VersionedCache("task_graphs", timeout=settings.CACHE_TIMEOUT)
+
+
+def invalidate_task_graph(*project_ids):
+    graph_cache.bump(*project_ids)
+
+
+# Ranked scores of open tasks, scoped by project id
+score_cache = VersionedCache("task_scores", timeout=settings.CACHE_TIMEOUT)
+
+
+def invalidate_task_scores(*project_ids):
+    score_cache.bump(*project_ids)
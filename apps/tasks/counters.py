@@ -0,0 +1,143 @@
+from collections import Counter
+
+from django.db import connection, transaction
+from django.db.models import Count, F
+
+from apps.projects.models import Project
+from apps.tasks.models import ProjectTaskCounter, Task, TeamTaskCounter
+from common.models import TaskStatus
+
+
+def adjust_task_counters(deltas):
+    """
+    Apply ``{(project_id, status): delta}`` changes to the project counters
+    and to the counters of the projects' teams.
+    """
+    deltas = {
+        key: delta for key, delta in deltas.items() if delta and key[0] is not None
+    }
+    if not deltas:
+        return
+
+    team_ids = dict(
+        Project.objects.filter(
+            pk__in={project_id for project_id, _ in deltas}
+        ).values_list("id", "team_id")
+    )
+    team_deltas = Counter()
+    # Rows are always updated in key order so that concurrent writers cannot
+    # deadlock on each other's counters
+    for (project_id, status), delta in sorted(deltas.items()):
+        increment(ProjectTaskCounter, delta, project_id=project_id, status=status)
+        if project_id in team_ids:
+            team_deltas[team_ids[project_id], status] += delta
+    for (team_id, status), delta in sorted(team_deltas.items()):
+        increment(TeamTaskCounter, delta, team_id=team_id, status=status)
+
+
+def move_project_counters(project_id, old_team_id, new_team_id):
+    """
+    Move a project's task counts between team counters when it changes team.
+    """
+    counts = ProjectTaskCounter.objects.filter(project_id=project_id).values_list(
+        "status", "count"
+    )
+    for status, count in counts:
+        increment(TeamTaskCounter, -count, team_id=old_team_id, status=status)
+        increment(TeamTaskCounter, count, team_id=new_team_id, status=status)
+
+
+def increment(model, delta, **key):
+    counters = model.objects.filter(**key)
+    if not delta or counters.update(count=F("count") + delta) or delta < 0:
+        return
+    # Counters are created on first use. A decrement of a missing counter is
+    # dropped, as it can only happen while its project or team is deleted.
+    model.objects.get_or_create(**key)
+    counters.update(count=F("count") + delta)
+
+
+def get_task_counts(model, **key):
+    """
+    Return ``{status: count}`` for one project or team counter key.
+    """
+    counts = dict.fromkeys(TaskStatus.values, 0)
+    counts.update(model.objects.filter(**key).values_list("status", "count"))
+    return counts
+
+
+def count_tasks():
+    """
+    Count the tasks per (project, status) and (team, status) from the task
+    table, returning the two ``Counter`` objects.
+    """
+    rows = (
+        Task.objects.filter(project__isnull=False)
+        .values("project_id", "project__team_id", "status")
+        .annotate(count=Count("pk"))
+        .order_by()
+    )
+    projects, teams = Counter(), Counter()
+    for row in rows:
+        projects[row["project_id"], row["status"]] += row["count"]
+        teams[row["project__team_id"], row["status"]] += row["count"]
+    return projects, teams
+
+
+def get_stored_counts():
+    projects = Counter(
+        {
+            (project_id, status): count
+            for project_id, status, count in ProjectTaskCounter.objects.values_list(
+                "project_id", "status", "count"
+            )
+        }
+    )
+    teams = Counter(
+        {
+            (team_id, status): count
+            for team_id, status, count in TeamTaskCounter.objects.values_list(
+                "team_id", "status", "count"
+            )
+        }
+    )
+    return projects, teams
+
+
+def verify_task_counters():
+    """
+    Compare the stored counters with the task table. Returns a list of
+    ``(model_label, key, stored, actual)`` mismatches.
+    """
+    mismatches = []
+    for model, stored, actual in zip(
+        (ProjectTaskCounter, TeamTaskCounter), get_stored_counts(), count_tasks()
+    ):
+        for key in sorted(set(stored) | set(actual)):
+            if stored[key] != actual[key]:
+                mismatches.append((model.__name__, key, stored[key], actual[key]))
+    return mismatches
+
+
+@transaction.atomic
+def rebuild_task_counters():
+    """
+    Recompute every counter from the task table.
+    """
+    if connection.vendor == "postgresql":
+        # Block task writes (not reads) until the new counters are committed
+        with connection.cursor() as cursor:
+            cursor.execute(f"LOCK TABLE {Task._meta.db_table} IN SHARE MODE")
+
+    projects, teams = count_tasks()
+    ProjectTaskCounter.objects.all().delete()
+    TeamTaskCounter.objects.all().delete()
+    ProjectTaskCounter.objects.bulk_create(
+        ProjectTaskCounter(project_id=project_id, status=status, count=count)
+        for (project_id, status), count in projects.items()
+    )
+    TeamTaskCounter.objects.bulk_create(
+        TeamTaskCounter(team_id=team_id, status=status, count=count)
+        for (team_id, status), count in teams.items()
+    )
+    return len(projects) + len(teams)
@@ -0,0 +1,44 @@
+import django_filters
+
+from apps.tasks.models import Task
+from common.models import TaskPriority, TaskStatus
+
+
+class TaskFilter(django_filters.FilterSet):
+    project = django_filters.UUIDFilter(field_name="project")
+    status = django_filters.MultipleChoiceFilter(
+        choices=TaskStatus.choices, distinct=False
+    )
+    priority = django_filters.MultipleChoiceFilter(
+        choices=TaskPriority.choices, distinct=False
+    )
+    due_date = django_filters.DateFilter(field_name="due_date")
+    due_before = django_filters.DateFilter(field_name="due_date", lookup_expr="lte")
+    due_after = django_filters.DateFilter(field_name="due_date", lookup_expr="gte")
+    assignee = django_filters.UUIDFilter(field_name="assignee")
+    parent = django_filters.UUIDFilter(field_name="parent")
+    is_root = django_filters.BooleanFilter(field_name="parent", lookup_expr="isnull")
+    # Matches the condition of the partial "open task" indexes
+    is_open = django_filters.BooleanFilter(method="filter_is_open")
+    ordering = django_filters.ChoiceFilter(
+        method="filter_ordering",
+        choices=[
+            ("created_at", "created_at"),
+            ("-created_at", "-created_at"),
+            ("due_date", "due_date"),
+            ("-due_date", "-due_date"),
+        ],
+    )
+
+    class Meta:
+        model = Task
+        fields = []
+
+    def filter_is_open(self, queryset, name, value):
+        if value:
+            return queryset.exclude(status=TaskStatus.COMPLETED)
+        return queryset.filter(status=TaskStatus.COMPLETED)
+
+    def filter_ordering(self, queryset, name, value):
+        # The id keeps the order stable between pages
+        return queryset.order_by(value, "-id" if value.startswith("-") else "id")
@@ -0,0 +1,244 @@
+from collections import deque
+from uuid import UUID
+
+from django.db import connections, transaction
+
+from apps.projects.models import Project
+from apps.tasks.cache import graph_cache
+from apps.tasks.models import Task, TaskDependency
+from common.models import TaskStatus
+
+# Tasks that (transitively) depend on a task, walked in the database
+DEPENDENTS_SQL = """
+WITH RECURSIVE dependents(id) AS (
+    SELECT task_id FROM {table} WHERE depends_on_id = %s
+    UNION
+    SELECT edge.task_id FROM {table} edge
+    INNER JOIN dependents ON edge.depends_on_id = dependents.id
+)
+SELECT 1 FROM dependents WHERE id = %s LIMIT 1
+"""
+
+
+class CycleError(ValueError):
+    def __init__(self, cycle):
+        super().__init__("The task dependencies contain a cycle")
+        self.cycle = cycle
+
+
+class TaskGraph:
+    """
+    Dependency graph of a project's tasks as integer adjacency lists, with an
+    edge from every task to the tasks depending on it.
+
+    Only tasks with at least one dependency or dependent are nodes. Every
+    operation is a single O(V + E) pass.
+    """
+
+    def __init__(self, keys, successors, predecessors):
+        # Task ids as 16-byte keys, turned into UUIDs only on output
+        self.keys = keys
+        self.successors = successors
+        self.predecessors = predecessors
+
+    def __len__(self):
+        return len(self.keys)
+
+    @classmethod
+    def from_edges(cls, edges):
+        """
+        Build the graph from ``(depends_on_id, task_id)`` pairs.
+        """
+        index, successors, predecessors = {}, [], []
+        for depends_on_id, task_id in edges:
+            source = index.setdefault(depends_on_id, len(index))
+            target = index.setdefault(task_id, len(index))
+            while len(successors) < len(index):
+                successors.append([])
+                predecessors.append([])
+            successors[source].append(target)
+            predecessors[target].append(source)
+        return cls([task_id.bytes for task_id in index], successors, predecessors)
+
+    def to_cache(self):
+        # Lists of small ints unpickle at C speed, unlike UUID objects
+        return b"".join(self.keys), self.successors, self.predecessors
+
+    @classmethod
+    def from_cache(cls, value):
+        keys, successors, predecessors = value
+        return cls(
+            [keys[offset : offset + 16] for offset in range(0, len(keys), 16)],
+            successors,
+            predecessors,
+        )
+
+    def get_ids(self, nodes):
+        return [UUID(bytes=self.keys[node]) for node in nodes]
+
+    def get_nodes(self, task_ids):
+        """
+        Return a membership list (by node) for a set of task ids.
+        """
+        keys = {task_id.bytes for task_id in task_ids}
+        return [key in keys for key in self.keys]
+
+    def _kahn(self):
+        indegree = [len(predecessors) for predecessors in self.predecessors]
+        queue = deque(node for node, degree in enumerate(indegree) if not degree)
+        order = []
+        while queue:
+            node = queue.popleft()
+            order.append(node)
+            for successor in self.successors[node]:
+                indegree[successor] -= 1
+                if not indegree[successor]:
+                    queue.append(successor)
+        return order
+
+    def find_cycle(self, order=None):
+        """
+        Return the task ids of one dependency cycle, or None.
+        """
+        order = self._kahn() if order is None else order
+        if len(order) == len(self.keys):
+            return None
+
+        # Every node Kahn's algorithm could not reach has a predecessor that
+        # it could not reach either, so walking them back must loop.
+        remaining = set(range(len(self.keys))).difference(order)
+        node, path, seen = next(iter(remaining)), [], {}
+        while node not in seen:
+            seen[node] = len(path)
+            path.append(node)
+            node = next(
+                predecessor
+                for predecessor in self.predecessors[node]
+                if predecessor in remaining
+            )
+        cycle = path[seen[node] :]
+        cycle.reverse()
+        return self.get_ids(cycle)
+
+    def topological_order(self):
+        """
+        Return the task ids so that every task comes after its dependencies.
+        Raises CycleError when the dependencies contain a cycle.
+        """
+        order = self._kahn()
+        cycle = self.find_cycle(order)
+        if cycle is not None:
+            raise CycleError(cycle)
+        return self.get_ids(order)
+
+    def blocked(self, open_ids):
+        """
+        Return the open tasks that depend on at least one open task.
+        """
+        is_open = self.get_nodes(open_ids)
+        return self.get_ids(
+            node
+            for node, predecessors in enumerate(self.predecessors)
+            if is_open[node]
+            and any(is_open[predecessor] for predecessor in predecessors)
+        )
+
+    def critical_path(self, open_ids):
+        """
+        Return the longest chain of open tasks that have to be done one after
+        the other. Raises CycleError when the dependencies contain a cycle.
+        """
+        order = self._kahn()
+        cycle = self.find_cycle(order)
+        if cycle is not None:
+            raise CycleError(cycle)
+
+        is_open = self.get_nodes(open_ids)
+        length = [0] * len(self.keys)
+        previous = [-1] * len(self.keys)
+        for node in order:
+            best = -1
+            for predecessor in self.predecessors[node]:
+                if best == -1 or length[predecessor] > length[best]:
+                    best = predecessor
+            previous[node] = best
+            length[node] = (length[best] if best != -1 else 0) + is_open[node]
+
+        if not order:
+            return []
+        node = max(order, key=length.__getitem__)
+        path = []
+        while node != -1:
+            if is_open[node]:
+                path.append(node)
+            node = previous[node]
+        path.reverse()
+        return self.get_ids(path)
+
+
+def load_task_graph(project_id):
+    """
+    Load a project's dependency graph with a single query.
+    """
+    edges = TaskDependency.objects.filter(project_id=project_id).values_list(
+        "depends_on_id", "task_id"
+    )
+    return TaskGraph.from_edges(edges.iterator(chunk_size=10_000))
+
+
+def get_task_graph(project_id):
+    """
+    Return a project's dependency graph from the cache, loading it on a miss.
+    The cache is invalidated whenever one of the project's edges changes.
+    """
+    return TaskGraph.from_cache(
+        graph_cache.get_or_set(
+            project_id, "graph", lambda: load_task_graph(project_id).to_cache()
+        )
+    )
+
+
+def get_open_task_ids(project_id):
+    return set(
+        Task.objects.filter(project_id=project_id)
+        .exclude(status=TaskStatus.COMPLETED)
+        .values_list("id", flat=True)
+    )
+
+
+def creates_cycle(task_id, depends_on_id):
+    """
+    Whether making ``task_id`` depend on ``depends_on_id`` would close a
+    cycle, i.e. whether ``depends_on_id`` already depends on ``task_id``.
+    """
+    if task_id == depends_on_id:
+        return True
+
+    connection = connections[TaskDependency.objects.db]
+    field = TaskDependency._meta.get_field("task")
+    sql = DEPENDENTS_SQL.format(
+        table=connection.ops.quote_name(TaskDependency._meta.db_table)
+    )
+    params = [
+        field.get_db_prep_value(value, connection) for value in (task_id, depends_on_id)
+    ]
+    with connection.cursor() as cursor:
+        cursor.execute(sql, params)
+        return cursor.fetchone() is not None
+
+
+def add_task_dependency(task, depends_on):
+    """
+    Make ``task`` depend on ``depends_on`` (both in the same project).
+    Returns ``(dependency, created)``; raises CycleError if the new edge would
+    close a cycle.
+    """
+    with transaction.atomic():
+        # Edge inserts are serialized per project, so that two concurrent
+        # inserts cannot close a cycle between them
+        Project.objects.select_for_update().only("pk").get(pk=task.project_id)
+        if creates_cycle(task.pk, depends_on.pk):
+            raise CycleError([task.pk, depends_on.pk])
+        return TaskDependency.objects.get_or_create(
+            task=task, depends_on=depends_on, defaults={"project_id": task.project_id}
+        )
@@ -0,0 +1,303 @@
+import csv
+import io
+import json
+from collections import Counter
+from datetime import date
+from itertools import batched
+from uuid import uuid4
+
+import orjson
+from django.db import connection, transaction
+from django.utils import timezone
+
+from apps.tasks.counters import adjust_task_counters
+from apps.tasks.models import Task
+from apps.tasks.signals import tasks_imported
+from apps.teams.models import TeamMember
+from common.models import TaskPriority, TaskStatus
+
+IMPORT_FORMATS = ("csv", "ndjson", "json")
+# Columns read from every row; only title is required
+IMPORT_COLUMNS = ("title", "description", "status", "priority", "due_date", "assignee")
+# Columns written for every imported task, in COPY order
+TASK_COLUMNS = (
+    "id",
+    "title",
+    "description",
+    "status",
+    "priority",
+    "due_date",
+    "assignee_id",
+)
+BATCH_SIZE = 2000
+# Per-row errors kept for the report, the rest are only counted
+MAX_REPORTED_ERRORS = 1000
+
+TITLE_MAX_LENGTH = Task._meta.get_field("title").max_length
+STATUSES = set(TaskStatus.values)
+PRIORITIES = set(TaskPriority.values)
+
+
+class ImportFormatError(ValueError):
+    """
+    Raised when the input as a whole cannot be read (unknown format, missing
+    title column, undecodable or malformed CSV, malformed JSON document).
+    """
+
+
+def get_import_format(name, format=None):
+    """
+    Return the import format, given explicitly or taken from a file name.
+    """
+    format = (format or name.rpartition(".")[2]).lower()
+    if format not in IMPORT_FORMATS:
+        raise ImportFormatError(
+            f"Unsupported format '{format}', expected one of: "
+            f"{', '.join(IMPORT_FORMATS)}."
+        )
+    return format
+
+
+def read_rows(stream, format):
+    """
+    Yield ``(line, row)`` pairs from a binary stream, where ``row`` is a dict
+    of column values, or an error message for a line that cannot be parsed.
+
+    CSV and NDJSON input is read incrementally; a JSON document (an array of
+    objects) has to be parsed as a whole.
+    """
+    if format == "csv":
+        reader = csv.DictReader(io.TextIOWrapper(stream, "utf-8-sig", newline=""))
+        # The file is decoded and parsed as it is read, so errors can come up
+        # on any line
+        try:
+            if "title" not in (reader.fieldnames or ()):
+                raise ImportFormatError("The CSV header must include a 'title' column.")
+            # Data starts on the second line
+            for line, row in enumerate(reader, start=2):
+                yield line, row
+        except UnicodeDecodeError:
+            raise ImportFormatError("The CSV file must be UTF-8 encoded.")
+        except csv.Error as exc:
+            raise ImportFormatError(f"CSV parse error - {exc}")
+        return
+
+    if format == "json":
+        try:
+            rows = json.load(stream)
+        except ValueError as exc:
+            raise ImportFormatError(f"JSON parse error - {exc}")
+        if not isinstance(rows, list):
+            raise ImportFormatError("The JSON document must be an array of tasks.")
+        yield from enumerate(rows, start=1)
+        return
+
+    for line, raw in enumerate(stream, start=1):
+        if not raw.strip():
+            continue
+        try:
+            yield line, orjson.loads(raw)
+        except ValueError as exc:
+            yield line, f"JSON parse error - {exc}"
+
+
+class TaskImporter:
+    """
+    Bulk import of tasks into one project.
+
+    Rows are validated a batch at a time against lookups loaded once per
+    import (choices, the team's members by email) and loaded into the task
+    table without instantiating a serializer per row: on PostgreSQL through
+    ``COPY`` into a temporary staging table merged with a single
+    ``INSERT ... SELECT``, elsewhere with ``bulk_create()``. Valid rows are
+    imported in one transaction; invalid rows are reported by line.
+
+    Bulk inserts send no post_save, so the task counters are adjusted here
+    and ``tasks_imported`` is sent once.
+    Imported tasks are top-level tasks.
+    """
+
+    def __init__(self, project, created_by=None, batch_size=BATCH_SIZE):
+        self.project = project
+        self.created_by = created_by
+        self.batch_size = batch_size
+        self.assignees = self.load_assignees()
+
+    def load_assignees(self):
+        """
+        Return ``{email: user_id}`` for the users tasks can be assigned to,
+        the members and the owner of the project's team.
+        """
+        team = self.project.team
+        members = TeamMember.objects.filter(team=team).values_list(
+            "user__email", "user_id"
+        )
+        assignees = {email.lower(): user_id for email, user_id in members}
+        assignees[team.owner.email.lower()] = team.owner_id
+        return assignees
+
+    def run(self, rows):
+        """
+        Import ``(line, row)`` pairs as returned by ``read_rows()``. Returns
+        a report with the number of imported and failed rows and the errors.
+        """
+        imported, failed, errors = 0, 0, []
+        counts = Counter()
+        with transaction.atomic():
+            staging = self.create_staging_table() if self.use_copy else None
+            for batch in batched(rows, self.batch_size):
+                tasks, batch_errors = self.validate_batch(batch)
+                failed += len(batch_errors)
+                errors.extend(batch_errors[: MAX_REPORTED_ERRORS - len(errors)])
+                if not tasks:
+                    continue
+                if staging:
+                    self.copy_batch(staging, tasks)
+                else:
+                    self.create_batch(tasks)
+                imported += len(tasks)
+                counts.update(task[TASK_COLUMNS.index("status")] for task in tasks)
+            if staging:
+                self.merge_staging_table(staging)
+            adjust_task_counters(
+                {(self.project.pk, status): count for status, count in counts.items()}
+            )
+            if imported:
+                tasks_imported.send(
+                    sender=Task,
+                    project=self.project,
+                    created_by=self.created_by,
+                    count=imported,
+                )
+        return {"imported": imported, "failed": failed, "errors": errors}
+
+    @property
+    def use_copy(self):
+        return connection.vendor == "postgresql"
+
+    def validate_batch(self, batch):
+        """
+        Return the task tuples (in ``TASK_COLUMNS`` order) of the valid rows
+        of a batch and the errors of the others.
+        """
+        tasks, errors = [], []
+        for line, row in batch:
+            if not isinstance(row, dict):
+                message = row if isinstance(row, str) else "Expected an object."
+                errors.append({"line": line, "errors": {"non_field_errors": [message]}})
+                continue
+            task, row_errors = self.validate_row(row)
+            if row_errors:
+                errors.append({"line": line, "errors": row_errors})
+            else:
+                tasks.append(task)
+        return tasks, errors
+
+    def validate_row(self, row):
+        values = {}
+        for column in IMPORT_COLUMNS:
+            value = row.get(column)
+            values[column] = value.strip() if isinstance(value, str) else value
+        errors = {}
+
+        title = values["title"]
+        if not title:
+            errors["title"] = ["This field is required."]
+        elif not isinstance(title, str):
+            errors["title"] = ["Not a valid string."]
+        elif len(title) > TITLE_MAX_LENGTH:
+            errors["title"] = [
+                f"Ensure this field has no more than {TITLE_MAX_LENGTH} characters."
+            ]
+
+        status = values["status"] or TaskStatus.PENDING
+        if not isinstance(status, str) or status not in STATUSES:
+            errors["status"] = [f'"{status}" is not a valid choice.']
+        priority = values["priority"] or TaskPriority.HIGH
+        if not isinstance(priority, str) or priority not in PRIORITIES:
+            errors["priority"] = [f'"{priority}" is not a valid choice.']
+
+        due_date = values["due_date"] or None
+        if due_date is not None:
+            try:
+                due_date = date.fromisoformat(due_date)
+            except (TypeError, ValueError):
+                errors["due_date"] = [
+                    "Date has wrong format. Use one of these formats instead: "
+                    "YYYY-MM-DD."
+                ]
+
+        assignee_id = None
+        if values["assignee"]:
+            assignee_id = self.assignees.get(str(values["assignee"]).lower())
+            if assignee_id is None:
+                errors["assignee"] = [
+                    "The assignee must be a member of the project's team"
+                ]
+
+        description = values["description"] or ""
+        if not isinstance(description, str):
+            errors["description"] = ["Not a valid string."]
+
+        if errors:
+            return None, errors
+        return (
+            uuid4(),
+            title,
+            description,
+            status,
+            priority,
+            due_date,
+            assignee_id,
+        ), {}
+
+    def create_batch(self, tasks):
+        now = timezone.now()
+        return Task.objects.bulk_create(
+            [
+                Task(
+                    **dict(zip(TASK_COLUMNS, task)),
+                    project=self.project,
+                    path=task[0].hex,
+                    created_by=self.created_by,
+                    created_at=now,
+                    updated_at=now,
+                )
+                for task in tasks
+            ]
+        )
+
+    def create_staging_table(self):
+        table = "task_import_staging"
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"CREATE TEMPORARY TABLE {table} ("
+                "id uuid NOT NULL, title varchar(200) NOT NULL, "
+                "description text NOT NULL, status varchar(20) NOT NULL, "
+                "priority varchar(20) NOT NULL, due_date date, assignee_id uuid"
+                ") ON COMMIT DROP"
+            )
+        return table
+
+    def copy_batch(self, table, tasks):
+        buffer = io.StringIO()
+        # Only NULLs are written unquoted, so that empty strings stay empty
+        writer = csv.writer(buffer, quoting=csv.QUOTE_NOTNULL)
+        writer.writerows(tasks)
+        buffer.seek(0)
+        with connection.cursor() as cursor:
+            cursor.copy_expert(
+                f"COPY {table} ({', '.join(TASK_COLUMNS)}) FROM STDIN WITH (FORMAT csv)",
+                buffer,
+            )
+
+    def merge_staging_table(self, table):
+        columns = ", ".join(TASK_COLUMNS)
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"INSERT INTO {Task._meta.db_table} ({columns}, project_id, "
+                "parent_id, path, created_by_id, created_at, updated_at) "
+                f"SELECT {columns}, %s, NULL, replace(id::text, '-', ''), %s, "
+                f"now(), now() FROM {table}",
+                [self.project.pk, getattr(self.created_by, "pk", None)],
+            )
@@ -0,0 +1,110 @@
+import pickle
+import random
+from uuid import uuid4
+
+from django.core.management.base import BaseCommand
+
+from apps.projects.models import Project
+from apps.tasks.cache import invalidate_task_graph
+from apps.tasks.graph import TaskGraph, get_task_graph, load_task_graph
+from apps.tasks.models import Task, TaskDependency
+from apps.teams.deletion import purge_teams
+from apps.teams.models import Team
+from apps.users.models import User
+from common.benchmarks import format_stats, measure
+
+
+def build_edges(nodes, edges_per_node, seed=0):
+    """
+    Return ``(ids, edges)`` of a random DAG where every task depends on up to
+    ``edges_per_node`` earlier tasks.
+    """
+    rng = random.Random(seed)
+    ids = [uuid4() for _ in range(nodes)]
+    edges = {
+        (ids[rng.randrange(index)], ids[index])
+        for index in range(1, nodes)
+        for _ in range(edges_per_node)
+    }
+    return ids, sorted(edges)
+
+
+class Command(BaseCommand):
+    help = (
+        "Benchmark building, caching and analysing a large task dependency "
+        "graph, optionally loading it from the database"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--nodes", type=int, default=50_000)
+        parser.add_argument("--edges-per-node", type=int, default=2)
+        parser.add_argument("--repeat", type=int, default=5)
+        parser.add_argument(
+            "--database",
+            action="store_true",
+            help="Also store the graph and measure loading it with one query",
+        )
+
+    def handle(self, *args, **options):
+        ids, edges = build_edges(options["nodes"], options["edges_per_node"])
+        open_ids = set(ids[len(ids) // 4 :])
+        repeat = options["repeat"]
+        self.stdout.write(f"Nodes: {len(ids):,}, edges: {len(edges):,}")
+
+        graph = TaskGraph.from_edges(edges)
+        cached = graph.to_cache()
+        size = len(pickle.dumps(cached, pickle.HIGHEST_PROTOCOL))
+        self.stdout.write(f"Cached graph: {size / 1024:,.0f} KiB pickled")
+
+        for label, func in [
+            ("build from edges", lambda: TaskGraph.from_edges(edges)),
+            ("restore from cache", lambda: TaskGraph.from_cache(cached)),
+            ("find cycle", graph.find_cycle),
+            ("topological order", graph.topological_order),
+            ("blocked tasks", lambda: graph.blocked(open_ids)),
+            ("critical path", lambda: graph.critical_path(open_ids)),
+        ]:
+            self.stdout.write(format_stats(label, measure(func, repeat)))
+
+        if options["database"]:
+            self.benchmark_database(ids, edges, repeat)
+
+    def benchmark_database(self, ids, edges, repeat):
+        owner, _ = User.objects.get_or_create(
+            email="benchmark-graph@taskforce.local",
+            defaults={"username": "benchmark-graph"},
+        )
+        team = Team.objects.create(name="Benchmark graph", owner=owner)
+        try:
+            project = Project.objects.create(name="Benchmark graph", team=team)
+            Task.objects.bulk_create(
+                (Task(id=task_id, project=project, title="Task") for task_id in ids),
+                batch_size=5_000,
+            )
+            TaskDependency.objects.bulk_create(
+                (
+                    TaskDependency(
+                        project=project, task_id=task_id, depends_on_id=depends_on_id
+                    )
+                    for depends_on_id, task_id in edges
+                ),
+                batch_size=5_000,
+            )
+
+            self.stdout.write(
+                format_stats(
+                    "load from database",
+                    measure(lambda: load_task_graph(project.pk), repeat),
+                )
+            )
+            invalidate_task_graph(project.pk)
+            get_task_graph(project.pk)
+            self.stdout.write(
+                format_stats(
+                    "get cached graph",
+                    measure(lambda: get_task_graph(project.pk), repeat),
+                )
+            )
+        finally:
+            purge_teams([team.pk])
+            owner.delete()
@@ -0,0 +1,148 @@
+import random
+from uuid import uuid4
+
+from django.core.management.base import BaseCommand
+
+from apps.activity.log import buffer_activity
+from apps.projects.models import Project
+from apps.tasks.models import Task
+from apps.tasks.scheduling import assign_tasks, schedule
+from apps.teams.deletion import purge_teams
+from apps.teams.models import Team, TeamMember
+from apps.users.models import User
+from common.benchmarks import format_stats, measure
+from common.models import TaskPriority, TeamRole
+
+
+def build_members(members, seed=0):
+    """
+    Return ``(user_id, capacity, load)`` of members with random capacities,
+    a quarter of them already at half their capacity.
+    """
+    rng = random.Random(seed)
+    result = []
+    for index in range(members):
+        capacity = rng.randint(20, 80)
+        result.append((uuid4(), capacity, capacity // 2 if index % 4 == 0 else 0))
+    return result
+
+
+def scan(tasks, members):
+    """
+    Baseline: pick the least loaded member with a linear scan for every
+    task, as re-querying every member's load per assignment would.
+    """
+    loads = {user_id: load for user_id, _, load in members}
+    capacities = {user_id: capacity for user_id, capacity, _ in members}
+    assignments = []
+    for task in tasks:
+        available = [
+            user_id for user_id in loads if loads[user_id] < capacities[user_id]
+        ]
+        if not available:
+            break
+        user_id = min(
+            available, key=lambda user_id: loads[user_id] / capacities[user_id]
+        )
+        loads[user_id] += 1
+        assignments.append((task, user_id))
+    return assignments
+
+
+class Command(BaseCommand):
+    help = (
+        "Benchmark assigning a batch of tasks to a team's members by load, "
+        "optionally loading them from and writing them to the database"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--tasks", type=int, default=10_000)
+        parser.add_argument("--members", type=int, default=200)
+        parser.add_argument("--repeat", type=int, default=5)
+        parser.add_argument(
+            "--database",
+            action="store_true",
+            help="Also store the team and measure a dry run and a saved run",
+        )
+
+    def handle(self, *args, **options):
+        members = build_members(options["members"])
+        tasks = list(range(options["tasks"]))
+        repeat = options["repeat"]
+        capacity = sum(capacity - load for _, capacity, load in members)
+        self.stdout.write(
+            f"Tasks: {len(tasks):,}, members: {len(members):,}, "
+            f"free capacity: {capacity:,}"
+        )
+
+        for label, func in [
+            ("heap", lambda: schedule(tasks, members)),
+            ("linear scan per task", lambda: scan(tasks, members)),
+        ]:
+            self.stdout.write(format_stats(label, measure(func, repeat)))
+
+        if options["database"]:
+            self.benchmark_database(len(tasks), members, repeat)
+
+    def benchmark_database(self, task_count, members, repeat):
+        owner, _ = User.objects.get_or_create(
+            email="benchmark-scheduling@taskforce.local",
+            defaults={"username": "benchmark-scheduling"},
+        )
+        team = Team.objects.create(name="Benchmark scheduling", owner=owner)
+        users = User.objects.bulk_create(
+            User(
+                id=user_id,
+                email=f"benchmark-scheduling-{user_id.hex}@taskforce.local",
+                username=f"benchmark-scheduling-{user_id.hex}",
+            )
+            for user_id, _, _ in members
+        )
+        try:
+            TeamMember.objects.bulk_create(
+                TeamMember(
+                    team=team, user_id=user_id, role=TeamRole.MEMBER, capacity=capacity
+                )
+                for user_id, capacity, _ in members
+            )
+            project = Project.objects.create(name="Benchmark scheduling", team=team)
+            rng = random.Random(0)
+            Task.objects.bulk_create(
+                (
+                    Task(
+                        id=task_id,
+                        project=project,
+                        path=task_id.hex,
+                        title="Task",
+                        priority=rng.choice(TaskPriority.values),
+                    )
+                    for task_id in (uuid4() for _ in range(task_count))
+                ),
+                batch_size=5_000,
+            )
+            tasks = Task.objects.filter(project=project)
+
+            self.stdout.write(
+                format_stats(
+                    "dry run from database",
+                    measure(
+                        lambda: assign_tasks(team.pk, tasks, task_count, True), repeat
+                    ),
+                )
+            )
+            # Activities are written once at the end, as in a request
+            with buffer_activity():
+                self.stdout.write(
+                    format_stats(
+                        "assign and save",
+                        measure(
+                            lambda: assign_tasks(team.pk, tasks, task_count),
+                            1,
+                            warmup=0,
+                        ),
+                    )
+                )
+        finally:
+            purge_teams([team.pk])
+            User.objects.filter(pk__in=[user.pk for user in users]).delete()
+            owner.delete()
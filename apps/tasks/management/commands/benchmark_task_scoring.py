@@ -0,0 +1,170 @@
+import math
+import pickle
+import random
+from datetime import timedelta
+from uuid import uuid4
+
+import numpy as np
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from apps.projects.models import Project
+from apps.tasks import scoring
+from apps.tasks.cache import invalidate_task_scores
+from apps.tasks.models import Task, TaskDependency
+from apps.tasks.scoring import get_task_scores, load_task_columns, score_tasks
+from apps.teams.deletion import purge_teams
+from apps.teams.models import Team
+from apps.users.models import User
+from common.benchmarks import format_stats, measure
+from common.models import TaskPriority, TaskStatus
+
+
+def build_columns(tasks, today, seed=0):
+    """
+    Return random ``scoring.COLUMNS`` of open tasks, due from a month ago to
+    two months ahead (a third without due date) and created in the last year.
+    """
+    rng = random.Random(seed)
+    return (
+        tuple(uuid4() for _ in range(tasks)),
+        tuple(rng.choice(TaskPriority.values) for _ in range(tasks)),
+        tuple(
+            rng.choice([TaskStatus.PENDING, TaskStatus.IN_PROGRESS])
+            for _ in range(tasks)
+        ),
+        tuple(
+            (
+                today + timedelta(days=rng.randint(-30, 60))
+                if rng.random() > 1 / 3
+                else None
+            )
+            for _ in range(tasks)
+        ),
+        tuple(today - timedelta(days=rng.randint(0, 365)) for _ in range(tasks)),
+        tuple(min(int(rng.expovariate(1)), 20) for _ in range(tasks)),
+    )
+
+
+def score_rows(columns, today):
+    """
+    Baseline: the same scores computed row by row in Python.
+    """
+    scored = []
+    for task_id, priority, status, due_date, created_on, fan_out in zip(*columns):
+        days_left = (
+            scoring.DUE_HORIZON_DAYS if due_date is None else (due_date - today).days
+        )
+        age = (today - created_on).days
+        score = (
+            scoring.PRIORITY_POINTS.get(priority, 0.0)
+            + scoring.DUE_POINTS
+            * min(max(1 - days_left / scoring.DUE_HORIZON_DAYS, 0), 2)
+            + scoring.IN_PROGRESS_POINTS * (status == TaskStatus.IN_PROGRESS)
+            + scoring.AGE_POINTS * min(max(age / scoring.AGE_HORIZON_DAYS, 0), 1)
+            + scoring.FAN_OUT_POINTS * math.log1p(fan_out)
+        )
+        scored.append((task_id, score))
+    scored.sort(key=lambda item: -item[1])
+    return [task_id for task_id, _ in scored], [round(s, 2) for _, s in scored]
+
+
+class Command(BaseCommand):
+    help = (
+        "Benchmark scoring and ranking a large project's open tasks, "
+        "optionally loading them from the database"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--tasks", type=int, default=100_000)
+        parser.add_argument("--repeat", type=int, default=5)
+        parser.add_argument(
+            "--database",
+            action="store_true",
+            help="Also store the tasks and measure loading them with one query",
+        )
+
+    def handle(self, *args, **options):
+        today = timezone.localdate()
+        columns = build_columns(options["tasks"], today)
+        repeat = options["repeat"]
+        self.stdout.write(f"Tasks: {len(columns[0]):,}, NumPy: {np.__version__}")
+
+        ids, scores = score_tasks(columns, today)
+        cached = (b"".join(task_id.bytes for task_id in ids), scores)
+        size = len(pickle.dumps(cached, pickle.HIGHEST_PROTOCOL))
+        self.stdout.write(f"Cached scores: {size / 1024:,.0f} KiB pickled")
+
+        self.stdout.write(
+            format_stats(
+                "score and rank", measure(lambda: score_tasks(columns, today), repeat)
+            )
+        )
+        self.stdout.write(
+            format_stats(
+                "score and rank row by row",
+                measure(lambda: score_rows(columns, today), repeat),
+            )
+        )
+
+        if options["database"]:
+            self.benchmark_database(columns, repeat)
+
+    def benchmark_database(self, columns, repeat):
+        owner, _ = User.objects.get_or_create(
+            email="benchmark-scoring@taskforce.local",
+            defaults={"username": "benchmark-scoring"},
+        )
+        team = Team.objects.create(name="Benchmark scoring", owner=owner)
+        try:
+            project = Project.objects.create(name="Benchmark scoring", team=team)
+            ids, priorities, statuses, due_dates, _, fan_outs = columns
+            Task.objects.bulk_create(
+                (
+                    Task(
+                        id=task_id,
+                        project=project,
+                        path=task_id.hex,
+                        title="Task",
+                        priority=priority,
+                        status=task_status,
+                        due_date=due_date,
+                    )
+                    for task_id, priority, task_status, due_date in zip(
+                        ids, priorities, statuses, due_dates
+                    )
+                ),
+                batch_size=5_000,
+            )
+            # Every task depends on up to as many of the tasks just before it
+            TaskDependency.objects.bulk_create(
+                (
+                    TaskDependency(
+                        project=project, task_id=task_id, depends_on_id=depends_on_id
+                    )
+                    for index, task_id in enumerate(ids[1:], 1)
+                    for depends_on_id in {
+                        ids[index - offset - 1]
+                        for offset in range(min(fan_outs[index], index))
+                    }
+                ),
+                batch_size=5_000,
+            )
+
+            self.stdout.write(
+                format_stats(
+                    "load from database",
+                    measure(lambda: load_task_columns(project.pk), repeat),
+                )
+            )
+            invalidate_task_scores(project.pk)
+            get_task_scores(project.pk)
+            self.stdout.write(
+                format_stats(
+                    "get cached top 50",
+                    measure(lambda: get_task_scores(project.pk, 50), repeat),
+                )
+            )
+        finally:
+            purge_teams([team.pk])
+            owner.delete()
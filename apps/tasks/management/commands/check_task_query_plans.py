@@ -0,0 +1,88 @@
+import re
+from datetime import date
+from uuid import uuid4
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+
+from apps.tasks.filters import TaskFilter
+from apps.tasks.models import Task
+
+TABLE = Task._meta.db_table
+
+# The common task list filters, as sent to GET /api/tasks/
+FILTERS = {
+    "project": {"project": "{project}"},
+    "project, status": {"project": "{project}", "status": ["pending"]},
+    "project, statuses": {
+        "project": "{project}",
+        "status": ["pending", "in_progress"],
+        "ordering": "due_date",
+    },
+    "project, priority": {"project": "{project}", "priority": ["high"]},
+    "project, open, due before": {
+        "project": "{project}",
+        "is_open": "true",
+        "due_before": "{today}",
+    },
+    "assignee, open": {"assignee": "{user}", "is_open": "true"},
+    "assignee, status": {"assignee": "{user}", "status": ["in_progress"]},
+}
+
+
+class Command(BaseCommand):
+    help = (
+        "Check that the common task list filters are served by index scans, "
+        "failing when the planner falls back to a full scan of the task table"
+    )
+
+    def handle(self, *args, **options):
+        failures = []
+        for label, plan in self.get_plans():
+            full_scan = self.is_full_scan(plan)
+            if full_scan:
+                failures.append(label)
+            self.stdout.write(f"{'FULL SCAN' if full_scan else 'ok':>9}  {label}")
+            self.stdout.write("\n".join(f"           {line}" for line in plan))
+
+        if failures:
+            raise CommandError(f"Full scans of {TABLE}: {', '.join(failures)}")
+
+    def get_plans(self):
+        """
+        Yield the label and the plan (as lines) of every filter of FILTERS.
+        """
+        values = {"project": uuid4(), "user": uuid4(), "today": date.today()}
+        for label, params in FILTERS.items():
+            data = {
+                name: (
+                    [value.format(**values) for value in param]
+                    if isinstance(param, list)
+                    else param.format(**values)
+                )
+                for name, param in params.items()
+            }
+            queryset = Task.objects.filter(project__team__in=[uuid4()]).order_by(
+                "-created_at", "-id"
+            )
+            filter_set = TaskFilter(data, queryset=queryset)
+            if not filter_set.is_valid():
+                raise CommandError(f"{label}: {filter_set.errors}")
+
+            yield label, self.explain(filter_set.qs[:20])
+
+    def explain(self, queryset):
+        with transaction.atomic():
+            if connection.vendor == "postgresql":
+                # An empty or tiny table is cheaper to scan sequentially, so
+                # make the planner show whether an index can be used at all
+                with connection.cursor() as cursor:
+                    cursor.execute("SET LOCAL enable_seqscan = off")
+            return queryset.explain().splitlines()
+
+    def is_full_scan(self, plan):
+        if connection.vendor == "postgresql":
+            pattern = rf"Seq Scan on {TABLE}\b"
+        else:
+            pattern = rf"\bSCAN {TABLE}\b"
+        return any(re.search(pattern, line) for line in plan)
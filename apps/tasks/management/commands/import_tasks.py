@@ -0,0 +1,59 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.projects.models import Project
+from apps.tasks.imports import (
+    BATCH_SIZE,
+    IMPORT_FORMATS,
+    ImportFormatError,
+    TaskImporter,
+    get_import_format,
+    read_rows,
+)
+from apps.users.models import User
+
+
+class Command(BaseCommand):
+    help = (
+        "Import tasks into a project from a CSV, NDJSON or JSON file, "
+        "reporting the rows that could not be imported"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("path", help="File to import")
+        parser.add_argument("--project", required=True, help="Project ID")
+        parser.add_argument(
+            "--format",
+            choices=IMPORT_FORMATS,
+            help="Input format, by default the file's extension",
+        )
+        parser.add_argument("--created-by", help="Email of the tasks' creator")
+        parser.add_argument("--batch-size", type=int, default=BATCH_SIZE)
+
+    def handle(self, *args, **options):
+        try:
+            project = Project.objects.select_related("team__owner").get(
+                pk=options["project"]
+            )
+        except (Project.DoesNotExist, ValueError):
+            raise CommandError(f"Project {options['project']} does not exist")
+
+        created_by = None
+        if options["created_by"]:
+            created_by = User.objects.filter(email=options["created_by"]).first()
+            if created_by is None:
+                raise CommandError(f"User {options['created_by']} does not exist")
+
+        importer = TaskImporter(project, created_by, options["batch_size"])
+        try:
+            format = get_import_format(options["path"], options["format"])
+            with open(options["path"], "rb") as stream:
+                result = importer.run(read_rows(stream, format))
+        except (ImportFormatError, OSError) as exc:
+            raise CommandError(str(exc))
+
+        for error in result["errors"]:
+            self.stdout.write(f"Line {error['line']}: {error['errors']}")
+        self.stdout.write(
+            f"Imported {result['imported']:,} task(s), "
+            f"{result['failed']:,} row(s) failed"
+        )
@@ -0,0 +1,33 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.tasks.counters import rebuild_task_counters, verify_task_counters
+
+
+class Command(BaseCommand):
+    help = (
+        "Recompute the per-project and per-team task counters from the task "
+        "table, or only report counters that have drifted"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--verify",
+            action="store_true",
+            help="Only compare the counters with the task table",
+        )
+
+    def handle(self, *args, **options):
+        if not options["verify"]:
+            rows = rebuild_task_counters()
+            self.stdout.write(f"Rebuilt {rows:,} counter row(s)")
+            return
+
+        mismatches = verify_task_counters()
+        for model_name, key, stored, actual in mismatches:
+            self.stdout.write(f"{model_name} {key}: stored {stored}, actual {actual}")
+        if mismatches:
+            raise CommandError(
+                f"{len(mismatches)} counter(s) out of date, run without --verify "
+                "to rebuild them"
+            )
+        self.stdout.write("Task counters are up to date")
@@ -0,0 +1,40 @@
+# Generated by Django 5.2 on 2026-10-17 23:40
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('projects', '0001_initial'),
+        ('tasks', '0002_task_project_assignee_indexes'),
+        ('teams', '0004_team_is_deleting'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ProjectTaskCounter',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('status', models.CharField(choices=[('pending', 'Pending'), ('in_progress', 'In Progress'), ('completed', 'Completed')], max_length=20)),
+                ('count', models.IntegerField(default=0)),
+                ('project', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='task_counters', to='projects.project')),
+            ],
+            options={
+                'unique_together': {('project', 'status')},
+            },
+        ),
+        migrations.CreateModel(
+            name='TeamTaskCounter',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('status', models.CharField(choices=[('pending', 'Pending'), ('in_progress', 'In Progress'), ('completed', 'Completed')], max_length=20)),
+                ('count', models.IntegerField(default=0)),
+                ('team', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='task_counters', to='teams.team')),
+            ],
+            options={
+                'unique_together': {('team', 'status')},
+            },
+        ),
+    ]
@@ -0,0 +1,29 @@
+# Generated by Django 5.2 on 2026-10-17 23:42
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('projects', '0001_initial'),
+        ('tasks', '0003_task_counters'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='TaskDependency',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('depends_on', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='dependents', to='tasks.task')),
+                ('project', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='task_dependencies', to='projects.project')),
+                ('task', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='dependencies', to='tasks.task')),
+            ],
+            options={
+                'constraints': [models.CheckConstraint(condition=models.Q(('task', models.F('depends_on')), _negated=True), name='task_dependency_not_self')],
+                'unique_together': {('task', 'depends_on')},
+            },
+        ),
+    ]
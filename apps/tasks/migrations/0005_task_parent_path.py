@@ -0,0 +1,39 @@
+# Generated by Django 5.2 on 2026-10-17 23:48
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+def set_root_paths(apps, schema_editor):
+    # Existing tasks have no parent, so each one is the root of its own tree
+    Task = apps.get_model('tasks', 'Task')
+    tasks = []
+    for task in Task.objects.only('id').iterator(chunk_size=1000):
+        task.path = task.id.hex
+        tasks.append(task)
+        if len(tasks) == 1000:
+            Task.objects.bulk_update(tasks, ['path'])
+            tasks = []
+    Task.objects.bulk_update(tasks, ['path'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tasks', '0004_task_dependency'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='task',
+            name='parent',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='subtasks', to='tasks.task'),
+        ),
+        migrations.AddField(
+            model_name='task',
+            name='path',
+            field=models.CharField(db_index=True, default='', editable=False, max_length=256),
+            preserve_default=False,
+        ),
+        migrations.RunPython(set_root_paths, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,37 @@
+# Generated by Django 5.2 on 2026-10-18 00:20
+
+from django.db import migrations
+
+# Stored generated column, kept up to date by PostgreSQL on every write. It
+# is not a model field: it is only read through apps.search.query, so the
+# vectors are never loaded or returned with the tasks.
+ADD_SEARCH_VECTOR_SQL = """
+ALTER TABLE "tasks_task" ADD COLUMN "search_vector" tsvector GENERATED ALWAYS AS (
+    setweight(to_tsvector('english'::regconfig, coalesce("title", '')), 'A')
+    || setweight(to_tsvector('english'::regconfig, coalesce("description", '')), 'B')
+) STORED
+"""
+
+
+def add_search_vector(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute(ADD_SEARCH_VECTOR_SQL)
+    schema_editor.execute('CREATE INDEX "task_search_idx" ON "tasks_task" USING gin ("search_vector")')
+
+
+def remove_search_vector(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute('ALTER TABLE "tasks_task" DROP COLUMN "search_vector"')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tasks', '0005_task_parent_path'),
+    ]
+
+    operations = [
+        migrations.RunPython(add_search_vector, remove_search_vector),
+    ]
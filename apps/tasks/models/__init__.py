@@ -1,3 +1,5 @@
+from apps.tasks.models.counter import ProjectTaskCounter, TeamTaskCounter
+from apps.tasks.models.dependency import TaskDependency
 from apps.tasks.models.task import Task
 
-__all__ = ["Task"]
+__all__ = ["ProjectTaskCounter", "Task", "TaskDependency", "TeamTaskCounter"]
@@ -0,0 +1,36 @@
+from django.db import models
+
+from apps.projects.models import Project
+from apps.teams.models import Team
+from common.models import TaskStatus
+
+
+class ProjectTaskCounter(models.Model):
+    """
+    Number of tasks per status in a project, kept up to date by the task
+    signals (see apps.tasks.counters).
+    """
+
+    project = models.ForeignKey(
+        Project, on_delete=models.CASCADE, related_name="task_counters"
+    )
+    status = models.CharField(max_length=20, choices=TaskStatus.choices)
+    count = models.IntegerField(default=0)
+
+    class Meta:
+        unique_together = ("project", "status")
+
+
+class TeamTaskCounter(models.Model):
+    """
+    Number of tasks per status across all projects of a team.
+    """
+
+    team = models.ForeignKey(
+        Team, on_delete=models.CASCADE, related_name="task_counters"
+    )
+    status = models.CharField(max_length=20, choices=TaskStatus.choices)
+    count = models.IntegerField(default=0)
+
+    class Meta:
+        unique_together = ("team", "status")
@@ -0,0 +1,36 @@
+from django.db import models
+
+from apps.projects.models import Project
+from apps.tasks.models.task import Task
+
+
+class TaskDependency(models.Model):
+    """
+    ``task`` cannot start before ``depends_on`` is completed.
+
+    The project is stored on the edge so that a project's whole graph is
+    loaded with a single indexed query.
+    """
+
+    project = models.ForeignKey(
+        Project, on_delete=models.CASCADE, related_name="task_dependencies"
+    )
+    task = models.ForeignKey(
+        Task, on_delete=models.CASCADE, related_name="dependencies"
+    )
+    depends_on = models.ForeignKey(
+        Task, on_delete=models.CASCADE, related_name="dependents"
+    )
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        unique_together = ("task", "depends_on")
+        constraints = [
+            models.CheckConstraint(
+                condition=~models.Q(task=models.F("depends_on")),
+                name="task_dependency_not_self",
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.task_id} -> {self.depends_on_id}"
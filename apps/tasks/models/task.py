@@ -2,12 +2,35 @@ from uuid import uuid4
 
 from django.db import models
 
+from apps.projects.models import Project
 from apps.users.models import User
 from common.models import TaskPriority, TaskStatus
 
+# Partial index condition matching the open (not completed) tasks
+OPEN_TASKS = ~models.Q(status=TaskStatus.COMPLETED)
+
 
 class Task(models.Model):
     id = models.UUIDField(primary_key=True, default=uuid4, editable=False)
+    # Indexed as the leading column of the composite indexes below
+    project = models.ForeignKey(
+        Project,
+        on_delete=models.CASCADE,
+        null=True,
+        related_name="tasks",
+        db_index=False,
+    )
+    parent = models.ForeignKey(
+        "self",
+        on_delete=models.CASCADE,
+        null=True,
+        blank=True,
+        related_name="subtasks",
+    )
+    # Materialized path: the hex ids of the root, ..., parent and the task
+    # itself (see apps.tasks.tree). On PostgreSQL, db_index also creates the
+    # varchar_pattern_ops index used by subtree (LIKE 'prefix%') lookups.
+    path = models.CharField(max_length=256, db_index=True, editable=False)
     title = models.CharField(max_length=200)
     description = models.TextField(blank=True)
     status = models.CharField(
@@ -17,9 +40,52 @@ class Task(models.Model):
         max_length=20, choices=TaskPriority.choices, default=TaskPriority.HIGH
     )
     due_date = models.DateField(null=True, blank=True)
+    assignee = models.ForeignKey(
+        User,
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name="assigned_tasks",
+    )
     created_by = models.ForeignKey(User, on_delete=models.SET_NULL, null=True)
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    class Meta:
+        indexes = [
+            # Default listing of a project, newest first
+            models.Index(
+                fields=["project", "-created_at", "-id"],
+                name="task_project_created_idx",
+            ),
+            # Open tasks of a project by status and due date
+            models.Index(
+                fields=["project", "status", "due_date"],
+                name="task_open_status_due_idx",
+                condition=OPEN_TASKS,
+            ),
+            # Open tasks of a project by priority
+            models.Index(
+                fields=["project", "priority", "due_date"],
+                name="task_open_priority_due_idx",
+                condition=OPEN_TASKS,
+            ),
+            # Open tasks assigned to a user
+            models.Index(
+                fields=["assignee", "status", "due_date"],
+                name="task_assignee_open_idx",
+                condition=OPEN_TASKS,
+            ),
+        ]
+
     def __str__(self):
         return self.title
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        # Remember the counted (project, status) so that an update can move
+        # the task between counters.
+        instance._loaded_project_id = instance.__dict__.get("project_id")
+        instance._loaded_status = instance.__dict__.get("status")
+        return instance
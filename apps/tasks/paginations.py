@@ -0,0 +1,16 @@
+from rest_framework.pagination import PageNumberPagination
+
+from common.paginations import KeysetPagination
+
+
+class TaskPagination(PageNumberPagination):
+    page_size = 20
+    page_size_query_param = "page_size"
+    max_page_size = 100
+
+
+class TaskCursorPagination(KeysetPagination):
+    page_size = 20
+    page_size_query_param = "page_size"
+    max_page_size = 100
+    ordering = ("-created_at", "-id")
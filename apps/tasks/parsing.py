@@ -0,0 +1,346 @@
+import calendar
+import re
+from datetime import date, timedelta
+from functools import cache
+
+from django.conf import settings
+from django.utils import timezone
+from django.utils.module_loading import import_string
+
+from apps.tasks.imports import TaskImporter
+from apps.teams.models import TeamMember
+from common.models import TaskPriority, TaskStatus
+
+# Lines parsed (and tasks created) per request at most
+MAX_LINES = 1000
+
+# English names, whatever the locale
+WEEKDAYS = (
+    "monday",
+    "tuesday",
+    "wednesday",
+    "thursday",
+    "friday",
+    "saturday",
+    "sunday",
+)
+MONTHS = (
+    "january",
+    "february",
+    "march",
+    "april",
+    "may",
+    "june",
+    "july",
+    "august",
+    "september",
+    "october",
+    "november",
+    "december",
+)
+NUMBERS = {"a": 1, "an": 1, "one": 1, "two": 2, "three": 3, "four": 4, "five": 5}
+PRIORITY_WORDS = {
+    "low": TaskPriority.LOW,
+    "medium": TaskPriority.MEDIUM,
+    "normal": TaskPriority.MEDIUM,
+    "high": TaskPriority.HIGH,
+    "critical": TaskPriority.CRITICAL,
+    "urgent": TaskPriority.CRITICAL,
+    "asap": TaskPriority.CRITICAL,
+}
+PRIORITY_LEVELS = {
+    "0": TaskPriority.CRITICAL,
+    "1": TaskPriority.HIGH,
+    "2": TaskPriority.MEDIUM,
+    "3": TaskPriority.LOW,
+}
+
+
+def names(words):
+    # "mon" or "monday", "sep" or "september"
+    return "|".join(f"{word[:3]}(?:{word[3:]})?" for word in words)
+
+
+# The grammars are compiled once per process. Each matches one field of a
+# task and is removed from the line, whatever is left is the title.
+
+# "- ", "* ", "1. " and checkboxes, "[x]" marking a completed task
+LIST_MARKER = re.compile(r"^\s*(?:[-*+•]|\d+[.)])?\s*(?:\[(?P<check>[ xX])\]\s*)?")
+PRIORITY = re.compile(
+    r"""
+    \b(?:
+        (?P<word>low|medium|normal|high|critical|urgent)[ -]priority
+        | priority[:\s]+(?P<after>low|medium|normal|high|critical|urgent)
+        | p(?P<level>[0-3])
+        | (?P<alone>urgent|asap)
+    )\b
+    """,
+    re.IGNORECASE | re.VERBOSE,
+)
+# Weekdays and calendar dates need a preposition ("by friday", "due oct 20"),
+# relative dates ("tomorrow", "in 2 weeks", "next monday") do not. A date
+# must end a word, and not be a possessive ("today's PR").
+DUE_DATE = re.compile(
+    rf"""
+    \b(?:(?P<prefix>due(?:\s+(?:on|by))?|by|on|before|until)\s+)?
+    (?:
+        (?P<iso>\d{{4}}-\d{{2}}-\d{{2}})
+        | (?P<relative>today|tonight|tomorrow)
+        | in\s+(?P<amount>\d{{1,3}}|{"|".join(NUMBERS)})\s+(?P<unit>day|week|month)s?
+        | end\s+of\s+(?:the\s+)?(?P<end>day|week|month)
+        | (?:(?P<next>next|this)\s+)?(?P<weekday>{names(WEEKDAYS)})
+        | (?P<month>{names(MONTHS)})\.?\s+(?P<day>\d{{1,2}})(?:st|nd|rd|th)?
+        | (?P<day_first>\d{{1,2}})(?:st|nd|rd|th)?\s+(?P<month_after>{names(MONTHS)})
+    )(?![\w'’])
+    """,
+    re.IGNORECASE | re.VERBOSE,
+)
+# "@alice", "@alice@example.com", "assign to alice", "assigned to @alice",
+# "for alice@example.com". A mention's "@" must start a word, so that the
+# domain of an email address is not read as one, and a bare email address
+# needs a prefix, as a line may just mention one ("contact bob@x.com").
+ASSIGNEE = re.compile(
+    r"""
+    (?:\b(?:assign(?:ed)?\s+to|for)\s+)?
+    (?<![\w.+-])@(?P<mention>[\w.+-]+(?:@[\w-]+(?:\.[\w-]+)+)?)
+    | \b(?:assign(?:ed)?\s+to|for)\s+(?P<email>[\w.+-]+@[\w-]+(?:\.[\w-]+)+)
+    | \bassign(?:ed)?\s+to\s+(?P<name>[\w.+-]+)
+    """,
+    re.IGNORECASE | re.VERBOSE,
+)
+SPACES = re.compile(r"\s{2,}")
+# Left at the ends of a title once the fields are taken out of it
+TITLE_STRIP = " \t,;:-–—"
+
+
+class TaskTextParser:
+    """
+    Deterministic parser of one-line task descriptions such as
+    ``fix login bug high priority by friday @alice``.
+
+    Every line is parsed into an import row (see apps.tasks.imports): the
+    due date as an ISO date relative to ``today`` and the assignee as the
+    email of the team member mentioned by username, email or the local part
+    of the email. Unknown mentions are kept, so that the import reports them.
+    """
+
+    def __init__(self, today, handles):
+        self.today = today
+        # {lowercase handle: email}
+        self.handles = handles
+
+    def parse(self, text):
+        row = {}
+        marker = LIST_MARKER.match(text)
+        if marker["check"]:
+            row["status"] = (
+                TaskStatus.PENDING if marker["check"] == " " else TaskStatus.COMPLETED
+            )
+        text = text[marker.end() :]
+
+        text, match = take(PRIORITY, text)
+        if match:
+            word = match["word"] or match["after"] or match["alone"]
+            row["priority"] = (
+                PRIORITY_WORDS[word.lower()]
+                if word
+                else PRIORITY_LEVELS[match["level"]]
+            )
+
+        for match in DUE_DATE.finditer(text):
+            due_date = self.get_date(match)
+            if due_date is not None:
+                row["due_date"] = due_date.isoformat()
+                text = text[: match.start()] + " " + text[match.end() :]
+                break
+
+        text, match = take(ASSIGNEE, text)
+        if match:
+            handle = match["mention"] or match["email"] or match["name"]
+            handle = handle.rstrip(".").lower()
+            row["assignee"] = self.handles.get(handle, handle)
+
+        row["title"] = SPACES.sub(" ", text).strip(TITLE_STRIP)
+        return row
+
+    def get_date(self, match):
+        """
+        Return the date of a DUE_DATE match, or None when it is not one.
+        """
+        today = self.today
+        if match["iso"]:
+            if not match["prefix"]:
+                return None
+            try:
+                return date.fromisoformat(match["iso"])
+            except ValueError:
+                return None
+
+        if match["relative"]:
+            return today + timedelta(days=match["relative"].lower() == "tomorrow")
+
+        if match["unit"]:
+            amount = match["amount"].lower()
+            amount = NUMBERS[amount] if amount in NUMBERS else int(amount)
+            unit = match["unit"].lower()
+            if unit == "month":
+                return add_months(today, amount)
+            return today + timedelta(days=amount * (7 if unit == "week" else 1))
+
+        if match["end"]:
+            end = match["end"].lower()
+            if end == "day":
+                return today
+            if end == "week":
+                return today + timedelta(days=6 - today.weekday())
+            return today.replace(day=calendar.monthrange(today.year, today.month)[1])
+
+        if match["weekday"]:
+            if not match["prefix"] and not match["next"]:
+                return None
+            weekday = get_index(WEEKDAYS, match["weekday"])
+            # "next friday" is the friday of the coming (Monday to Sunday)
+            # week, otherwise it is the next friday, today included
+            if (match["next"] or "").lower() == "next":
+                return today + timedelta(days=7 - today.weekday() + weekday)
+            return today + timedelta(days=(weekday - today.weekday()) % 7)
+
+        if not match["prefix"]:
+            return None
+        month = get_index(MONTHS, match["month"] or match["month_after"]) + 1
+        day = int(match["day"] or match["day_first"])
+        # The next such day, today included
+        for year in (today.year, today.year + 1):
+            try:
+                due_date = today.replace(year=year, month=month, day=day)
+            except ValueError:
+                return None
+            if due_date >= today:
+                return due_date
+        return None
+
+
+def get_index(words, name):
+    # Names are matched by their first three letters at least
+    return [word[:3] for word in words].index(name[:3].lower())
+
+
+def take(pattern, text):
+    """
+    Remove the first match of a pattern from a text. Returns the text and
+    the match (or None).
+    """
+    match = pattern.search(text)
+    if match is None:
+        return text, None
+    return text[: match.start()] + " " + text[match.end() :], match
+
+
+def add_months(day, months):
+    month = day.month - 1 + months
+    year, month = day.year + month // 12, month % 12 + 1
+    return day.replace(
+        year=year, month=month, day=min(day.day, calendar.monthrange(year, month)[1])
+    )
+
+
+class TaskModelError(Exception):
+    """
+    Raised when the model stage returns rows that cannot be matched to the
+    parsed lines.
+    """
+
+
+class TaskModel:
+    """
+    Optional model stage run after the parser, e.g. a language model filling
+    in what the grammars could not. Configured with ``TASK_PARSER_MODEL``.
+
+    ``refine()`` receives ``(text, row)`` pairs and returns the rows to
+    import, one per pair. Its rows are validated like any other.
+    """
+
+    def refine(self, items):
+        raise NotImplementedError
+
+
+class StubTaskModel(TaskModel):
+    """
+    Local stand-in for a model, returning the parsed rows unchanged.
+    """
+
+    def refine(self, items):
+        return [row for _, row in items]
+
+
+@cache
+def get_task_model():
+    """
+    Return the configured TaskModel, or None when the stage is disabled.
+    """
+    if not settings.TASK_PARSER_MODEL:
+        return None
+    return import_string(settings.TASK_PARSER_MODEL)()
+
+
+def parse_tasks(parser, text):
+    """
+    Parse the non-blank lines of a text into ``(line, row)`` pairs, through
+    the model stage when there is one. Raises TaskModelError when the model
+    does not return one row per line.
+    """
+    items = [
+        (line, raw, parser.parse(raw))
+        for line, raw in enumerate(text.splitlines(), start=1)
+        if raw.strip()
+    ]
+    model = get_task_model()
+    if model is None or not items:
+        return [(line, row) for line, _, row in items]
+    rows = model.refine([(raw, row) for _, raw, row in items])
+    if len(rows) != len(items):
+        raise TaskModelError(
+            f"The task model returned {len(rows)} rows for {len(items)} lines."
+        )
+    return [(line, row) for (line, _, _), row in zip(items, rows)]
+
+
+class TaskTextImporter(TaskImporter):
+    """
+    Import of parsed task lines, created with a single ``bulk_create()`` so
+    that the created tasks are returned (in ``created``).
+    """
+
+    use_copy = False
+
+    def __init__(self, project, created_by=None):
+        self.handles = {}
+        self.created = []
+        super().__init__(project, created_by=created_by, batch_size=MAX_LINES)
+
+    def load_assignees(self):
+        """
+        Return ``{email: user_id}`` like TaskImporter, and collect the
+        handles members can be mentioned by. Usernames take precedence over
+        the local parts of emails.
+        """
+        team = self.project.team
+        members = [
+            *TeamMember.objects.filter(team=team).values_list(
+                "user__email", "user__username", "user_id"
+            ),
+            (team.owner.email, team.owner.username, team.owner_id),
+        ]
+        assignees = {email.lower(): user_id for email, _, user_id in members}
+        for email in assignees:
+            self.handles[email.partition("@")[0]] = email
+        for email, username, _ in members:
+            self.handles[username.lower()] = email.lower()
+        self.handles.update((email, email) for email in assignees)
+        return assignees
+
+    def get_parser(self):
+        return TaskTextParser(timezone.localdate(), self.handles)
+
+    def create_batch(self, tasks):
+        self.created += super().create_batch(tasks)
@@ -0,0 +1,153 @@
+import heapq
+from collections import defaultdict
+from itertools import batched
+
+from django.db import transaction
+from django.db.models import Case, Count, F, IntegerField, Value, When
+from django.utils import timezone
+
+from apps.tasks.models import Task
+from apps.tasks.models.task import OPEN_TASKS
+from apps.tasks.signals import tasks_updated
+from apps.teams.models import TeamMember
+from common.models import TaskPriority
+
+# Most urgent first
+PRIORITY_RANKS = {
+    TaskPriority.CRITICAL: 0,
+    TaskPriority.HIGH: 1,
+    TaskPriority.MEDIUM: 2,
+    TaskPriority.LOW: 3,
+}
+# Tasks written per UPDATE statement
+UPDATE_BATCH_SIZE = 2000
+
+
+def load_members(team_id):
+    """
+    Return ``(user_id, capacity, load)`` for the members of a team that take
+    tasks, ``load`` being the number of open tasks of the team assigned to
+    them. Two queries, whatever the number of members.
+    """
+    capacities = dict(
+        TeamMember.objects.filter(team_id=team_id, capacity__gt=0).values_list(
+            "user_id", "capacity"
+        )
+    )
+    loads = dict(
+        Task.objects.filter(OPEN_TASKS, project__team_id=team_id)
+        .filter(assignee_id__in=capacities)
+        .order_by()
+        .values("assignee_id")
+        .annotate(count=Count("pk"))
+        .values_list("assignee_id", "count")
+    )
+    return [
+        (user_id, capacity, loads.get(user_id, 0))
+        for user_id, capacity in capacities.items()
+    ]
+
+
+def schedule(tasks, members):
+    """
+    Assign tasks, most urgent first, to members given as ``(user_id,
+    capacity, load)``. Returns ``(task, user_id)`` pairs; tasks left over
+    once every member is at capacity are not assigned.
+
+    Every task goes to the member with the lowest load relative to their
+    capacity, kept in a heap: O((T + M) log M) for T tasks and M members.
+    Ties go to the member with fewer tasks, then to the first one given.
+    """
+    heap = [
+        (load / capacity, load, index, user_id, capacity)
+        for index, (user_id, capacity, load) in enumerate(members)
+        if load < capacity
+    ]
+    heapq.heapify(heap)
+
+    assignments = []
+    for task in tasks:
+        if not heap:
+            break
+        _, load, index, user_id, capacity = heap[0]
+        assignments.append((task, user_id))
+        load += 1
+        if load < capacity:
+            heapq.heapreplace(heap, (load / capacity, load, index, user_id, capacity))
+        else:
+            heapq.heappop(heap)
+    return assignments
+
+
+def get_urgency_order():
+    """
+    Ordering of tasks by priority, then due date (tasks without one last),
+    then age.
+    """
+    rank = Case(
+        *(
+            When(priority=priority, then=rank)
+            for priority, rank in PRIORITY_RANKS.items()
+        ),
+        output_field=IntegerField(),
+    )
+    return [rank, F("due_date").asc(nulls_last=True), "created_at", "pk"]
+
+
+def assign_tasks(team_id, queryset, limit, dry_run=False):
+    """
+    Assign the most urgent ``limit`` unassigned open tasks of a queryset (of
+    the team's tasks) to the team's members within their capacity.
+
+    The tasks are locked and rows already locked by another transaction are
+    skipped, so that concurrent runs do not assign a task twice. Assignments
+    are written with set-based updates (see ``update_assignees()``) and, as
+    they send no post_save, ``tasks_updated`` is sent once per assignee.
+    Returns ``(assignments, unassigned)``.
+    """
+    with transaction.atomic(using=queryset.db):
+        tasks = list(
+            queryset.filter(OPEN_TASKS, assignee__isnull=True)
+            .order_by(*get_urgency_order())
+            .select_for_update(skip_locked=True, of=("self",))
+            .only("id", "project_id", "status")[:limit]
+        )
+        assignments = schedule(tasks, load_members(team_id))
+        if dry_run or not assignments:
+            return assignments, len(tasks) - len(assignments)
+
+        update_assignees(queryset.db, assignments)
+        changes = defaultdict(list)
+        for task, user_id in assignments:
+            changes[user_id].append((task.pk, task.project_id, task.status))
+        for user_id, user_changes in changes.items():
+            tasks_updated.send(
+                sender=Task, changes=user_changes, values={"assignee": user_id}
+            )
+    return assignments, len(tasks) - len(assignments)
+
+
+def update_assignees(using, assignments):
+    """
+    Write ``(task, user_id)`` assignments with one ``UPDATE`` per
+    UPDATE_BATCH_SIZE tasks.
+
+    Like ``bulk_update()``, but with one ``CASE`` branch per assignee rather
+    than per task, which keeps building and running the statement linear.
+    """
+    field = Task._meta.get_field("assignee")
+    now = timezone.now()
+    for batch in batched(assignments, UPDATE_BATCH_SIZE):
+        groups = defaultdict(list)
+        for task, user_id in batch:
+            groups[user_id].append(task.pk)
+        assignee = Case(
+            *(
+                When(pk__in=task_ids, then=Value(user_id, output_field=field))
+                for user_id, task_ids in groups.items()
+            ),
+            output_field=field,
+        )
+        Task._base_manager.using(using).filter(
+            pk__in=[task.pk for task, _ in batch]
+        ).update(assignee=assignee, updated_at=now)
@@ -0,0 +1,120 @@
+from datetime import date
+from uuid import UUID
+
+import numpy as np
+from django.db.models import Count, IntegerField, OuterRef, Subquery
+from django.db.models.functions import Coalesce, TruncDate
+from django.utils import timezone
+
+from apps.tasks.cache import score_cache
+from apps.tasks.models import Task, TaskDependency
+from common.models import TaskPriority, TaskStatus
+
+# Points of each component of a task's score. The priority is the base of
+# the score; the other components move tasks within and across priorities.
+PRIORITY_POINTS = {
+    TaskPriority.LOW: 10.0,
+    TaskPriority.MEDIUM: 20.0,
+    TaskPriority.HIGH: 35.0,
+    TaskPriority.CRITICAL: 50.0,
+}
+# Grows from 0 to DUE_POINTS over the DUE_HORIZON_DAYS before the due date,
+# and on to twice that over as many days once it is overdue
+DUE_POINTS = 30.0
+DUE_HORIZON_DAYS = 14
+# Tasks already started are finished first
+IN_PROGRESS_POINTS = 10.0
+# Grows from 0 to AGE_POINTS over AGE_HORIZON_DAYS, so old tasks don't starve
+AGE_POINTS = 10.0
+AGE_HORIZON_DAYS = 30
+# Per log(1 + n) open tasks waiting for the task
+FAN_OUT_POINTS = 8.0
+
+# Columns of the open tasks, in the order they are loaded
+COLUMNS = ("id", "priority", "status", "due_date", "created_on", "fan_out")
+
+
+def load_task_columns(project_id):
+    """
+    Load the scored columns of a project's open tasks with a single query,
+    as one tuple per column (empty when there are none).
+
+    ``fan_out`` is the number of open tasks depending on each task.
+    """
+    fan_out = (
+        TaskDependency.objects.filter(depends_on=OuterRef("pk"))
+        .exclude(task__status=TaskStatus.COMPLETED)
+        .order_by()
+        .values("depends_on")
+        .annotate(count=Count("pk"))
+        .values("count")
+    )
+    rows = (
+        Task.objects.filter(project_id=project_id)
+        .exclude(status=TaskStatus.COMPLETED)
+        .annotate(
+            created_on=TruncDate("created_at"),
+            fan_out=Coalesce(Subquery(fan_out, output_field=IntegerField()), 0),
+        )
+        .order_by("pk")
+        .values_list(*COLUMNS)
+    )
+    return tuple(zip(*rows))
+
+
+def score_tasks(columns, today):
+    """
+    Score tasks from their ``COLUMNS`` and return ``(ids, scores)``, highest
+    score first. Tasks with equal scores keep their order.
+
+    The scores are computed in one vectorized pass with NumPy.
+    """
+    if not columns:
+        return [], []
+
+    ids, priority, status, due_date, created_on, fan_out = columns
+    count, today = len(ids), today.toordinal()
+
+    def column(values, convert, dtype=np.float64):
+        # Converting through ordinals and dict lookups is several times
+        # faster than letting NumPy parse dates and strings
+        return np.fromiter(map(convert, values), dtype, count)
+
+    scores = column(priority, PRIORITY_POINTS.get)
+    # Days to the due date, negative once overdue. Tasks without one are
+    # left at the horizon, which scores 0.
+    due_date = column(due_date, lambda value: value.toordinal() if value else 0, int)
+    days_left = np.where(due_date > 0, due_date - today, DUE_HORIZON_DAYS)
+    scores += DUE_POINTS * np.clip(1 - days_left / DUE_HORIZON_DAYS, 0, 2)
+    in_progress = column(status, TaskStatus.IN_PROGRESS.__eq__, bool)
+    scores += IN_PROGRESS_POINTS * in_progress
+    age = today - column(created_on, date.toordinal, int)
+    scores += AGE_POINTS * np.clip(age / AGE_HORIZON_DAYS, 0, 1)
+    scores += FAN_OUT_POINTS * np.log1p(np.array(fan_out, dtype=np.float64))
+
+    order = np.argsort(-scores, kind="stable")
+    return [ids[index] for index in order], scores[order].round(2).tolist()
+
+
+def get_task_scores(project_id, limit=None):
+    """
+    Return the ``(id, score)`` of a project's open tasks, highest score
+    first, from the cache, scoring them on a miss.
+
+    The cache is invalidated whenever one of the project's tasks or
+    dependencies changes, and scores are kept per day as they depend on it.
+    """
+    today = timezone.localdate()
+
+    def score():
+        ids, scores = score_tasks(load_task_columns(project_id), today)
+        # Bytes and floats unpickle much faster than UUID objects
+        return b"".join(task_id.bytes for task_id in ids), scores
+
+    keys, scores = score_cache.get_or_set(
+        project_id, f"scores:{today.isoformat()}", score
+    )
+    return [
+        (UUID(bytes=keys[index * 16 : index * 16 + 16]), score)
+        for index, score in enumerate(scores[:limit])
+    ]
@@ -0,0 +1,405 @@
+from rest_framework import serializers
+
+from apps.projects.models import Project
+from apps.tasks.bulk import BULK_UPDATE_FIELDS
+from apps.tasks.filters import TaskFilter
+from apps.tasks.imports import IMPORT_FORMATS
+from apps.tasks.models import Task, TaskDependency
+from apps.tasks.parsing import MAX_LINES
+from apps.tasks.tree import MAX_DEPTH, MoveError, get_depth, get_move_error, move_task
+from apps.teams.access import TeamAccessResolver
+from common.serializers import DynamicFieldsMixin
+
+
+class TaskSerializer(DynamicFieldsMixin, serializers.ModelSerializer):
+    class Meta:
+        model = Task
+        exclude = ["path"]
+
+
+class TaskCreateSerializer(serializers.ModelSerializer):
+    """
+    Serializer for creating tasks in a project of one of the user's teams.
+    Expects the requesting user's TeamAccessResolver as ``access`` in the context.
+    """
+
+    class Meta:
+        model = Task
+        fields = [
+            "project",
+            "title",
+            "description",
+            "status",
+            "priority",
+            "due_date",
+            "assignee",
+            "parent",
+        ]
+        extra_kwargs = {"project": {"required": True, "allow_null": False}}
+
+    def validate_project(self, project):
+        if not self.context["access"].can_view(project.team_id):
+            raise serializers.ValidationError(
+                f'Invalid pk "{project.pk}" - object does not exist.'
+            )
+        return project
+
+    def validate(self, attrs):
+        project = attrs.get("project") or self.instance.project
+        assignee = attrs.get("assignee")
+        if assignee is not None and not TeamAccessResolver(assignee).can_view(
+            project.team_id
+        ):
+            raise serializers.ValidationError(
+                {"assignee": ["The assignee must be a member of the project's team"]}
+            )
+
+        parent = attrs.get("parent")
+        if self.instance is None and parent is not None:
+            if parent.project_id != project.pk:
+                raise serializers.ValidationError(
+                    {
+                        "parent": [
+                            "A subtask must belong to the same project as its parent."
+                        ]
+                    }
+                )
+            if get_depth(parent.path) >= MAX_DEPTH:
+                raise serializers.ValidationError(
+                    {
+                        "parent": [
+                            f"Subtasks can be nested at most {MAX_DEPTH} levels deep."
+                        ]
+                    }
+                )
+        return attrs
+
+
+class TaskUpdateSerializer(TaskCreateSerializer):
+    """
+    Serializer for updating tasks. All fields are optional; a task cannot be
+    moved to another project, but it can be moved under another parent.
+    """
+
+    class Meta(TaskCreateSerializer.Meta):
+        fields = [
+            "title",
+            "description",
+            "status",
+            "priority",
+            "due_date",
+            "assignee",
+            "parent",
+        ]
+        extra_kwargs = {"title": {"required": False}}
+
+    def validate_parent(self, parent):
+        error = get_move_error(self.instance, parent)
+        if error:
+            raise serializers.ValidationError(error)
+        return parent
+
+    def update(self, instance, validated_data):
+        if "parent" in validated_data:
+            parent = validated_data.pop("parent")
+            if getattr(parent, "pk", None) != instance.parent_id:
+                try:
+                    move_task(instance, parent)
+                except MoveError as error:
+                    raise serializers.ValidationError({"parent": [str(error)]})
+        return super().update(instance, validated_data)
+
+
+class TaskDependencySerializer(serializers.ModelSerializer):
+    """
+    Serializer for adding a dependency to a task. The task it depends on must
+    belong to the same project.
+    """
+
+    class Meta:
+        model = TaskDependency
+        fields = ["task", "depends_on", "project", "created_at"]
+        read_only_fields = ["task", "project", "created_at"]
+
+    def validate_depends_on(self, depends_on):
+        if depends_on.project_id != self.context["task"].project_id:
+            raise serializers.ValidationError(
+                "A task can only depend on tasks of the same project."
+            )
+        return depends_on
+
+
+class TaskGraphSerializer(serializers.Serializer):
+    """
+    Query parameters and response of the task graph endpoint.
+    """
+
+    project = serializers.UUIDField()
+    order = serializers.ListField(
+        child=serializers.UUIDField(),
+        read_only=True,
+        allow_null=True,
+        help_text="Tasks with dependencies, each after the tasks it depends on",
+    )
+    blocked = serializers.ListField(
+        child=serializers.UUIDField(),
+        read_only=True,
+        help_text="Open tasks waiting for at least one open dependency",
+    )
+    critical_path = serializers.ListField(
+        child=serializers.UUIDField(),
+        read_only=True,
+        allow_null=True,
+        help_text="Longest chain of open tasks that must be done one after the other",
+    )
+    cycle = serializers.ListField(
+        child=serializers.UUIDField(),
+        read_only=True,
+        allow_null=True,
+        help_text="Tasks forming a dependency cycle, if any",
+    )
+
+
+class TaskScoreSerializer(serializers.Serializer):
+    task = serializers.UUIDField()
+    score = serializers.FloatField()
+
+
+class TaskPrioritySerializer(serializers.Serializer):
+    """
+    Query parameters and response of the task priorities endpoint.
+    """
+
+    project = serializers.UUIDField()
+    limit = serializers.IntegerField(min_value=1, max_value=500, default=50)
+    results = TaskScoreSerializer(
+        many=True,
+        read_only=True,
+        help_text="Open tasks by urgency score, most urgent first",
+    )
+
+
+class TaskProgressSerializer(serializers.Serializer):
+    """
+    Serializer for documenting subtree progress responses in Swagger.
+    """
+
+    total = serializers.IntegerField(help_text="Tasks in the subtree, itself included")
+    completed = serializers.IntegerField(help_text="Completed tasks in the subtree")
+    percentage = serializers.FloatField(help_text="Completed share, 0 to 100")
+
+
+class TaskStatsSerializer(serializers.Serializer):
+    """
+    Query parameters and response of the task stats endpoint.
+    """
+
+    project = serializers.UUIDField(required=False)
+    team = serializers.UUIDField(required=False)
+    counts = serializers.DictField(
+        child=serializers.IntegerField(),
+        read_only=True,
+        help_text="Number of tasks per status",
+    )
+    total = serializers.IntegerField(read_only=True)
+
+    def validate(self, attrs):
+        if len(attrs) != 1:
+            raise serializers.ValidationError("Pass exactly one of project or team.")
+        return attrs
+
+
+class TaskScheduleSerializer(serializers.Serializer):
+    """
+    Scope and options of an automatic assignment run.
+    """
+
+    project = serializers.UUIDField(required=False)
+    team = serializers.UUIDField(required=False)
+    limit = serializers.IntegerField(
+        min_value=1,
+        max_value=10_000,
+        default=1000,
+        help_text="Number of the most urgent unassigned tasks to assign",
+    )
+    dry_run = serializers.BooleanField(
+        default=False, help_text="Return the assignments without saving them"
+    )
+
+    def validate(self, attrs):
+        if ("project" in attrs) == ("team" in attrs):
+            raise serializers.ValidationError("Pass exactly one of project or team.")
+        return attrs
+
+
+class TaskAssignmentSerializer(serializers.Serializer):
+    task = serializers.UUIDField()
+    assignee = serializers.UUIDField()
+
+
+class TaskScheduleResultSerializer(serializers.Serializer):
+    """
+    Serializer for documenting automatic assignment runs in Swagger.
+    """
+
+    assigned = serializers.IntegerField(help_text="Number of tasks assigned")
+    unassigned = serializers.IntegerField(
+        help_text="Tasks left unassigned because every member is at capacity"
+    )
+    assignments = TaskAssignmentSerializer(many=True)
+
+
+class TaskListSerializer(serializers.Serializer):
+    """
+    Serializer for documenting paginated task responses in Swagger.
+    """
+
+    count = serializers.IntegerField(help_text="Total number of matching tasks")
+    next = serializers.URLField(
+        required=False,
+        allow_null=True,
+        help_text="URL to the next page of results, null if this is the last page",
+    )
+    previous = serializers.URLField(
+        required=False,
+        allow_null=True,
+        help_text="URL to the previous page of results, null if this is the first page",
+    )
+    results = TaskSerializer(many=True, help_text="List of tasks for the current page")
+
+
+class TaskImportSerializer(serializers.Serializer):
+    """
+    Upload of a task import. The format defaults to the file's extension.
+    """
+
+    project = serializers.PrimaryKeyRelatedField(queryset=Project.objects.all())
+    file = serializers.FileField(help_text="CSV, NDJSON or JSON file of tasks")
+    format = serializers.ChoiceField(choices=IMPORT_FORMATS, required=False)
+
+    def validate_project(self, project):
+        if not self.context["access"].can_manage(project.team_id):
+            raise serializers.ValidationError(
+                f'Invalid pk "{project.pk}" - object does not exist.'
+            )
+        return project
+
+
+class TaskImportResultSerializer(serializers.Serializer):
+    """
+    Serializer for documenting task import reports in Swagger.
+    """
+
+    imported = serializers.IntegerField(help_text="Number of tasks created")
+    failed = serializers.IntegerField(help_text="Number of rows rejected")
+    errors = serializers.ListField(
+        child=serializers.DictField(),
+        help_text=(
+            "Errors of the rejected rows as {line, errors}, limited to the "
+            "first 1000"
+        ),
+    )
+
+
+class TaskParseSerializer(serializers.Serializer):
+    """
+    Lines of text to create tasks from, one task per non-blank line.
+    """
+
+    project = serializers.PrimaryKeyRelatedField(queryset=Project.objects.all())
+    text = serializers.CharField(
+        trim_whitespace=False,
+        help_text=(
+            'Tasks such as "fix login bug high priority by friday @alice", '
+            "one per line"
+        ),
+    )
+
+    def validate_project(self, project):
+        if not self.context["access"].can_view(project.team_id):
+            raise serializers.ValidationError(
+                f'Invalid pk "{project.pk}" - object does not exist.'
+            )
+        return project
+
+    def validate_text(self, text):
+        if sum(1 for line in text.splitlines() if line.strip()) > MAX_LINES:
+            raise serializers.ValidationError(
+                f"Ensure there are no more than {MAX_LINES} tasks."
+            )
+        return text
+
+
+class TaskParseResultSerializer(serializers.Serializer):
+    """
+    Serializer for documenting natural-language task creation in Swagger.
+    """
+
+    created = TaskSerializer(many=True, help_text="Tasks created, in line order")
+    failed = serializers.IntegerField(help_text="Number of lines rejected")
+    errors = serializers.ListField(
+        child=serializers.DictField(),
+        help_text="Errors of the rejected lines as {line, errors}",
+    )
+
+
+class TaskBulkChangesSerializer(serializers.ModelSerializer):
+    """
+    Field values to apply to every selected task.
+    """
+
+    class Meta:
+        model = Task
+        fields = list(BULK_UPDATE_FIELDS)
+        extra_kwargs = {name: {"required": False} for name in BULK_UPDATE_FIELDS}
+
+    def validate(self, attrs):
+        if not attrs:
+            raise serializers.ValidationError("Pass at least one field to change.")
+        return attrs
+
+
+class TaskBulkUpdateSerializer(serializers.Serializer):
+    """
+    Serializer for updating many tasks at once, selected either by id or by
+    the filters of the task list.
+    """
+
+    ids = serializers.ListField(
+        child=serializers.UUIDField(), required=False, min_length=1, max_length=1000
+    )
+    filter = serializers.DictField(
+        required=False,
+        help_text=('Task list filters, e.g. {"project": "...", "status": ["pending"]}'),
+    )
+    changes = TaskBulkChangesSerializer()
+
+    def validate_filter(self, value):
+        # An unknown or empty filter would otherwise select every task
+        names = set(TaskFilter.base_filters) - {"ordering"}
+        unknown = sorted(set(value) - names)
+        if unknown:
+            raise serializers.ValidationError(
+                f"Unknown filters: {', '.join(unknown)}. "
+                f"Expected some of: {', '.join(sorted(names))}."
+            )
+        if all(item in (None, "", []) for item in value.values()):
+            raise serializers.ValidationError("Pass at least one filter.")
+        return value
+
+    def validate(self, attrs):
+        if ("ids" in attrs) == ("filter" in attrs):
+            raise serializers.ValidationError("Pass exactly one of ids or filter.")
+        return attrs
+
+
+class TaskBulkUpdateResultSerializer(serializers.Serializer):
+    """
+    Serializer for documenting bulk task update responses in Swagger.
+    """
+
+    updated = serializers.IntegerField(help_text="Number of tasks changed")
+    ids = serializers.ListField(
+        child=serializers.UUIDField(),
+        help_text="Tasks changed, tasks that already had the values are left out",
+    )
@@ -0,0 +1,105 @@
+from collections import Counter
+
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save, pre_delete, pre_save
+from django.dispatch import Signal, receiver
+
+from apps.projects.models import Project
+from apps.tasks.cache import invalidate_task_graph, invalidate_task_scores
+from apps.tasks.counters import adjust_task_counters, move_project_counters
+from apps.tasks.models import Task, TaskDependency
+from apps.tasks.tree import get_path
+
+# Sent once per set-based update (apps.tasks.bulk.update_tasks), which sends
+# no post_save, with the (id, previous project_id, previous status) of every
+# updated task and the {field_name: value} applied to all of them
+tasks_updated = Signal()
+# Sent once per import (apps.tasks.imports), which sends no post_save, with
+# the project, the creator of the tasks and the number of imported tasks
+tasks_imported = Signal()
+
+
+@receiver(pre_save, sender=Task)
+def set_task_path(sender, instance, **kwargs):
+    # Later parent changes go through apps.tasks.tree.move_task(), which
+    # rewrites the paths of the whole subtree
+    if not instance.path:
+        instance.path = get_path(instance.pk, instance.parent)
+
+
+# Connected before count_saved_task, which resets the loaded project
+@receiver(post_save, sender=Task)
+@receiver(post_delete, sender=Task)
+def invalidate_saved_task_scores(sender, instance, **kwargs):
+    project_ids = (instance.project_id, getattr(instance, "_loaded_project_id", None))
+    transaction.on_commit(lambda: invalidate_task_scores(*project_ids))
+
+
+@receiver(post_save, sender=Task)
+def count_saved_task(sender, instance, created, **kwargs):
+    deltas = Counter()
+    if created:
+        deltas[instance.project_id, instance.status] += 1
+    elif hasattr(instance, "_loaded_status"):
+        deltas[instance._loaded_project_id, instance._loaded_status] -= 1
+        deltas[instance.project_id, instance.status] += 1
+    adjust_task_counters(deltas)
+    instance._loaded_project_id = instance.project_id
+    instance._loaded_status = instance.status
+
+
+@receiver(tasks_updated, sender=Task)
+def invalidate_updated_task_scores(sender, changes, **kwargs):
+    project_ids = {project_id for _, project_id, _ in changes}
+    transaction.on_commit(lambda: invalidate_task_scores(*project_ids))
+
+
+@receiver(tasks_imported, sender=Task)
+def invalidate_imported_task_scores(sender, project, **kwargs):
+    transaction.on_commit(lambda: invalidate_task_scores(project.pk))
+
+
+@receiver(tasks_updated, sender=Task)
+def count_updated_tasks(sender, changes, values, **kwargs):
+    if "status" not in values:
+        return
+    deltas = Counter()
+    for _, project_id, status in changes:
+        deltas[project_id, status] -= 1
+        deltas[project_id, values["status"]] += 1
+    adjust_task_counters(deltas)
+
+
+# Counted before the delete (in the same transaction), as a project deleted
+# along with its tasks may already be gone by post_delete
+@receiver(pre_delete, sender=Task)
+def count_deleted_task(sender, instance, **kwargs):
+    key = (
+        getattr(instance, "_loaded_project_id", instance.project_id),
+        getattr(instance, "_loaded_status", instance.status),
+    )
+    adjust_task_counters({key: -1})
+
+
+@receiver(pre_save, sender=Project)
+def remember_project_team(sender, instance, **kwargs):
+    if instance._state.adding:
+        return
+    instance._previous_team_id = (
+        Project.objects.filter(pk=instance.pk).values_list("team_id", flat=True).first()
+    )
+
+
+@receiver(post_save, sender=Project)
+def move_project_task_counts(sender, instance, created, **kwargs):
+    previous_team_id = getattr(instance, "_previous_team_id", None)
+    if not created and previous_team_id not in (None, instance.team_id):
+        move_project_counters(instance.pk, previous_team_id, instance.team_id)
+
+
+@receiver(post_save, sender=TaskDependency)
+@receiver(post_delete, sender=TaskDependency)
+def invalidate_dependency_graph(sender, instance, **kwargs):
+    transaction.on_commit(lambda: invalidate_task_graph(instance.project_id))
+    # Dependencies change the fan-out of the tasks they point to
+    transaction.on_commit(lambda: invalidate_task_scores(instance.project_id))
@@ -1,3 +1,621 @@
-from django.test import TestCase
+import re
+from collections import Counter
+from datetime import date
+from uuid import UUID
 
-# Create your tests here.
+from django.core.cache import cache
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.db import connection
+from django.test import SimpleTestCase, TestCase, override_settings
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from apps.projects.models import Project
+from apps.tasks.counters import get_task_counts, verify_task_counters
+from apps.tasks.management.commands.check_task_query_plans import (
+    Command as QueryPlanCommand,
+)
+from apps.tasks.models import ProjectTaskCounter, Task, TeamTaskCounter
+from apps.tasks.parsing import (
+    StubTaskModel,
+    TaskModelError,
+    TaskTextParser,
+    get_task_model,
+    parse_tasks,
+)
+from apps.tasks.scheduling import schedule
+from apps.tasks.scoring import score_tasks
+from apps.tasks.tree import MoveError, get_move_error, move_task
+from apps.teams.models import Team, TeamMember
+from apps.users.models import User
+from common.models import TaskPriority, TaskStatus, TeamRole
+
+# A Wednesday
+TODAY = date(2026, 10, 14)
+HANDLES = {
+    "alice": "alice@example.com",
+    "alice@example.com": "alice@example.com",
+    "bob": "bob@x.com",
+    "bob@x.com": "bob@x.com",
+}
+
+
+class DroppingTaskModel(StubTaskModel):
+    def refine(self, items):
+        return super().refine(items)[:-1]
+
+
+class TaskTextParserTests(SimpleTestCase):
+    def parse(self, text):
+        return TaskTextParser(TODAY, HANDLES).parse(text)
+
+    def test_parses_every_field(self):
+        self.assertEqual(
+            self.parse("fix login bug high priority by friday @alice"),
+            {
+                "priority": TaskPriority.HIGH,
+                "due_date": "2026-10-16",
+                "assignee": "alice@example.com",
+                "title": "fix login bug",
+            },
+        )
+
+    def test_priorities(self):
+        for text, priority in [
+            ("deploy high priority", TaskPriority.HIGH),
+            ("deploy priority: low", TaskPriority.LOW),
+            ("deploy p0", TaskPriority.CRITICAL),
+            ("deploy urgent", TaskPriority.CRITICAL),
+        ]:
+            with self.subTest(text=text):
+                row = self.parse(text)
+                self.assertEqual(row["priority"], priority)
+                self.assertEqual(row["title"], "deploy")
+
+    def test_due_dates(self):
+        for text, due_date in [
+            ("deploy tomorrow", "2026-10-15"),
+            ("deploy by friday", "2026-10-16"),
+            ("deploy next monday", "2026-10-19"),
+            ("deploy in 2 weeks", "2026-10-28"),
+            ("deploy due oct 20", "2026-10-20"),
+            ("deploy end of month", "2026-10-31"),
+            ("deploy by 2026-11-02", "2026-11-02"),
+        ]:
+            with self.subTest(text=text):
+                row = self.parse(text)
+                self.assertEqual(row["due_date"], due_date)
+                self.assertEqual(row["title"], "deploy")
+
+    def test_weekdays_and_iso_dates_need_a_preposition(self):
+        self.assertEqual(self.parse("friday release"), {"title": "friday release"})
+        self.assertEqual(
+            self.parse("release 2026-11-01 by 2026-11-02"),
+            {"due_date": "2026-11-02", "title": "release 2026-11-01"},
+        )
+
+    def test_assignees(self):
+        for text, assignee in [
+            ("deploy @alice", "alice@example.com"),
+            ("deploy @alice@example.com", "alice@example.com"),
+            ("deploy assign to bob", "bob@x.com"),
+            ("deploy assigned to bob@x.com", "bob@x.com"),
+            ("deploy for bob@x.com", "bob@x.com"),
+            ("deploy @carol", "carol"),
+        ]:
+            with self.subTest(text=text):
+                row = self.parse(text)
+                self.assertEqual(row["assignee"], assignee)
+                self.assertEqual(row["title"], "deploy")
+
+    def test_email_is_not_read_as_a_mention(self):
+        self.assertEqual(
+            self.parse("review PR in 2 weeks for bob@x.com"),
+            {"due_date": "2026-10-28", "assignee": "bob@x.com", "title": "review PR"},
+        )
+
+    def test_bare_email_is_not_an_assignee(self):
+        self.assertEqual(
+            self.parse("contact bob@example.com about tax"),
+            {"title": "contact bob@example.com about tax"},
+        )
+
+    def test_possessive_is_not_a_due_date(self):
+        self.assertEqual(
+            self.parse("review today's PR"), {"title": "review today's PR"}
+        )
+        self.assertEqual(
+            self.parse("review tomorrow’s PR by friday"),
+            {"due_date": "2026-10-16", "title": "review tomorrow’s PR"},
+        )
+
+    def test_checkboxes(self):
+        self.assertEqual(
+            self.parse("- [x] write docs"),
+            {"status": TaskStatus.COMPLETED, "title": "write docs"},
+        )
+        self.assertEqual(
+            self.parse("* [ ] write docs"),
+            {"status": TaskStatus.PENDING, "title": "write docs"},
+        )
+
+
+class ParseTasksTests(SimpleTestCase):
+    def tearDown(self):
+        get_task_model.cache_clear()
+
+    def parse_tasks(self, text):
+        get_task_model.cache_clear()
+        return parse_tasks(TaskTextParser(TODAY, HANDLES), text)
+
+    def test_numbers_non_blank_lines(self):
+        rows = self.parse_tasks("first\n\n  \nsecond p1")
+        self.assertEqual(
+            rows,
+            [
+                (1, {"title": "first"}),
+                (4, {"priority": TaskPriority.HIGH, "title": "second"}),
+            ],
+        )
+
+    @override_settings(TASK_PARSER_MODEL="apps.tasks.tests.DroppingTaskModel")
+    def test_rejects_a_model_dropping_rows(self):
+        with self.assertRaises(TaskModelError):
+            self.parse_tasks("first\nsecond")
+
+
+class TaskQueryPlanTests(TestCase):
+    """
+    The task list filters checked by ``check_task_query_plans``.
+    """
+
+    def test_list_filters_use_task_indexes(self):
+        command = QueryPlanCommand()
+        with connection.cursor() as cursor:
+            indexes = {
+                name
+                for name, constraint in connection.introspection.get_constraints(
+                    cursor, Task._meta.db_table
+                ).items()
+                if constraint["index"]
+            }
+
+        for label, plan in command.get_plans():
+            with self.subTest(label):
+                self.assertFalse(command.is_full_scan(plan), "\n".join(plan))
+                used = set(re.findall(r"\w+", "\n".join(plan))) & indexes
+                self.assertTrue(used, "\n".join(plan))
+                if label == "project":
+                    self.assertIn("task_project_created_idx", used)
+                elif label == "assignee, open":
+                    self.assertIn("task_assignee_open_idx", used)
+
+
+class TaskTestCase(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.owner = User.objects.create_user(
+            email="owner@example.com", username="owner", password="password"
+        )
+        cls.member = User.objects.create_user(
+            email="member@example.com", username="member", password="password"
+        )
+        cls.team = Team.objects.create(name="Team", owner=cls.owner)
+        TeamMember.objects.create(team=cls.team, user=cls.member, role=TeamRole.MEMBER)
+        cls.project = Project.objects.create(name="Project", team=cls.team)
+
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+        self.client.force_authenticate(self.owner)
+
+    def create_task(self, project=None, **data):
+        response = self.client.post(
+            reverse("tasks"),
+            {"project": str((project or self.project).pk), **data},
+            format="json",
+        )
+        self.assertEqual(response.status_code, 201, response.content)
+        return response.json()["id"]
+
+    def get_project_counts(self, project=None):
+        return get_task_counts(
+            ProjectTaskCounter, project_id=(project or self.project).pk
+        )
+
+
+class TaskCounterTests(TaskTestCase):
+    def test_counters_follow_creates_updates_and_deletes(self):
+        first = self.create_task(title="First")
+        second = self.create_task(title="Second")
+        self.create_task(title="Third", status=TaskStatus.COMPLETED)
+        self.client.patch(
+            reverse("task-detail", args=[first]),
+            {"status": TaskStatus.IN_PROGRESS},
+            format="json",
+        )
+        self.client.delete(reverse("task-detail", args=[second]))
+
+        expected = {"pending": 0, "in_progress": 1, "completed": 1}
+        self.assertEqual(self.get_project_counts(), expected)
+        self.assertEqual(
+            get_task_counts(TeamTaskCounter, team_id=self.team.pk), expected
+        )
+        self.assertEqual(verify_task_counters(), [])
+
+    def test_stats_endpoint(self):
+        self.create_task(title="First")
+        response = self.client.get(reverse("task-stats"), {"team": self.team.pk})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()["total"], 1)
+
+        outsider = User.objects.create_user(
+            email="outsider@example.com", username="outsider", password="password"
+        )
+        self.client.force_authenticate(outsider)
+        response = self.client.get(reverse("task-stats"), {"team": self.team.pk})
+        self.assertEqual(response.status_code, 404)
+
+
+class TaskDependencyTests(TaskTestCase):
+    def add_dependency(self, task, depends_on):
+        return self.client.post(
+            reverse("task-dependencies", args=[task]),
+            {"depends_on": depends_on},
+            format="json",
+        )
+
+    def test_cycles_are_rejected(self):
+        first, second, third = (self.create_task(title=title) for title in "ABC")
+        self.assertEqual(self.add_dependency(second, first).status_code, 201)
+        self.assertEqual(self.add_dependency(third, second).status_code, 201)
+
+        for task, depends_on in [(first, third), (first, first)]:
+            with self.subTest(task=task, depends_on=depends_on):
+                response = self.add_dependency(task, depends_on)
+                self.assertEqual(response.status_code, 400)
+                self.assertIn("depends_on", response.json())
+
+    def test_graph_order_and_blocked_tasks(self):
+        first, second = self.create_task(title="A"), self.create_task(title="B")
+        self.add_dependency(second, first)
+
+        response = self.client.get(reverse("task-graph"), {"project": self.project.pk})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()["order"], [first, second])
+        self.assertEqual(response.json()["blocked"], [second])
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.client.patch(
+                reverse("task-detail", args=[first]),
+                {"status": TaskStatus.COMPLETED},
+                format="json",
+            )
+        response = self.client.get(reverse("task-graph"), {"project": self.project.pk})
+        self.assertEqual(response.json()["blocked"], [])
+
+
+class TaskTreeTests(TaskTestCase):
+    def move(self, task, parent):
+        return self.client.patch(
+            reverse("task-detail", args=[task]), {"parent": parent}, format="json"
+        )
+
+    def test_subtree_moves_with_its_task(self):
+        root = self.create_task(title="Root")
+        child = self.create_task(title="Child", parent=root)
+        grandchild = self.create_task(title="Grandchild", parent=child)
+        other = self.create_task(title="Other")
+
+        self.assertEqual(self.move(child, other).status_code, 200)
+
+        tasks = {task.title: task for task in Task.objects.all()}
+        self.assertEqual(
+            tasks["Child"].path, tasks["Other"].path + child.replace("-", "")
+        )
+        self.assertTrue(tasks["Grandchild"].path.startswith(tasks["Child"].path))
+        response = self.client.get(reverse("task-ancestors", args=[grandchild]))
+        self.assertEqual(
+            [task["title"] for task in response.json()], ["Other", "Child"]
+        )
+        response = self.client.get(reverse("task-subtasks", args=[root]))
+        self.assertEqual(response.json()["count"], 0)
+
+    def test_task_cannot_move_under_its_subtree(self):
+        root = self.create_task(title="Root")
+        child = self.create_task(title="Child", parent=root)
+
+        for parent in (root, child):
+            with self.subTest(parent=parent):
+                response = self.move(root, parent)
+                self.assertEqual(response.status_code, 400)
+                self.assertIn("parent", response.json())
+
+    def test_concurrent_moves_cannot_create_a_loop(self):
+        first = Task.objects.get(pk=self.create_task(title="First"))
+        second = Task.objects.get(pk=self.create_task(title="Second"))
+        # Both moves were validated against the paths before either ran
+        stale_first, stale_second = (
+            Task.objects.get(pk=first.pk),
+            Task.objects.get(pk=second.pk),
+        )
+        self.assertIsNone(get_move_error(first, second))
+        self.assertIsNone(get_move_error(stale_second, stale_first))
+
+        move_task(first, second)
+        with self.assertRaises(MoveError):
+            move_task(stale_second, stale_first)
+
+        first.refresh_from_db()
+        second.refresh_from_db()
+        self.assertEqual(first.path, second.path + first.pk.hex)
+        self.assertIsNone(second.parent_id)
+
+    def test_subtask_must_share_the_project(self):
+        root = self.create_task(title="Root")
+        other = Project.objects.create(name="Other", team=self.team)
+        response = self.client.post(
+            reverse("tasks"),
+            {"project": str(other.pk), "title": "Child", "parent": root},
+            format="json",
+        )
+        self.assertEqual(response.status_code, 400)
+
+
+class TaskImportTests(TaskTestCase):
+    def upload(self, name, content):
+        return self.client.post(
+            reverse("task-import"),
+            {
+                "project": str(self.project.pk),
+                "file": SimpleUploadedFile(name, content),
+            },
+            format="multipart",
+        )
+
+    def test_imports_valid_rows_and_reports_the_others(self):
+        content = (
+            "title,status,priority,due_date,assignee\n"
+            "Write docs,pending,low,2026-11-01,member@example.com\n"
+            ",pending,low,,\n"
+            "Ship it,done,high,,\n"
+            "Fix bug,completed,critical,,\n"
+        )
+        response = self.upload("tasks.csv", content.encode())
+
+        self.assertEqual(response.status_code, 201)
+        result = response.json()
+        self.assertEqual((result["imported"], result["failed"]), (2, 2))
+        self.assertEqual([error["line"] for error in result["errors"]], [3, 4])
+        task = Task.objects.get(title="Write docs")
+        self.assertEqual(task.assignee, self.member)
+        self.assertEqual(task.due_date, date(2026, 11, 1))
+        self.assertEqual(
+            self.get_project_counts(),
+            {"pending": 1, "in_progress": 0, "completed": 1},
+        )
+        self.assertEqual(verify_task_counters(), [])
+
+    def test_json_rows_are_validated(self):
+        response = self.upload("tasks.json", b'[{"title": 7}, {"title": "Ok"}]')
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(
+            response.json()["errors"],
+            [{"line": 1, "errors": {"title": ["Not a valid string."]}}],
+        )
+
+    def test_unreadable_files_are_rejected(self):
+        for name, content in [
+            ("tasks.csv", "title\ncaf\xe9\n".encode("latin-1")),
+            ("tasks.csv", b"name\nWrite docs\n"),
+            ("tasks.json", b"{"),
+            ("tasks.txt", b"title\n"),
+        ]:
+            with self.subTest(name=name, content=content):
+                response = self.upload(name, content)
+                self.assertEqual(response.status_code, 400)
+                self.assertIn("error", response.json())
+        self.assertFalse(Task.objects.exists())
+
+
+class TaskBulkUpdateTests(TaskTestCase):
+    def bulk_update(self, **data):
+        return self.client.patch(reverse("tasks-bulk"), data, format="json")
+
+    def test_updates_the_filtered_tasks(self):
+        pending = self.create_task(title="Pending")
+        started = self.create_task(title="Started", status=TaskStatus.IN_PROGRESS)
+        self.create_task(title="Done", status=TaskStatus.COMPLETED)
+
+        response = self.bulk_update(
+            filter={"project": str(self.project.pk), "is_open": True},
+            changes={"status": TaskStatus.COMPLETED},
+        )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()["updated"], 2)
+        self.assertCountEqual(response.json()["ids"], [pending, started])
+        self.assertEqual(
+            self.get_project_counts(),
+            {"pending": 0, "in_progress": 0, "completed": 3},
+        )
+        self.assertEqual(verify_task_counters(), [])
+
+    def test_updates_only_visible_tasks_by_id(self):
+        task = self.create_task(title="Mine")
+        other_team = Team.objects.create(name="Other", owner=self.member)
+        other = Task.objects.create(
+            project=Project.objects.create(name="Other", team=other_team),
+            title="Theirs",
+        )
+
+        response = self.bulk_update(
+            ids=[task, str(other.pk)], changes={"priority": TaskPriority.LOW}
+        )
+
+        self.assertEqual(response.json()["ids"], [task])
+        other.refresh_from_db()
+        self.assertNotEqual(other.priority, TaskPriority.LOW)
+
+    def test_rejects_unknown_and_empty_filters(self):
+        self.create_task(title="Task")
+        for selection in [{"bogus": "x"}, {"project": ""}, {}]:
+            with self.subTest(selection=selection):
+                response = self.bulk_update(
+                    filter=selection, changes={"priority": TaskPriority.LOW}
+                )
+                self.assertEqual(response.status_code, 400)
+                self.assertIn("filter", response.json())
+        self.assertFalse(Task.objects.filter(priority=TaskPriority.LOW).exists())
+
+    def test_assignee_must_be_a_member(self):
+        task = self.create_task(title="Task")
+        outsider = User.objects.create_user(
+            email="outsider@example.com", username="outsider", password="password"
+        )
+        response = self.bulk_update(ids=[task], changes={"assignee": str(outsider.pk)})
+        self.assertEqual(response.status_code, 400)
+
+
+class ScheduleTests(SimpleTestCase):
+    def test_follows_the_capacity_ratios(self):
+        members = [("a", 10, 0), ("b", 20, 0)]
+        assignments = schedule(range(30), members)
+        self.assertEqual(
+            [user_id for _, user_id in assignments[:6]], ["a", "b", "b", "a", "b", "b"]
+        )
+        self.assertEqual(
+            Counter(user_id for _, user_id in assignments), {"a": 10, "b": 20}
+        )
+
+    def test_ties_go_to_fewer_tasks_then_to_the_first_member(self):
+        # a and b are at the same ratio, b with fewer tasks
+        members = [("a", 4, 2), ("b", 2, 1), ("c", 4, 2)]
+        self.assertEqual(
+            [user_id for _, user_id in schedule(range(3), members)], ["b", "a", "c"]
+        )
+
+    def test_members_at_capacity_get_nothing(self):
+        members = [("a", 5, 5), ("b", 3, 0)]
+        self.assertEqual({user_id for _, user_id in schedule(range(3), members)}, {"b"})
+
+    def test_tasks_beyond_the_capacity_are_left(self):
+        members = [("a", 2, 1), ("b", 2, 0), ("c", 0, 0)]
+        assignments = schedule(["t1", "t2", "t3", "t4", "t5"], members)
+        self.assertEqual([task for task, _ in assignments], ["t1", "t2", "t3"])
+        self.assertEqual(schedule(["t1"], []), [])
+
+
+class TaskScheduleTests(TaskTestCase):
+    def assign(self, **data):
+        response = self.client.post(
+            reverse("task-schedule"),
+            {"project": str(self.project.pk), **data},
+            format="json",
+        )
+        self.assertEqual(response.status_code, 200, response.content)
+        return response.json()
+
+    def test_assigns_the_most_urgent_tasks_within_capacity(self):
+        TeamMember.objects.filter(user=self.member).update(capacity=2)
+        low = self.create_task(title="Low", priority=TaskPriority.LOW)
+        critical = self.create_task(title="Critical", priority=TaskPriority.CRITICAL)
+        due = self.create_task(
+            title="Due", priority=TaskPriority.LOW, due_date="2026-10-20"
+        )
+
+        result = self.assign(dry_run=True)
+        self.assertEqual(
+            [assignment["task"] for assignment in result["assignments"]],
+            [critical, due],
+        )
+        self.assertEqual(result["unassigned"], 1)
+        self.assertFalse(Task.objects.filter(assignee__isnull=False).exists())
+
+        result = self.assign()
+        self.assertEqual(result["assigned"], 2)
+        self.assertCountEqual(
+            Task.objects.filter(assignee=self.member).values_list("pk", flat=True),
+            [UUID(critical), UUID(due)],
+        )
+        self.assertIsNone(Task.objects.get(pk=low).assignee_id)
+        # The member is at capacity
+        self.assertEqual(self.assign()["assigned"], 0)
+
+
+class ScoreTasksTests(SimpleTestCase):
+    def score(self, *tasks):
+        """
+        Score tasks given as dicts of the COLUMNS other than the id, which is
+        the index of the task.
+        """
+        defaults = {
+            "priority": TaskPriority.MEDIUM,
+            "status": TaskStatus.PENDING,
+            "due_date": None,
+            "created_on": TODAY,
+            "fan_out": 0,
+        }
+        rows = [
+            (index, *{**defaults, **task}.values()) for index, task in enumerate(tasks)
+        ]
+        return score_tasks(tuple(zip(*rows)), TODAY)
+
+    def test_no_tasks(self):
+        self.assertEqual(score_tasks((), TODAY), ([], []))
+
+    def test_new_task_scores_its_priority(self):
+        self.assertEqual(self.score({}), ([0], [20.0]))
+
+    def test_overdue_tasks_outrank_tasks_without_due_date(self):
+        ids, scores = self.score(
+            {"priority": TaskPriority.HIGH},
+            {"due_date": date(2026, 10, 7)},
+            {"due_date": date(2026, 10, 21)},
+        )
+        self.assertEqual(ids, [1, 0, 2])
+        # Half the horizon overdue, and a week to go
+        self.assertEqual(scores, [65.0, 35.0, 35.0])
+
+    def test_fan_out_moves_the_rank(self):
+        ids, _ = self.score({}, {"fan_out": 3}, {"fan_out": 1})
+        self.assertEqual(ids, [1, 2, 0])
+
+    def test_started_tasks_then_older_tasks_come_first(self):
+        ids, _ = self.score(
+            {}, {"status": TaskStatus.IN_PROGRESS}, {"created_on": date(2026, 9, 29)}
+        )
+        self.assertEqual(ids, [1, 2, 0])
+
+    def test_equal_scores_keep_their_order(self):
+        ids, scores = self.score({}, {}, {"fan_out": 1}, {})
+        self.assertEqual(ids, [2, 0, 1, 3])
+        self.assertEqual(len(set(scores[1:])), 1)
+
+
+class TaskPriorityTests(TaskTestCase):
+    def get_ranking(self):
+        response = self.client.get(
+            reverse("task-priorities"), {"project": self.project.pk}
+        )
+        self.assertEqual(response.status_code, 200)
+        return [row["task"] for row in response.json()["results"]]
+
+    def test_ranking_follows_task_changes(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            low = self.create_task(title="Low", priority=TaskPriority.LOW)
+            high = self.create_task(title="High", priority=TaskPriority.HIGH)
+        self.assertEqual(self.get_ranking(), [high, low])
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.client.patch(
+                reverse("task-detail", args=[low]),
+                {"priority": TaskPriority.CRITICAL},
+                format="json",
+            )
+            self.client.patch(
+                reverse("task-detail", args=[high]),
+                {"status": TaskStatus.COMPLETED},
+                format="json",
+            )
+        self.assertEqual(self.get_ranking(), [low])
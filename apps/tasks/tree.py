@@ -0,0 +1,135 @@
+from uuid import UUID
+
+from django.db import transaction
+from django.db.models import Count, Max, Q, Value
+from django.db.models.functions import Concat, Length, Substr
+
+from apps.projects.models import Project
+from apps.tasks.models import Task
+from common.db import update_in_chunks
+from common.models import TaskStatus
+
+# Hex digits of a task id, the width of every path segment
+SEGMENT_LENGTH = 32
+MAX_DEPTH = Task._meta.get_field("path").max_length // SEGMENT_LENGTH
+
+
+class MoveError(ValueError):
+    pass
+
+
+def get_path(task_id, parent=None):
+    return (parent.path if parent is not None else "") + task_id.hex
+
+
+def get_depth(path):
+    """
+    Return the depth of a path, 1 for a root task.
+    """
+    return len(path) // SEGMENT_LENGTH
+
+
+def get_ancestor_ids(task):
+    """
+    Return the ids of a task's ancestors, from the root down to its parent,
+    read from its path without any query.
+    """
+    return [
+        UUID(hex=task.path[offset : offset + SEGMENT_LENGTH])
+        for offset in range(0, len(task.path) - SEGMENT_LENGTH, SEGMENT_LENGTH)
+    ]
+
+
+def get_ancestors(task):
+    """
+    Return a task's ancestors, from the root down to its parent.
+    """
+    ancestor_ids = get_ancestor_ids(task)
+    ancestors = Task.objects.in_bulk(ancestor_ids)
+    return [ancestors[pk] for pk in ancestor_ids if pk in ancestors]
+
+
+def get_descendants(queryset, task):
+    """
+    Narrow a task queryset to the task's descendants.
+    """
+    return queryset.filter(path__startswith=task.path).exclude(pk=task.pk)
+
+
+def get_subtree_progress(task):
+    """
+    Return the number of tasks and completed tasks in a task's subtree
+    (including the task itself) and the completion percentage.
+    """
+    progress = Task.objects.filter(path__startswith=task.path).aggregate(
+        total=Count("pk"),
+        completed=Count("pk", filter=Q(status=TaskStatus.COMPLETED)),
+    )
+    progress["percentage"] = round(
+        100 * progress["completed"] / progress["total"] if progress["total"] else 0,
+        2,
+    )
+    return progress
+
+
+def get_move_error(task, parent):
+    """
+    Return why ``task`` cannot be moved under ``parent``, or None.
+    """
+    if parent is None:
+        return None
+    if parent.project_id != task.project_id:
+        return "A subtask must belong to the same project as its parent."
+    if parent.path.startswith(task.path):
+        return "A task cannot be moved under itself or one of its subtasks."
+
+    # The deepest task of the subtree must stay within MAX_DEPTH
+    deepest = Task.objects.filter(path__startswith=task.path).aggregate(
+        length=Max(Length("path"))
+    )["length"]
+    subtree_depth = deepest // SEGMENT_LENGTH - get_depth(task.path) + 1
+    depth = get_depth(parent.path) + subtree_depth
+    if depth > MAX_DEPTH:
+        return f"Subtasks can be nested at most {MAX_DEPTH} levels deep."
+    return None
+
+
+def move_task(task, parent, chunk_size=1000):
+    """
+    Move a task and its subtree under ``parent`` (None for the top level).
+    Callers should check ``get_move_error()`` first; the check is repeated
+    under the lock and raises MoveError if a concurrent move made it fail.
+
+    The subtree's paths are rewritten by UPDATE statements of at most
+    ``chunk_size`` rows, without loading the tasks.
+    """
+    with transaction.atomic():
+        # Moves are serialized per project and the paths are re-read once the
+        # lock is held, so that two concurrent moves cannot create a loop
+        Project.objects.select_for_update().only("pk").get(pk=task.project_id)
+        paths = dict(
+            Task.objects.filter(
+                pk__in=[task.pk] + ([parent.pk] if parent is not None else [])
+            ).values_list("pk", "path")
+        )
+        if task.pk not in paths or (parent is not None and parent.pk not in paths):
+            raise MoveError("The task or its new parent no longer exists.")
+        task.path = paths[task.pk]
+        if parent is not None:
+            parent.path = paths[parent.pk]
+        error = get_move_error(task, parent)
+        if error:
+            raise MoveError(error)
+
+        old_path = task.path
+        new_path = get_path(task.pk, parent)
+        if new_path != old_path:
+            update_in_chunks(
+                Task.objects.filter(path__startswith=old_path),
+                chunk_size,
+                path=Concat(Value(new_path), Substr("path", len(old_path) + 1)),
+            )
+        task.parent = parent
+        task.path = new_path
+        task.save(update_fields=["parent", "path", "updated_at"])
+    return task
@@ -0,0 +1,43 @@
+from django.urls import path
+
+from apps.tasks.views import (
+    TaskAncestorsView,
+    TaskBulkView,
+    TaskDependencyDetailView,
+    TaskDependencyView,
+    TaskDetailView,
+    TaskGraphView,
+    TaskImportView,
+    TaskParseView,
+    TaskPriorityView,
+    TaskProgressView,
+    TaskScheduleView,
+    TaskStatsView,
+    TaskSubtasksView,
+    TaskView,
+)
+
+urlpatterns = [
+    path("", TaskView.as_view(), name="tasks"),
+    path("bulk/", TaskBulkView.as_view(), name="tasks-bulk"),
+    path("stats/", TaskStatsView.as_view(), name="task-stats"),
+    path("graph/", TaskGraphView.as_view(), name="task-graph"),
+    path("priorities/", TaskPriorityView.as_view(), name="task-priorities"),
+    path("import/", TaskImportView.as_view(), name="task-import"),
+    path("parse/", TaskParseView.as_view(), name="task-parse"),
+    path("schedule/", TaskScheduleView.as_view(), name="task-schedule"),
+    path("<uuid:pk>/", TaskDetailView.as_view(), name="task-detail"),
+    path("<uuid:pk>/subtasks/", TaskSubtasksView.as_view(), name="task-subtasks"),
+    path("<uuid:pk>/ancestors/", TaskAncestorsView.as_view(), name="task-ancestors"),
+    path("<uuid:pk>/progress/", TaskProgressView.as_view(), name="task-progress"),
+    path(
+        "<uuid:pk>/dependencies/",
+        TaskDependencyView.as_view(),
+        name="task-dependencies",
+    ),
+    path(
+        "<uuid:pk>/dependencies/<uuid:depends_on>/",
+        TaskDependencyDetailView.as_view(),
+        name="task-dependency-detail",
+    ),
+]
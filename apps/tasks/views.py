@@ -1,3 +1,872 @@
-from django.shortcuts import render
+from django.http import QueryDict
+from django_filters.utils import translate_validation
+from drf_yasg import openapi
+from drf_yasg.utils import swagger_auto_schema
+from rest_framework import status
+from rest_framework.parsers import MultiPartParser
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.response import Response
+from rest_framework.views import APIView
 
-# Create your views here.
+from apps.projects.models import Project
+from apps.tasks.bulk import update_tasks
+from apps.tasks.counters import get_task_counts
+from apps.tasks.filters import TaskFilter
+from apps.tasks.graph import (
+    CycleError,
+    add_task_dependency,
+    get_open_task_ids,
+    get_task_graph,
+)
+from apps.tasks.imports import (
+    ImportFormatError,
+    TaskImporter,
+    get_import_format,
+    read_rows,
+)
+from apps.tasks.models import ProjectTaskCounter, Task, TaskDependency, TeamTaskCounter
+from apps.tasks.paginations import TaskCursorPagination, TaskPagination
+from apps.tasks.parsing import TaskModelError, TaskTextImporter, parse_tasks
+from apps.tasks.scheduling import assign_tasks
+from apps.tasks.scoring import get_task_scores
+from apps.tasks.serializers import (
+    TaskBulkUpdateResultSerializer,
+    TaskBulkUpdateSerializer,
+    TaskCreateSerializer,
+    TaskDependencySerializer,
+    TaskGraphSerializer,
+    TaskImportResultSerializer,
+    TaskImportSerializer,
+    TaskListSerializer,
+    TaskParseResultSerializer,
+    TaskParseSerializer,
+    TaskPrioritySerializer,
+    TaskProgressSerializer,
+    TaskScheduleResultSerializer,
+    TaskScheduleSerializer,
+    TaskSerializer,
+    TaskStatsSerializer,
+    TaskUpdateSerializer,
+)
+from apps.tasks.tree import get_ancestors, get_descendants, get_subtree_progress
+from apps.teams.access import TeamAccessResolver, get_team_access
+from common.fast_serializers import get_compiled_serializer
+
+
+def get_query_parameter(name, description, type=openapi.TYPE_STRING, **kwargs):
+    return openapi.Parameter(
+        name, openapi.IN_QUERY, description=description, type=type, **kwargs
+    )
+
+
+class TaskView(APIView):
+    permission_classes = [IsAuthenticated]
+    serializer_class = TaskSerializer
+    pagination_class = TaskPagination
+    cursor_pagination_class = TaskCursorPagination
+    filter_class = TaskFilter
+
+    @swagger_auto_schema(
+        tags=["Tasks"],
+        operation_description=(
+            "List the tasks of your teams' projects, filtered by project, status, "
+            "priority, due date and assignee. Pass pagination=cursor for keyset "
+            "pagination (newest first)."
+        ),
+        manual_parameters=[
+            get_query_parameter("project", "Project ID", format=openapi.FORMAT_UUID),
+            get_query_parameter(
+                "status",
+                "Task status, repeat the parameter to match several",
+                enum=["pending", "in_progress", "completed"],
+            ),
+            get_query_parameter(
+                "priority",
+                "Task priority, repeat the parameter to match several",
+                enum=["low", "medium", "high", "critical"],
+            ),
+            get_query_parameter(
+                "due_date", "Due on this date", format=openapi.FORMAT_DATE
+            ),
+            get_query_parameter(
+                "due_before", "Due on or before this date", format=openapi.FORMAT_DATE
+            ),
+            get_query_parameter(
+                "due_after", "Due on or after this date", format=openapi.FORMAT_DATE
+            ),
+            get_query_parameter(
+                "assignee", "Assigned user ID", format=openapi.FORMAT_UUID
+            ),
+            get_query_parameter(
+                "parent", "Parent task ID (direct subtasks)", format=openapi.FORMAT_UUID
+            ),
+            get_query_parameter(
+                "is_root",
+                "Only top-level tasks (or only subtasks)",
+                openapi.TYPE_BOOLEAN,
+            ),
+            get_query_parameter(
+                "is_open", "Only tasks that are (not) completed", openapi.TYPE_BOOLEAN
+            ),
+            get_query_parameter(
+                "ordering",
+                "Sort order (page mode)",
+                enum=["created_at", "-created_at", "due_date", "-due_date"],
+            ),
+            get_query_parameter("page", "Page number", openapi.TYPE_INTEGER),
+            get_query_parameter(
+                "page_size", "Number of tasks per page (max 100)", openapi.TYPE_INTEGER
+            ),
+            get_query_parameter(
+                "pagination",
+                "Pagination mode: 'page' (default) or 'cursor'",
+                enum=["page", "cursor"],
+            ),
+            get_query_parameter(
+                "cursor",
+                "Opaque cursor from a previous next/previous link (cursor mode)",
+            ),
+            get_query_parameter("fields", "Comma-separated list of fields to return"),
+            get_query_parameter("omit", "Comma-separated list of fields to leave out"),
+        ],
+        responses={
+            200: TaskListSerializer,
+            400: "Bad Request - Invalid filter value",
+            401: "Unauthorized - Authentication credentials were not provided",
+        },
+    )
+    def get(self, request):
+        field_params = self.serializer_class.get_field_params(request)
+        reader = get_compiled_serializer(self.serializer_class, **field_params)
+
+        tasks = get_team_access(request).filter_by_team(
+            Task.objects.all(), lookup="project__team"
+        )
+        tasks = tasks.order_by("-created_at", "-id").values(
+            *{*reader.value_names, "created_at", "id"}
+        )
+
+        filter_set = self.filter_class(request.GET, queryset=tasks)
+        if not filter_set.is_valid():
+            return Response(
+                translate_validation(filter_set.errors).detail,
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        tasks = filter_set.qs
+
+        paginator = self.get_paginator(request)
+        paginated_tasks = paginator.paginate_queryset(tasks, request)
+        return paginator.get_paginated_response(reader.serialize(paginated_tasks))
+
+    def get_paginator(self, request):
+        if (
+            request.GET.get("pagination") == "cursor"
+            or self.cursor_pagination_class.cursor_query_param in request.GET
+        ):
+            return self.cursor_pagination_class()
+        return self.pagination_class()
+
+    @swagger_auto_schema(
+        tags=["Tasks"],
+        operation_description="Create a task in a project of one of your teams",
+        request_body=TaskCreateSerializer,
+        responses={
+            201: TaskSerializer,
+            400: "Bad Request - Invalid input data",
+            401: "Unauthorized - Authentication credentials were not provided",
+        },
+    )
+    def post(self, request):
+        serializer = TaskCreateSerializer(
+            data=request.data, context={"access": get_team_access(request)}
+        )
+        if serializer.is_valid():
+            task = serializer.save(created_by=request.user)
+            return Response(TaskSerializer(task).data, status=status.HTTP_201_CREATED)
+        return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+
+
+class TaskStatsView(APIView):
+    permission_classes = [IsAuthenticated]
+
+    @swagger_auto_schema(
+        tags=["Tasks"],
+        operation_description=(
+            "Get the number of tasks per status in a project or a team, read "
+            "from incrementally maintained counters"
+        ),
+        manual_parameters=[
+            get_query_parameter("project", "Project ID", format=openapi.FORMAT_UUID),
+            get_query_parameter("team", "Team ID", format=openapi.FORMAT_UUID),
+        ],
+        responses={
+            200: TaskStatsSerializer,
+            400: "Bad Request - Pass exactly one of project or team",
+            401: "Unauthorized - Authentication credentials were not provided",
+            404: "Not Found - Project or team not found or you don't have permission to access it",
+        },
+    )
+    def get(self, request):
+        serializer = TaskStatsSerializer(data=request.query_params)
+        if not serializer.is_valid():
+            return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+
+        access = get_team_access(request)
+        project_id = serializer.validated_data.get("project")
+        if project_id is not None:
+            team_id = (
+                Project.objects.filter(pk=project_id)
+                .values_list("team_id", flat=True)
+                .first()
+            )
+            if team_id is None or not access.can_view(team_id):
+                return Response(
+                    {
+                        "error": "Project not found or you don't have permission to access it"
+                    },
+                    status=status.HTTP_404_NOT_FOUND,
+                )
+            counts = get_task_counts(ProjectTaskCounter, project_id=project_id)
+        else:
+            team_id = serializer.validated_data["team"]
+            if not access.can_view(team_id):
+                return Response(
+                    {
+                        "error": "Team not found or you don't have permission to access it"
+                    },
+                    status=status.HTTP_404_NOT_FOUND,
+                )
+            counts = get_task_counts(TeamTaskCounter, team_id=team_id)
+
+        return Response(
+            {**serializer.data, "counts": counts, "total": sum(counts.values())},
+            status=status.HTTP_200_OK,
+        )
+
+
+class TaskBulkView(APIView):
+    permission_classes = [IsAuthenticated]
+    filter_class = TaskFilter
+
+    @swagger_auto_schema(
+        tags=["Tasks"],
+        operation_description=(
+            "Change the status, priority, due date or assignee of many tasks "
+            "of your teams' projects with a single UPDATE. Tasks are selected "
+            "by id or with the filters of the task list."
+        ),
+        request_body=TaskBulkUpdateSerializer,
+        responses={
+            200: TaskBulkUpdateResultSerializer,
+            400: "Bad Request - Invalid selection, filter or changes",
+            401: "Unauthorized - Authentication credentials were not provided",
+        },
+    )
+    def patch(self, request):
+        serializer = TaskBulkUpdateSerializer(data=request.data)
+        if not serializer.is_valid():
+            return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+
+        tasks = get_team_access(request).filter_by_team(
+            Task.objects.all(), lookup="project__team"
+        )
+        if "ids" in serializer.validated_data:
+            tasks = tasks.filter(pk__in=serializer.validated_data["ids"])
+        else:
+            data = QueryDict(mutable=True)
+            for name, value in serializer.validated_data["filter"].items():
+                data.setlist(name, value if isinstance(value, list) else [value])
+            filter_set = self.filter_class(data, queryset=tasks)
+            if not filter_set.is_valid():
+                return Response(
+                    {"filter": translate_validation(filter_set.errors).detail},
+                    status=status.HTTP_400_BAD_REQUEST,
+                )
+            tasks = filter_set.qs
+
+        changes = serializer.validated_data["changes"]
+        assignee = changes.get("assignee")
+        if assignee is not None:
+            resolver = TeamAccessResolver(assignee)
+            team_ids = tasks.order_by().values_list("project__team_id", flat=True)
+            if not all(resolver.can_view(team_id) for team_id in team_ids.distinct()):
+                return Response(
+                    {
+                        "changes": {
+                            "assignee": [
+                                "The assignee must be a member of the project's team"
+                            ]
+                        }
+                    },
+                    status=status.HTTP_400_BAD_REQUEST,
+                )
+
+        ids = update_tasks(tasks, changes)
+        return Response({"updated": len(ids), "ids": ids}, status=status.HTTP_200_OK)
+
+
+class TaskImportView(APIView):
+    permission_classes = [IsAuthenticated]
+    parser_classes = [MultiPartParser]
+
+    @swagger_auto_schema(
+        tags=["Tasks"],
+        operation_description=(
+            "Import tasks into a project from a CSV, NDJSON or JSON file with "
+            "title, description, status, priority, due_date and assignee "
+            "(email) columns. Valid rows are created in one transaction and "
+            "invalid rows are reported by line. Requires owner or admin role."
+        ),
+        request_body=TaskImportSerializer,
+        responses={
+            201: TaskImportResultSerializer,
+            400: "Bad Request - Invalid project, file or format",
+            401: "Unauthorized - Authentication credentials were not provided",
+        },
+    )
+    def post(self, request):
+        serializer = TaskImportSerializer(
+            data=request.data, context={"access": get_team_access(request)}
+        )
+        if not serializer.is_valid():
+            return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+
+        upload = serializer.validated_data["file"]
+        try:
+            format = get_import_format(
+                upload.name, serializer.validated_data.get("format")
+            )
+            result = TaskImporter(
+                serializer.validated_data["project"], created_by=request.user
+            ).run(read_rows(upload.file, format))
+        except ImportFormatError as exc:
+            return Response({"error": str(exc)}, status=status.HTTP_400_BAD_REQUEST)
+        return Response(result, status=status.HTTP_201_CREATED)
+
+
+class TaskParseView(APIView):
+    permission_classes = [IsAuthenticated]
+
+    @swagger_auto_schema(
+        tags=["Tasks"],
+        operation_description=(
+            'Create tasks in a project from lines of text such as "fix login '
+            'bug high priority by friday @alice": the priority, due date, '
+            'assignee (@username, or an email after "assign to" or "for") '
+            "and checkbox status are read from each line and the rest "
+            "becomes the title. Valid lines are created together and "
+            "invalid lines are reported by line."
+        ),
+        request_body=TaskParseSerializer,
+        responses={
+            201: TaskParseResultSerializer,
+            400: "Bad Request - Invalid project or too many lines",
+            401: "Unauthorized - Authentication credentials were not provided",
+            502: "Bad Gateway - The task model returned an unusable result",
+        },
+    )
+    def post(self, request):
+        serializer = TaskParseSerializer(
+            data=request.data, context={"access": get_team_access(request)}
+        )
+        if not serializer.is_valid():
+            return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+
+        importer = TaskTextImporter(
+            serializer.validated_data["project"], created_by=request.user
+        )
+        try:
+            rows = parse_tasks(importer.get_parser(), serializer.validated_data["text"])
+        except TaskModelError as exc:
+            return Response({"error": str(exc)}, status=status.HTTP_502_BAD_GATEWAY)
+        result = importer.run(rows)
+        return Response(
+            {
+                "created": TaskSerializer(importer.created, many=True).data,
+                "failed": result["failed"],
+                "errors": result["errors"],
+            },
+            status=status.HTTP_201_CREATED,
+        )
+
+
+class TaskDetailView(APIView):
+    permission_classes = [IsAuthenticated]
+
+    @swagger_auto_schema(
+        tags=["Tasks"],
+        operation_description="Get a specific task by ID",
+        responses={
+            200: TaskSerializer,
+            401: "Unauthorized - Authentication credentials were not provided",
+            404: "Not Found - Task not found or you don't have permission to access it",
+        },
+    )
+    def get(self, request, pk):
+        task = get_task(request, pk)
+        if task is None:
+            return Response(
+                {"error": "Task not found or you don't have permission to access it"},
+                status=status.HTTP_404_NOT_FOUND,
+            )
+        return Response(TaskSerializer(task).data, status=status.HTTP_200_OK)
+
+    @swagger_auto_schema(
+        tags=["Tasks"],
+        operation_description="Update a specific task (full update)",
+        request_body=TaskUpdateSerializer,
+        responses={
+            200: TaskSerializer,
+            400: "Bad Request - Invalid input data",
+            401: "Unauthorized - Authentication credentials were not provided",
+            404: "Not Found - Task not found or you don't have permission to update it",
+        },
+    )
+    def put(self, request, pk):
+        return self.update(request, pk, partial=False)
+
+    @swagger_auto_schema(
+        tags=["Tasks"],
+        operation_description="Update a specific task (partial update)",
+        request_body=TaskUpdateSerializer,
+        responses={
+            200: TaskSerializer,
+            400: "Bad Request - Invalid input data",
+            401: "Unauthorized - Authentication credentials were not provided",
+            404: "Not Found - Task not found or you don't have permission to update it",
+        },
+    )
+    def patch(self, request, pk):
+        return self.update(request, pk, partial=True)
+
+    @swagger_auto_schema(
+        tags=["Tasks"],
+        operation_description=(
+            "Delete a specific task (its creator or a team owner/admin only)"
+        ),
+        responses={
+            204: "No Content - Task successfully deleted",
+            401: "Unauthorized - Authentication credentials were not provided",
+            404: "Not Found - Task not found or you don't have permission to delete it",
+        },
+    )
+    def delete(self, request, pk):
+        task = get_task(request, pk)
+        if task is None or not (
+            task.created_by_id == request.user.pk
+            or get_team_access(request).can_manage(task.project.team_id)
+        ):
+            return Response(
+                {"error": "Task not found or you don't have permission to delete it"},
+                status=status.HTTP_404_NOT_FOUND,
+            )
+
+        task.delete()
+        return Response(status=status.HTTP_204_NO_CONTENT)
+
+    def update(self, request, pk, partial):
+        task = get_task(request, pk)
+        if task is None:
+            return Response(
+                {"error": "Task not found or you don't have permission to update it"},
+                status=status.HTTP_404_NOT_FOUND,
+            )
+
+        serializer = TaskUpdateSerializer(
+            task,
+            data=request.data,
+            partial=partial,
+            context={"access": get_team_access(request)},
+        )
+        if serializer.is_valid():
+            task = serializer.save()
+            return Response(TaskSerializer(task).data, status=status.HTTP_200_OK)
+        return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+
+
+class TaskDependencyView(APIView):
+    permission_classes = [IsAuthenticated]
+
+    @swagger_auto_schema(
+        tags=["Tasks"],
+        operation_description="List the tasks a task depends on",
+        responses={
+            200: TaskSerializer(many=True),
+            401: "Unauthorized - Authentication credentials were not provided",
+            404: "Not Found - Task not found or you don't have permission to access it",
+        },
+    )
+    def get(self, request, pk):
+        task = get_task(request, pk)
+        if task is None:
+            return Response(
+                {"error": "Task not found or you don't have permission to access it"},
+                status=status.HTTP_404_NOT_FOUND,
+            )
+        dependencies = Task.objects.filter(dependents__task=task).order_by(
+            "-created_at", "-id"
+        )
+        return Response(
+            TaskSerializer(dependencies, many=True).data, status=status.HTTP_200_OK
+        )
+
+    @swagger_auto_schema(
+        tags=["Tasks"],
+        operation_description=(
+            "Make a task depend on another task of the same project. "
+            "Dependencies that would create a cycle are rejected."
+        ),
+        request_body=TaskDependencySerializer,
+        responses={
+            201: TaskDependencySerializer,
+            200: "OK - The dependency already exists",
+            400: "Bad Request - Invalid input data or the dependency would create a cycle",
+            401: "Unauthorized - Authentication credentials were not provided",
+            404: "Not Found - Task not found or you don't have permission to update it",
+        },
+    )
+    def post(self, request, pk):
+        task = get_task(request, pk)
+        if task is None:
+            return Response(
+                {"error": "Task not found or you don't have permission to update it"},
+                status=status.HTTP_404_NOT_FOUND,
+            )
+
+        serializer = TaskDependencySerializer(data=request.data, context={"task": task})
+        if not serializer.is_valid():
+            return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+
+        try:
+            dependency, created = add_task_dependency(
+                task, serializer.validated_data["depends_on"]
+            )
+        except CycleError:
+            return Response(
+                {"depends_on": ["This dependency would create a cycle."]},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        return Response(
+            TaskDependencySerializer(dependency).data,
+            status=status.HTTP_201_CREATED if created else status.HTTP_200_OK,
+        )
+
+
+class TaskDependencyDetailView(APIView):
+    permission_classes = [IsAuthenticated]
+
+    @swagger_auto_schema(
+        tags=["Tasks"],
+        operation_description="Remove a dependency from a task",
+        responses={
+            204: "No Content - Dependency successfully removed",
+            401: "Unauthorized - Authentication credentials were not provided",
+            404: "Not Found - Dependency not found or you don't have permission to remove it",
+        },
+    )
+    def delete(self, request, pk, depends_on):
+        task = get_task(request, pk)
+        dependency = (
+            TaskDependency.objects.filter(task=task, depends_on=depends_on).first()
+            if task is not None
+            else None
+        )
+        if dependency is None:
+            return Response(
+                {
+                    "error": "Dependency not found or you don't have permission to remove it"
+                },
+                status=status.HTTP_404_NOT_FOUND,
+            )
+
+        dependency.delete()
+        return Response(status=status.HTTP_204_NO_CONTENT)
+
+
+class TaskGraphView(APIView):
+    permission_classes = [IsAuthenticated]
+
+    @swagger_auto_schema(
+        tags=["Tasks"],
+        operation_description=(
+            "Analyse a project's task dependencies: topological order, blocked "
+            "tasks and critical path, computed from a cached graph"
+        ),
+        manual_parameters=[
+            get_query_parameter(
+                "project", "Project ID", format=openapi.FORMAT_UUID, required=True
+            ),
+        ],
+        responses={
+            200: TaskGraphSerializer,
+            400: "Bad Request - Missing or invalid project",
+            401: "Unauthorized - Authentication credentials were not provided",
+            404: "Not Found - Project not found or you don't have permission to access it",
+        },
+    )
+    def get(self, request):
+        serializer = TaskGraphSerializer(data=request.query_params)
+        if not serializer.is_valid():
+            return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+
+        project_id = serializer.validated_data["project"]
+        team_id = (
+            Project.objects.filter(pk=project_id)
+            .values_list("team_id", flat=True)
+            .first()
+        )
+        if team_id is None or not get_team_access(request).can_view(team_id):
+            return Response(
+                {
+                    "error": "Project not found or you don't have permission to access it"
+                },
+                status=status.HTTP_404_NOT_FOUND,
+            )
+
+        graph = get_task_graph(project_id)
+        open_ids = get_open_task_ids(project_id)
+        try:
+            order = graph.topological_order()
+            critical_path = graph.critical_path(open_ids)
+            cycle = None
+        except CycleError as error:
+            order = critical_path = None
+            cycle = error.cycle
+
+        return Response(
+            {
+                "project": project_id,
+                "order": order,
+                "blocked": graph.blocked(open_ids),
+                "critical_path": critical_path,
+                "cycle": cycle,
+            },
+            status=status.HTTP_200_OK,
+        )
+
+
+class TaskPriorityView(APIView):
+    permission_classes = [IsAuthenticated]
+
+    @swagger_auto_schema(
+        tags=["Tasks"],
+        operation_description=(
+            "Rank a project's open tasks by urgency, scored from their "
+            "priority, due date, status, age and the number of open tasks "
+            "waiting for them. Scores are cached until the project's tasks "
+            "change."
+        ),
+        manual_parameters=[
+            get_query_parameter(
+                "project", "Project ID", format=openapi.FORMAT_UUID, required=True
+            ),
+            get_query_parameter(
+                "limit",
+                "Number of tasks (default 50, max 500)",
+                openapi.TYPE_INTEGER,
+            ),
+        ],
+        responses={
+            200: TaskPrioritySerializer,
+            400: "Bad Request - Missing or invalid project",
+            401: "Unauthorized - Authentication credentials were not provided",
+            404: "Not Found - Project not found or you don't have permission to access it",
+        },
+    )
+    def get(self, request):
+        serializer = TaskPrioritySerializer(data=request.query_params)
+        if not serializer.is_valid():
+            return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+
+        project_id = serializer.validated_data["project"]
+        team_id = (
+            Project.objects.filter(pk=project_id)
+            .values_list("team_id", flat=True)
+            .first()
+        )
+        if team_id is None or not get_team_access(request).can_view(team_id):
+            return Response(
+                {
+                    "error": "Project not found or you don't have permission to access it"
+                },
+                status=status.HTTP_404_NOT_FOUND,
+            )
+
+        scores = get_task_scores(project_id, serializer.validated_data["limit"])
+        return Response(
+            {
+                **serializer.data,
+                "results": [
+                    {"task": task_id, "score": score} for task_id, score in scores
+                ],
+            },
+            status=status.HTTP_200_OK,
+        )
+
+
+class TaskScheduleView(APIView):
+    permission_classes = [IsAuthenticated]
+
+    @swagger_auto_schema(
+        tags=["Tasks"],
+        operation_description=(
+            "Assign a project's or team's unassigned open tasks to the team's "
+            "members, most urgent (priority, then due date) first, each to "
+            "the member with the lowest load relative to their capacity. "
+            "Requires owner or admin role."
+        ),
+        request_body=TaskScheduleSerializer,
+        responses={
+            200: TaskScheduleResultSerializer,
+            400: "Bad Request - Pass exactly one of project or team",
+            401: "Unauthorized - Authentication credentials were not provided",
+            404: "Not Found - Project or team not found or you don't have permission to manage it",
+        },
+    )
+    def post(self, request):
+        serializer = TaskScheduleSerializer(data=request.data)
+        if not serializer.is_valid():
+            return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+        params = serializer.validated_data
+
+        if "project" in params:
+            team_id = (
+                Project.objects.filter(pk=params["project"])
+                .values_list("team_id", flat=True)
+                .first()
+            )
+            tasks = Task.objects.filter(project_id=params["project"])
+            name = "Project"
+        else:
+            team_id = params["team"]
+            tasks = Task.objects.filter(project__team_id=team_id)
+            name = "Team"
+        if team_id is None or not get_team_access(request).can_manage(team_id):
+            return Response(
+                {
+                    "error": f"{name} not found or you don't have permission to manage it"
+                },
+                status=status.HTTP_404_NOT_FOUND,
+            )
+
+        assignments, unassigned = assign_tasks(
+            team_id, tasks, params["limit"], dry_run=params["dry_run"]
+        )
+        return Response(
+            {
+                "assigned": len(assignments),
+                "unassigned": unassigned,
+                "assignments": [
+                    {"task": task.pk, "assignee": user_id}
+                    for task, user_id in assignments
+                ],
+            },
+            status=status.HTTP_200_OK,
+        )
+
+
+class TaskSubtasksView(APIView):
+    permission_classes = [IsAuthenticated]
+    serializer_class = TaskSerializer
+    pagination_class = TaskPagination
+
+    @swagger_auto_schema(
+        tags=["Tasks"],
+        operation_description=(
+            "List all subtasks of a task at any depth, parents before their "
+            "subtasks, with a single path prefix query"
+        ),
+        manual_parameters=[
+            get_query_parameter("page", "Page number", openapi.TYPE_INTEGER),
+            get_query_parameter(
+                "page_size", "Number of tasks per page (max 100)", openapi.TYPE_INTEGER
+            ),
+            get_query_parameter("fields", "Comma-separated list of fields to return"),
+            get_query_parameter("omit", "Comma-separated list of fields to leave out"),
+        ],
+        responses={
+            200: TaskListSerializer,
+            401: "Unauthorized - Authentication credentials were not provided",
+            404: "Not Found - Task not found or you don't have permission to access it",
+        },
+    )
+    def get(self, request, pk):
+        task = get_task(request, pk)
+        if task is None:
+            return Response(
+                {"error": "Task not found or you don't have permission to access it"},
+                status=status.HTTP_404_NOT_FOUND,
+            )
+
+        field_params = self.serializer_class.get_field_params(request)
+        reader = get_compiled_serializer(self.serializer_class, **field_params)
+        # Ordering by path lists the subtree depth-first
+        subtasks = (
+            get_descendants(Task.objects.all(), task)
+            .order_by("path")
+            .values(*reader.value_names)
+        )
+
+        paginator = self.pagination_class()
+        paginated_subtasks = paginator.paginate_queryset(subtasks, request)
+        return paginator.get_paginated_response(reader.serialize(paginated_subtasks))
+
+
+class TaskAncestorsView(APIView):
+    permission_classes = [IsAuthenticated]
+
+    @swagger_auto_schema(
+        tags=["Tasks"],
+        operation_description="List the parents of a task, from the top-level task down",
+        responses={
+            200: TaskSerializer(many=True),
+            401: "Unauthorized - Authentication credentials were not provided",
+            404: "Not Found - Task not found or you don't have permission to access it",
+        },
+    )
+    def get(self, request, pk):
+        task = get_task(request, pk)
+        if task is None:
+            return Response(
+                {"error": "Task not found or you don't have permission to access it"},
+                status=status.HTTP_404_NOT_FOUND,
+            )
+        return Response(
+            TaskSerializer(get_ancestors(task), many=True).data,
+            status=status.HTTP_200_OK,
+        )
+
+
+class TaskProgressView(APIView):
+    permission_classes = [IsAuthenticated]
+
+    @swagger_auto_schema(
+        tags=["Tasks"],
+        operation_description=(
+            "Get the completion of a task and all of its subtasks, "
+            "aggregated in a single query"
+        ),
+        responses={
+            200: TaskProgressSerializer,
+            401: "Unauthorized - Authentication credentials were not provided",
+            404: "Not Found - Task not found or you don't have permission to access it",
+        },
+    )
+    def get(self, request, pk):
+        task = get_task(request, pk)
+        if task is None:
+            return Response(
+                {"error": "Task not found or you don't have permission to access it"},
+                status=status.HTTP_404_NOT_FOUND,
+            )
+        return Response(get_subtree_progress(task), status=status.HTTP_200_OK)
+
+
+def get_task(request, pk):
+    """
+    Return the task if it belongs to one of the user's teams, otherwise None.
+    """
+    tasks = get_team_access(request).filter_by_team(
+        Task.objects.filter(pk=pk), lookup="project__team"
+    )
+    return tasks.select_related("project").first()
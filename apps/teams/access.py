@@ -0,0 +1,90 @@
+from django.db.models import Q
+
+from apps.teams.cache import team_cache
+from apps.teams.models import Team, TeamMember
+from common.models import TeamRole
+
+OWNER = "owner"
+
+# Roles allowed to modify a team, in addition to its owner
+MANAGER_ROLES = {OWNER, TeamRole.ADMIN}
+
+
+class TeamAccessResolver:
+    """
+    Resolves the teams a user can access and the user's role in each.
+
+    The ``{team_id: role}`` map is loaded at most once per request and is
+    shared between requests through the team cache, whose per-user version
+    is bumped whenever the user's teams or memberships change. Querysets are
+    then narrowed in SQL with the resolved ids instead of per-object checks.
+    """
+
+    def __init__(self, user):
+        self.user = user
+        self._roles = None
+
+    @property
+    def roles(self):
+        if self._roles is None:
+            self._roles = team_cache.get_or_set(self.user.pk, "access", self.load_roles)
+        return self._roles
+
+    def load_roles(self):
+        roles = dict(
+            TeamMember.objects.filter(
+                user=self.user, team__is_deleting=False
+            ).values_list("team_id", "role")
+        )
+        roles.update(
+            (team_id, OWNER)
+            for team_id in Team.objects.filter(
+                owner=self.user, is_deleting=False
+            ).values_list("id", flat=True)
+        )
+        return roles
+
+    @property
+    def team_ids(self):
+        return list(self.roles)
+
+    def get_role(self, team_id):
+        return self.roles.get(team_id)
+
+    def can_view(self, team_id):
+        return team_id in self.roles
+
+    def can_manage(self, team_id):
+        return self.roles.get(team_id) in MANAGER_ROLES
+
+    def is_owner(self, team_id):
+        return self.roles.get(team_id) == OWNER
+
+    def filter_teams(self, queryset):
+        # Owned teams go through the (owner, created_at, id) index; only the
+        # teams joined as a member are listed by id.
+        member_team_ids = [
+            team_id for team_id, role in self.roles.items() if role != OWNER
+        ]
+        owned = Q(owner=self.user, is_deleting=False)
+        if not member_team_ids:
+            return queryset.filter(owned)
+        return queryset.filter(owned | Q(pk__in=member_team_ids))
+
+    def filter_by_team(self, queryset, lookup="team"):
+        """
+        Narrow a queryset of team-scoped objects (projects, tasks, ...) to the
+        teams the user can access.
+        """
+        return queryset.filter(**{f"{lookup}__in": self.team_ids})
+
+
+def get_team_access(request):
+    """
+    Return the request's TeamAccessResolver, creating it on first use.
+    """
+    access = getattr(request, "_team_access", None)
+    if access is None:
+        access = TeamAccessResolver(request.user)
+        request._team_access = access
+    return access
@@ -1,17 +1,24 @@
 from django.contrib import admin
 
 from apps.teams.models import Team, TeamMember
+from common.admin import EstimatedCountAdminMixin
 
 
-class TeamAdmin(admin.ModelAdmin):
+class TeamAdmin(EstimatedCountAdminMixin, admin.ModelAdmin):
     list_display = ("id", "name", "owner")
-    search_fields = ("name", "owner")
+    list_select_related = ("owner",)
+    # Served by the UPPER(email) index of the users table
+    search_fields = ("name", "^owner__email")
+    raw_id_fields = ("owner",)
     list_per_page = 10
+    list_filter = ("is_deleting",)
 
 
-class TeamMemberAdmin(admin.ModelAdmin):
-    list_display = ("id", "user", "team", "role")
-    search_fields = ("user", "team", "role")
+class TeamMemberAdmin(EstimatedCountAdminMixin, admin.ModelAdmin):
+    list_display = ("id", "user", "team", "role", "capacity")
+    list_select_related = ("user", "team")
+    search_fields = ("^user__email", "team__name")
+    raw_id_fields = ("user", "team")
     list_per_page = 10
     list_filter = ("team", "role")
 
@@ -0,0 +1,23 @@
+from django.conf import settings
+
+from common.cache import VersionedCache
+
+# Team list and detail responses and access maps, scoped by the id of the
+# requesting user
+team_cache = VersionedCache("teams", timeout=settings.CACHE_TIMEOUT)
+
+
+def invalidate_team_cache(*user_ids):
+    team_cache.bump(*user_ids)
+
+
+def invalidate_team_viewers(team_ids, *user_ids):
+    """
+    Invalidate the given users and every member of the given teams.
+    """
+    from apps.teams.models import TeamMember
+
+    member_ids = TeamMember.objects.filter(team_id__in=team_ids).values_list(
+        "user_id", flat=True
+    )
+    invalidate_team_cache(*user_ids, *member_ids)
@@ -0,0 +1,70 @@
+from django.conf import settings
+from django.db import transaction
+from django.db.models.functions import Length
+
+from apps.activity.models import Activity
+from apps.projects.models import Project
+from apps.tasks.models import (
+    ProjectTaskCounter,
+    Task,
+    TaskDependency,
+    TeamTaskCounter,
+)
+from apps.teams.cache import invalidate_team_cache
+from apps.teams.models import Team, TeamMember
+from apps.worklogs.models import WorkLog, WorkLogDay, WorkLogWeek
+from common.db import delete_in_chunks
+
+# Rows owned by a team, deleted in this order (children before parents),
+# with the order of the rows within a table
+TEAM_DESCENDANTS = [
+    (Activity, "team", ()),
+    (WorkLog, "project__team", ()),
+    (WorkLogDay, "project__team", ()),
+    (WorkLogWeek, "project__team", ()),
+    (TaskDependency, "project__team", ()),
+    # Subtasks (longer paths) before their parents
+    (Task, "project__team", (Length("path").desc(),)),
+    (ProjectTaskCounter, "project__team", ()),
+    (TeamTaskCounter, "team", ()),
+    (TeamMember, "team", ()),
+    (Project, "team", ()),
+]
+
+
+def delete_teams(team_ids):
+    """
+    Mark teams as deleting, which hides them from every user at once, and
+    purge them after commit unless purging is deferred to the worker.
+
+    Returns True when the teams were purged, False when they are pending.
+    """
+    team_ids = list(team_ids)
+    user_ids = {
+        *Team.objects.filter(pk__in=team_ids).values_list("owner_id", flat=True),
+        *TeamMember.objects.filter(team_id__in=team_ids).values_list(
+            "user_id", flat=True
+        ),
+    }
+    Team.objects.filter(pk__in=team_ids).update(is_deleting=True)
+    transaction.on_commit(lambda: invalidate_team_cache(*user_ids))
+
+    if settings.TEAM_DELETE_ASYNC:
+        return False
+    transaction.on_commit(lambda: purge_teams(team_ids))
+    return True
+
+
+def purge_teams(team_ids, chunk_size=None):
+    """
+    Delete teams and everything they own in bounded chunks, without loading
+    the rows into memory. Returns the number of deleted rows.
+    """
+    chunk_size = chunk_size or settings.TEAM_DELETE_CHUNK_SIZE
+    deleted = 0
+    for model, lookup, ordering in TEAM_DESCENDANTS:
+        rows = model._base_manager.filter(**{f"{lookup}__in": team_ids})
+        deleted += delete_in_chunks(rows.order_by(*ordering), chunk_size)
+    # Only the team rows are left for the collector to delete
+    count, _ = Team._base_manager.filter(pk__in=team_ids).delete()
+    return deleted + count
@@ -0,0 +1,78 @@
+from apps.projects.models import Project
+from apps.tasks.models import Task
+from apps.teams.models import Team, TeamMember
+
+
+class ExportResource:
+    """
+    A team-scoped table that can be streamed by the export endpoint.
+
+    Rows are read with ``values_list()`` over ``iterator()``, so memory stays
+    flat however many rows the user can access.
+    """
+
+    def __init__(self, name, model, columns, team_lookup="team"):
+        self.name = name
+        self.model = model
+        self.columns = columns
+        self.team_lookup = team_lookup
+
+    def get_queryset(self, access):
+        if self.model is Team:
+            queryset = access.filter_teams(Team.objects.all())
+        else:
+            queryset = access.filter_by_team(
+                self.model.objects.all(), lookup=self.team_lookup
+            )
+        return queryset.order_by("pk")
+
+    def get_rows(self, access, chunk_size=2000):
+        return (
+            self.get_queryset(access)
+            .values_list(*self.columns)
+            .iterator(chunk_size=chunk_size)
+        )
+
+
+# Exported in this order, so parents always come before their children
+EXPORT_RESOURCES = {
+    resource.name: resource
+    for resource in [
+        ExportResource(
+            "teams", Team, ["id", "name", "owner_id", "created_at", "updated_at"]
+        ),
+        ExportResource("members", TeamMember, ["id", "team_id", "user_id", "role"]),
+        ExportResource(
+            "projects",
+            Project,
+            [
+                "id",
+                "name",
+                "description",
+                "team_id",
+                "created_by_id",
+                "created_at",
+                "updated_at",
+            ],
+        ),
+        ExportResource(
+            "tasks",
+            Task,
+            [
+                "id",
+                "title",
+                "description",
+                "status",
+                "priority",
+                "due_date",
+                "project_id",
+                "parent_id",
+                "assignee_id",
+                "created_by_id",
+                "created_at",
+                "updated_at",
+            ],
+            team_lookup="project__team",
+        ),
+    ]
+}
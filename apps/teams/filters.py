@@ -1,11 +1,40 @@
 import django_filters
+from django.contrib.postgres.search import TrigramWordSimilarity
+from django.db import connections
 
 from apps.teams.models import Team
 
 
 class TeamFilter(django_filters.FilterSet):
-    search = django_filters.CharFilter(field_name="name", lookup_expr="icontains")
+    search = django_filters.CharFilter(method="filter_search")
+
+    # Terms shorter than one trigram cannot use the index, so they keep the
+    # plain substring match.
+    min_trigram_length = 3
+    # Rows below this word similarity are dropped. The pg_trgm %> operator also
+    # applies pg_trgm.word_similarity_threshold (0.6 by default) server-side.
+    min_similarity = 0.6
 
     class Meta:
         model = Team
         fields = []
+
+    def filter_search(self, queryset, name, value):
+        value = value.strip()
+        if not value:
+            return queryset
+
+        vendor = connections[queryset.db].vendor
+        if vendor != "postgresql" or len(value) < self.min_trigram_length:
+            return queryset.filter(name__icontains=value)
+
+        # `name %> value` is served by the gin_trgm_ops index on team.name.
+        # Ranked results are paged by page number only: TeamView rejects
+        # search in cursor mode, whose (created_at, id) keyset would drop
+        # the rank ordering.
+        return (
+            queryset.filter(name__trigram_word_similar=value)
+            .annotate(search_rank=TrigramWordSimilarity(value, "name"))
+            .filter(search_rank__gte=self.min_similarity)
+            .order_by("-search_rank", "-created_at", "-id")
+        )
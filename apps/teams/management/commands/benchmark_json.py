@@ -0,0 +1,61 @@
+from io import BytesIO
+
+from django.core.management.base import BaseCommand, CommandError
+from rest_framework.parsers import JSONParser
+from rest_framework.renderers import JSONRenderer
+
+from apps.teams.management.commands.benchmark_serializers import (
+    build_teams,
+    build_users,
+)
+from apps.teams.serializers import TeamSerializer
+from apps.users.serializers import UserProfileSerializer
+from common.benchmarks import format_stats, measure
+from common.parsers import ORJSONParser
+from common.renderers import ORJSONRenderer
+
+
+class Command(BaseCommand):
+    help = "Compare the stdlib and orjson-backed JSON renderers and parsers"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--rows", type=int, default=1000)
+        parser.add_argument("--repeat", type=int, default=20)
+
+    def handle(self, *args, **options):
+        rows, repeat = options["rows"], options["repeat"]
+        payloads = {
+            "teams": {
+                "count": rows,
+                "next": None,
+                "previous": None,
+                "results": TeamSerializer(build_teams(rows), many=True).data,
+            },
+            "users": UserProfileSerializer(build_users(rows), many=True).data,
+        }
+
+        for label, payload in payloads.items():
+            expected = JSONRenderer().render(payload)
+            actual = ORJSONRenderer().render(payload)
+            if expected != actual:
+                raise CommandError(f"{label}: orjson output differs from JSONRenderer")
+
+            self.stdout.write(f"{label}: {rows:,} rows, {len(actual):,} bytes")
+            self.report(
+                "render",
+                measure(lambda: JSONRenderer().render(payload), repeat),
+                measure(lambda: ORJSONRenderer().render(payload), repeat),
+            )
+            self.report(
+                "parse",
+                measure(lambda: JSONParser().parse(self.stream(expected)), repeat),
+                measure(lambda: ORJSONParser().parse(self.stream(expected)), repeat),
+            )
+
+    def report(self, label, stdlib, fast):
+        self.stdout.write(format_stats(f"  {label} JSONRenderer/Parser", stdlib))
+        self.stdout.write(format_stats(f"  {label} orjson", fast))
+        self.stdout.write(f"  {label} speedup: {stdlib['p50'] / fast['p50']:.1f}x")
+
+    def stream(self, content):
+        return BytesIO(content)
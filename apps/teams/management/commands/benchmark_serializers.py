@@ -0,0 +1,99 @@
+from datetime import timedelta
+from uuid import uuid4
+
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+from rest_framework.renderers import JSONRenderer
+
+from apps.teams.models import Team
+from apps.teams.serializers import TeamSerializer
+from apps.users.models import User
+from apps.users.serializers import UserProfileSerializer
+from common.benchmarks import format_stats, measure
+from common.fast_serializers import get_compiled_serializer
+
+
+def build_teams(count):
+    now = timezone.now()
+    owner_ids = [uuid4() for _ in range(10)]
+    return [
+        Team(
+            id=uuid4(),
+            name=f"Team {index}",
+            owner_id=owner_ids[index % len(owner_ids)],
+            created_at=now - timedelta(minutes=index),
+            updated_at=now,
+        )
+        for index in range(count)
+    ]
+
+
+def build_users(count):
+    now = timezone.now()
+    return [
+        User(
+            id=uuid4(),
+            email=f"user{index}@example.com",
+            username=f"user{index}",
+            first_name="Ada",
+            last_name="Lovelace",
+            avatar=None if index % 2 else "https://example.com/avatar.png",
+            phone=None,
+            date_joined=now - timedelta(days=index),
+            last_login=None if index % 3 else now,
+        )
+        for index in range(count)
+    ]
+
+
+class Command(BaseCommand):
+    help = (
+        "Compare DRF serializers with their compiled read-only fast path "
+        "on in-memory rows, checking the rendered output is byte-identical"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--rows", type=int, default=1000)
+        parser.add_argument("--repeat", type=int, default=20)
+
+    def handle(self, *args, **options):
+        rows = options["rows"]
+        self.stdout.write(f"Rows per run: {rows:,}")
+
+        teams = build_teams(rows)
+        self.compare("TeamSerializer", TeamSerializer, teams, options["repeat"])
+
+        users = build_users(rows)
+        self.compare(
+            "UserProfileSerializer", UserProfileSerializer, users, options["repeat"]
+        )
+
+    def compare(self, label, serializer_class, instances, repeat):
+        reader = get_compiled_serializer(serializer_class)
+        # The rows values() would return for the same instances
+        values = [
+            {name: getattr(instance, attname) for name, attname in self.columns(reader)}
+            for instance in instances
+        ]
+
+        renderer = JSONRenderer()
+        expected = renderer.render(serializer_class(instances, many=True).data)
+        actual = renderer.render(reader.serialize(values))
+        if expected != actual:
+            raise CommandError(f"{label}: compiled output differs from DRF output")
+
+        drf = measure(lambda: serializer_class(instances, many=True).data, repeat)
+        fast = measure(lambda: reader.serialize(values), repeat)
+        per_1k = 1000 / len(instances)
+        self.stdout.write(f"{label}: output is byte-identical ({len(actual):,} bytes)")
+        self.stdout.write(format_stats("  DRF ModelSerializer", drf))
+        self.stdout.write(format_stats("  compiled", fast))
+        self.stdout.write(
+            f"  per 1k rows: DRF {drf['p50'] * per_1k:.2f}ms, "
+            f"compiled {fast['p50'] * per_1k:.2f}ms "
+            f"({drf['p50'] / fast['p50']:.1f}x)"
+        )
+
+    def columns(self, reader):
+        opts = reader.model._meta
+        return [(name, opts.get_field(name).attname) for name in reader.value_names]
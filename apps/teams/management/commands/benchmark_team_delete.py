@@ -0,0 +1,79 @@
+import time
+from uuid import uuid4
+
+from django.core.management.base import BaseCommand
+from django.db import connection
+
+from apps.projects.models import Project
+from apps.teams.deletion import purge_teams
+from apps.teams.models import Team, TeamMember
+from apps.users.models import User
+
+
+class Command(BaseCommand):
+    help = (
+        "Compare Django's cascading Team.delete() with the chunked purge on "
+        "teams with a large number of descendant rows"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--projects", type=int, default=95_000)
+        parser.add_argument("--members", type=int, default=5_000)
+        parser.add_argument("--batch-size", type=int, default=5_000)
+        parser.add_argument("--chunk-size", type=int, default=5_000)
+
+    def handle(self, *args, **options):
+        owner, _ = User.objects.get_or_create(
+            email="benchmark-delete@taskforce.local",
+            defaults={"username": "benchmark-delete"},
+        )
+        users = self.seed_users(options["members"], options["batch_size"])
+        descendants = options["projects"] + options["members"]
+        self.stdout.write(
+            f"Backend: {connection.vendor}, descendants per team: {descendants:,}"
+        )
+
+        try:
+            team = self.seed_team(owner, users, options)
+            started = time.perf_counter()
+            team.delete()
+            self.report("Team.delete()", started)
+
+            team = self.seed_team(owner, users, options)
+            started = time.perf_counter()
+            purge_teams([team.pk], chunk_size=options["chunk_size"])
+            self.report("purge_teams()", started)
+        finally:
+            User.objects.filter(pk__in=[user.pk for user in users]).delete()
+            owner.delete()
+
+    def seed_users(self, count, batch_size):
+        suffix = uuid4().hex[:8]
+        return User.objects.bulk_create(
+            [
+                User(
+                    email=f"benchmark-delete-{suffix}-{index}@taskforce.local",
+                    username=f"benchmark-delete-{suffix}-{index}",
+                )
+                for index in range(count)
+            ],
+            batch_size=batch_size,
+        )
+
+    def seed_team(self, owner, users, options):
+        team = Team.objects.create(name="Benchmark delete", owner=owner)
+        TeamMember.objects.bulk_create(
+            [TeamMember(team=team, user=user, role="member") for user in users],
+            batch_size=options["batch_size"],
+        )
+        Project.objects.bulk_create(
+            (
+                Project(name=f"Project {index}", team=team)
+                for index in range(options["projects"])
+            ),
+            batch_size=options["batch_size"],
+        )
+        return team
+
+    def report(self, label, started):
+        self.stdout.write(f"{label}: {(time.perf_counter() - started) * 1000:.0f}ms")
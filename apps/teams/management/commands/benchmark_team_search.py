@@ -0,0 +1,95 @@
+import random
+
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+
+from apps.teams.filters import TeamFilter
+from apps.teams.models import Team
+from apps.users.models import User
+from common.benchmarks import format_stats, measure
+
+WORDS = [
+    "alpha",
+    "backend",
+    "core",
+    "design",
+    "engineering",
+    "frontend",
+    "growth",
+    "infra",
+    "marketing",
+    "mobile",
+    "platform",
+    "product",
+    "research",
+    "sales",
+    "security",
+    "support",
+    "data",
+    "ops",
+    "payments",
+    "search",
+]
+
+
+class Command(BaseCommand):
+    help = "Benchmark team search latency against a large synthetic team table"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--teams", type=int, default=1_000_000)
+        parser.add_argument("--batch-size", type=int, default=10_000)
+        parser.add_argument("--repeat", type=int, default=20)
+        parser.add_argument(
+            "--keep", action="store_true", help="Keep the generated teams"
+        )
+
+    def handle(self, *args, **options):
+        owner, _ = User.objects.get_or_create(
+            email="benchmark-search@taskforce.local",
+            defaults={"username": "benchmark-search"},
+        )
+
+        existing = Team.objects.filter(owner=owner).count()
+        if existing < options["teams"]:
+            self.seed(owner, options["teams"] - existing, options["batch_size"])
+
+        queryset = Team.objects.filter(owner=owner).order_by("-created_at", "-id")
+        self.stdout.write(f"Backend: {connection.vendor}, teams: {queryset.count():,}")
+
+        for term in ["eng", "platfrm", "security ops", "zz"]:
+            search = TeamFilter({"search": term}, queryset=queryset).qs[:20]
+            legacy = queryset.filter(name__icontains=term)[:20]
+            self.stdout.write(
+                format_stats(
+                    f"search={term!r}",
+                    measure(lambda: list(search.all()), repeat=options["repeat"]),
+                )
+            )
+            self.stdout.write(
+                format_stats(
+                    f"icontains={term!r}",
+                    measure(lambda: list(legacy.all()), repeat=options["repeat"]),
+                )
+            )
+            if connection.vendor == "postgresql":
+                self.stdout.write(search.explain(analyze=True))
+
+        if not options["keep"]:
+            owner.delete()
+
+    def seed(self, owner, count, batch_size):
+        self.stdout.write(f"Seeding {count:,} teams...")
+        rng = random.Random(42)
+        for start in range(0, count, batch_size):
+            size = min(batch_size, count - start)
+            with transaction.atomic():
+                Team.objects.bulk_create(
+                    Team(
+                        name=" ".join(rng.sample(WORDS, 2)) + f" {start + i}",
+                        owner=owner,
+                    )
+                    for i in range(size)
+                )
+        if connection.vendor == "postgresql":
+            with connection.cursor() as cursor:
+                cursor.execute("ANALYZE teams_team")
@@ -0,0 +1,23 @@
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from apps.teams.deletion import purge_teams
+from apps.teams.models import Team
+
+
+class Command(BaseCommand):
+    help = "Delete the rows of teams marked as deleting, in bounded chunks"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--chunk-size", type=int, default=settings.TEAM_DELETE_CHUNK_SIZE
+        )
+
+    def handle(self, *args, **options):
+        team_ids = list(
+            Team._base_manager.filter(is_deleting=True).values_list("pk", flat=True)
+        )
+        for team_id in team_ids:
+            deleted = purge_teams([team_id], chunk_size=options["chunk_size"])
+            self.stdout.write(f"Purged team {team_id} ({deleted:,} rows)")
+        self.stdout.write(f"Purged {len(team_ids)} team(s)")
@@ -0,0 +1,19 @@
+# Generated by Django 5.2 on 2026-10-17 23:16
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('teams', '0001_initial'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='team',
+            index=models.Index(fields=['owner', '-created_at', '-id'], name='team_owner_created_idx'),
+        ),
+    ]
@@ -0,0 +1,35 @@
+# Generated by Django 5.2 on 2026-10-17 23:40
+
+from django.contrib.postgres.operations import TrigramExtension
+from django.db import migrations
+
+INDEX_NAME = "team_name_trgm_idx"
+
+
+def create_trigram_index(apps, schema_editor):
+    # GIN trigram indexes only exist on PostgreSQL; other backends keep the
+    # plain icontains search.
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    schema_editor.execute(
+        f"CREATE INDEX IF NOT EXISTS {INDEX_NAME} "
+        "ON teams_team USING gin (name gin_trgm_ops)"
+    )
+
+
+def drop_trigram_index(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    schema_editor.execute(f"DROP INDEX IF EXISTS {INDEX_NAME}")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('teams', '0002_team_owner_created_idx'),
+    ]
+
+    operations = [
+        TrigramExtension(),
+        migrations.RunPython(create_trigram_index, drop_trigram_index),
+    ]
@@ -0,0 +1,24 @@
+# Generated by Django 5.2 on 2026-10-17 23:32
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('teams', '0003_team_name_trgm_idx'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='team',
+            name='is_deleting',
+            field=models.BooleanField(default=False),
+        ),
+        migrations.AddIndex(
+            model_name='team',
+            index=models.Index(condition=models.Q(('is_deleting', True)), fields=['id'], name='team_deleting_idx'),
+        ),
+    ]
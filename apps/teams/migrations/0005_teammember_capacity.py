@@ -0,0 +1,18 @@
+# Generated by Django 5.2 on 2026-10-18 00:35
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('teams', '0004_team_is_deleting'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='teammember',
+            name='capacity',
+            field=models.PositiveIntegerField(default=10),
+        ),
+    ]
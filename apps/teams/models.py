@@ -14,15 +14,41 @@ class Team(models.Model):
     )
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
+    # Tombstone for teams whose rows are still being purged
+    is_deleting = models.BooleanField(default=False)
+
+    class Meta:
+        indexes = [
+            models.Index(
+                fields=["owner", "-created_at", "-id"],
+                name="team_owner_created_idx",
+            ),
+            models.Index(
+                fields=["id"],
+                name="team_deleting_idx",
+                condition=models.Q(is_deleting=True),
+            ),
+        ]
 
     def __str__(self):
         return self.name
 
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        # Remember the owner as loaded so that an ownership transfer can
+        # invalidate the previous owner's cached responses.
+        instance._loaded_owner_id = instance.__dict__.get("owner_id")
+        return instance
+
 
 class TeamMember(models.Model):
     team = models.ForeignKey(Team, on_delete=models.CASCADE, related_name="members")
     user = models.ForeignKey(User, on_delete=models.CASCADE, related_name="teams")
     role = models.CharField(max_length=20, choices=TeamRole.choices)
+    # Open tasks of the team the member can hold at once, used when tasks are
+    # assigned automatically (see apps.tasks.scheduling). 0 opts them out.
+    capacity = models.PositiveIntegerField(default=10)
 
     class Meta:
         unique_together = ("team", "user")
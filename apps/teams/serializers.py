@@ -1,12 +1,13 @@
 from rest_framework import serializers
 
 from apps.teams.models import Team
+from common.serializers import DynamicFieldsMixin
 
 
-class TeamSerializer(serializers.ModelSerializer):
+class TeamSerializer(DynamicFieldsMixin, serializers.ModelSerializer):
     class Meta:
         model = Team
-        fields = "__all__"
+        exclude = ["is_deleting"]
 
 
 class TeamCreateSerializer(serializers.ModelSerializer):
@@ -55,3 +56,65 @@ class TeamListSerializer(serializers.Serializer):
         help_text="URL to the previous page of results, null if this is the first page",
     )
     results = TeamSerializer(many=True, help_text="List of teams for the current page")
+
+
+class TeamBulkUpdateSerializer(serializers.Serializer):
+    """
+    Serializer for a single update operation in a bulk request.
+    The owner is validated as a plain UUID so that all owners can be resolved in one query.
+    """
+
+    id = serializers.UUIDField()
+    name = serializers.CharField(max_length=100, required=False)
+    owner = serializers.UUIDField(required=False)
+
+
+class TeamBulkSerializer(serializers.Serializer):
+    """
+    Serializer for bulk team operations. All operations are applied in a single transaction.
+    """
+
+    create = TeamCreateSerializer(many=True, required=False, help_text="Teams to create")
+    update = TeamBulkUpdateSerializer(
+        many=True, required=False, help_text="Teams to update, identified by id"
+    )
+    delete = serializers.ListField(
+        child=serializers.UUIDField(),
+        required=False,
+        help_text="Ids of the teams to delete",
+    )
+
+    max_operations = 5000
+
+    def validate(self, attrs):
+        total = sum(len(attrs.get(key, [])) for key in ("create", "update", "delete"))
+        if total == 0:
+            raise serializers.ValidationError("At least one operation is required.")
+        if total > self.max_operations:
+            raise serializers.ValidationError(
+                f"A bulk request can contain at most {self.max_operations} operations."
+            )
+
+        update_ids = [item["id"] for item in attrs.get("update", [])]
+        delete_ids = attrs.get("delete", [])
+        if len(set(update_ids)) != len(update_ids) or len(set(delete_ids)) != len(
+            delete_ids
+        ):
+            raise serializers.ValidationError("A team can only appear once per operation.")
+        if set(update_ids) & set(delete_ids):
+            raise serializers.ValidationError(
+                "A team cannot be updated and deleted in the same request."
+            )
+        return attrs
+
+
+class TeamBulkResultSerializer(serializers.Serializer):
+    """
+    Serializer for documenting bulk team responses in Swagger.
+    """
+
+    create = TeamSerializer(many=True, help_text="Created teams, in request order")
+    update = TeamSerializer(many=True, help_text="Updated teams, in request order")
+    delete = serializers.ListField(
+        child=serializers.UUIDField(), help_text="Ids of the deleted teams"
+    )
@@ -0,0 +1,34 @@
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save, pre_delete
+from django.dispatch import receiver
+
+from apps.teams.cache import invalidate_team_cache, invalidate_team_viewers
+from apps.teams.models import Team, TeamMember
+
+
+# The members are read before the delete, as their rows are gone by the time
+# the viewers are invalidated on commit
+@receiver(pre_delete, sender=Team)
+def remember_team_members(sender, instance, **kwargs):
+    instance._member_ids = list(
+        TeamMember.objects.filter(team=instance).values_list("user_id", flat=True)
+    )
+
+
+@receiver(post_save, sender=Team)
+@receiver(post_delete, sender=Team)
+def invalidate_team_viewers_cache(sender, instance, **kwargs):
+    # Invalidate the previous owner as well when ownership was transferred
+    user_ids = (
+        instance.owner_id,
+        getattr(instance, "_loaded_owner_id", None),
+        *getattr(instance, "_member_ids", ()),
+    )
+    transaction.on_commit(lambda: invalidate_team_viewers([instance.pk], *user_ids))
+    instance._loaded_owner_id = instance.owner_id
+
+
+@receiver(post_save, sender=TeamMember)
+@receiver(post_delete, sender=TeamMember)
+def invalidate_member_cache(sender, instance, **kwargs):
+    transaction.on_commit(lambda: invalidate_team_cache(instance.user_id))
@@ -1,3 +1,288 @@
-from django.test import TestCase
+from base64 import urlsafe_b64encode
+from datetime import date
+from io import StringIO
 
-# Create your tests here.
+from django.core.cache import cache
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from apps.projects.models import Project
+from apps.tasks.counters import verify_task_counters
+from apps.tasks.graph import add_task_dependency
+from apps.tasks.models import Task
+from apps.teams.deletion import TEAM_DESCENDANTS, delete_teams, purge_teams
+from apps.teams.models import Team, TeamMember
+from apps.users.models import User
+from apps.worklogs.models import WorkLog
+from apps.worklogs.rollups import verify_worklog_rollups
+from common.models import TeamRole
+
+
+class TeamTestCase(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.owner = User.objects.create_user(
+            email="owner@example.com", username="owner", password="password"
+        )
+        cls.member = User.objects.create_user(
+            email="member@example.com", username="member", password="password"
+        )
+        cls.teams = [
+            Team.objects.create(name=f"Team {index:02}", owner=cls.owner)
+            for index in range(25)
+        ]
+        TeamMember.objects.create(
+            team=cls.teams[0], user=cls.member, role=TeamRole.MEMBER
+        )
+
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+        self.client.force_authenticate(self.owner)
+
+
+class TeamPaginationTests(TeamTestCase):
+    def test_cursor_pages_cover_every_team_once(self):
+        names = []
+        response = self.client.get(reverse("teams"), {"pagination": "cursor"})
+        while True:
+            self.assertEqual(response.status_code, 200)
+            page = response.json()
+            self.assertNotIn("count", page)
+            names += [team["name"] for team in page["results"]]
+            if page["next"] is None:
+                break
+            response = self.client.get(page["next"])
+
+        self.assertEqual(names, [team.name for team in reversed(self.teams)])
+
+    def test_previous_page(self):
+        first = self.client.get(reverse("teams"), {"pagination": "cursor"}).json()
+        second = self.client.get(first["next"]).json()
+        self.assertEqual(self.client.get(second["previous"]).json(), first)
+
+    def test_tampered_cursor_is_not_found(self):
+        for cursor in [
+            "garbage",
+            urlsafe_b64encode(b'{"p": ["not a date", "x"], "r": false}').decode(),
+        ]:
+            with self.subTest(cursor=cursor):
+                response = self.client.get(reverse("teams"), {"cursor": cursor})
+                self.assertEqual(response.status_code, 404)
+
+    def test_search_is_not_paginated_with_a_cursor(self):
+        response = self.client.get(
+            reverse("teams"), {"search": "Team", "pagination": "cursor"}
+        )
+        self.assertEqual(response.status_code, 400)
+        self.assertIn("search", response.json())
+
+        Team.objects.create(name="Backend", owner=self.owner)
+        response = self.client.get(reverse("teams"), {"search": "backend"})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()["results"][0]["name"], "Backend")
+
+    def test_members_only_see_their_teams(self):
+        self.client.force_authenticate(self.member)
+        response = self.client.get(reverse("teams"))
+        self.assertEqual(
+            [team["name"] for team in response.json()["results"]], ["Team 00"]
+        )
+
+
+class TeamFieldsTests(TeamTestCase):
+    def get_fields(self, **params):
+        response = self.client.get(
+            reverse("team-detail", args=[self.teams[0].pk]), params
+        )
+        self.assertEqual(response.status_code, 200, response.content)
+        return set(response.json())
+
+    def test_fields_and_omit(self):
+        every_field = self.get_fields()
+        self.assertEqual(self.get_fields(fields="id, ,name"), {"id", "name"})
+        self.assertEqual(self.get_fields(omit="name,"), every_field - {"name"})
+        self.assertEqual(self.get_fields(fields=" , "), every_field)
+
+    def test_unknown_fields_are_rejected(self):
+        response = self.client.get(
+            reverse("teams"), {"fields": "name,secret", "omit": "other"}
+        )
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(
+            response.json(), {"fields": ["Unknown field(s): other, secret"]}
+        )
+
+
+class TeamConditionalRequestTests(TeamTestCase):
+    def assertNotModified(self, url, etag):
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+
+    def test_list_etag(self):
+        url = reverse("teams")
+        etag = self.client.get(url)["ETag"]
+        self.assertNotModified(url, etag)
+
+        # Answered from the database once the cache is gone
+        cache.clear()
+        self.assertNotModified(url, etag)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.delete(
+                reverse("team-detail", args=[self.teams[1].pk])
+            )
+        self.assertEqual(response.status_code, 204)
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response["ETag"], etag)
+        self.assertEqual(response.json()["count"], 24)
+
+    def test_detail_etag(self):
+        url = reverse("team-detail", args=[self.teams[0].pk])
+        response = self.client.get(url)
+        etag = response["ETag"]
+        self.assertNotModified(url, etag)
+        response = self.client.get(
+            url, HTTP_IF_MODIFIED_SINCE=response["Last-Modified"]
+        )
+        self.assertEqual(response.status_code, 304)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.client.patch(url, {"name": "Renamed"}, format="json")
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()["name"], "Renamed")
+
+    def test_etag_depends_on_the_requested_fields(self):
+        url = reverse("team-detail", args=[self.teams[0].pk])
+        etag = self.client.get(url)["ETag"]
+        response = self.client.get(url, {"fields": "name"}, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(list(response.json()), ["name"])
+
+
+class TeamCacheTests(TeamTestCase):
+    def get(self, url, user=None):
+        self.client.force_authenticate(user or self.owner)
+        return self.client.get(url)
+
+    def test_updates_invalidate_every_viewer(self):
+        url = reverse("team-detail", args=[self.teams[0].pk])
+        for user in (self.owner, self.member):
+            self.assertEqual(self.get(url, user)["X-Cache"], "MISS")
+            self.assertEqual(self.get(url, user)["X-Cache"], "HIT")
+
+        self.client.force_authenticate(self.owner)
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.patch(url, {"name": "Renamed"}, format="json")
+        self.assertEqual(response.status_code, 200)
+
+        for user in (self.owner, self.member):
+            response = self.get(url, user)
+            self.assertEqual(response["X-Cache"], "MISS")
+            self.assertEqual(response.json()["name"], "Renamed")
+
+    def test_membership_changes_invalidate_the_member(self):
+        url = reverse("teams")
+        self.assertEqual(self.get(url, self.member).json()["count"], 1)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            TeamMember.objects.create(
+                team=self.teams[1], user=self.member, role=TeamRole.MEMBER
+            )
+
+        response = self.get(url, self.member)
+        self.assertEqual(response["X-Cache"], "MISS")
+        self.assertEqual(response.json()["count"], 2)
+
+    def test_deleted_teams_are_invalidated_for_their_members(self):
+        url = reverse("teams")
+        self.assertEqual(self.get(url, self.member).json()["count"], 1)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.teams[0].delete()
+
+        response = self.get(url, self.member)
+        self.assertEqual(response["X-Cache"], "MISS")
+        self.assertEqual(response.json()["count"], 0)
+
+    @override_settings(
+        CACHES={"default": {"BACKEND": "django.core.cache.backends.dummy.DummyCache"}}
+    )
+    def test_backend_storing_nothing(self):
+        for url in (reverse("teams"), reverse("team-detail", args=[self.teams[0].pk])):
+            with self.subTest(url=url):
+                self.assertEqual(self.get(url)["X-Cache"], "MISS")
+                self.assertEqual(self.get(url)["X-Cache"], "MISS")
+
+    @override_settings(TEAM_DELETE_ASYNC=True)
+    def test_deleted_teams_are_hidden_at_once(self):
+        url = reverse("teams")
+        self.get(url)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.delete(
+                reverse("team-detail", args=[self.teams[1].pk])
+            )
+        self.assertEqual(response.status_code, 202)
+
+        self.assertEqual(self.get(url).json()["count"], 24)
+        response = self.get(reverse("team-detail", args=[self.teams[1].pk]))
+        self.assertEqual(response.status_code, 404)
+
+
+class TeamPurgeTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.owner = User.objects.create_user(
+            email="owner@example.com", username="owner", password="password"
+        )
+
+    def create_team(self, name):
+        with self.captureOnCommitCallbacks(execute=True):
+            team = Team.objects.create(name=name, owner=self.owner)
+            TeamMember.objects.create(team=team, user=self.owner, role=TeamRole.ADMIN)
+            project = Project.objects.create(name=name, team=team)
+            parent = Task.objects.create(project=project, title="Parent")
+            child = Task.objects.create(project=project, title="Child", parent=parent)
+            add_task_dependency(child, Task.objects.create(project=project, title="A"))
+            WorkLog.objects.create(
+                task=child, user=self.owner, date=date(2026, 10, 14), minutes=30
+            )
+        return team
+
+    def count_rows(self, team):
+        return {
+            model.__name__: model._base_manager.filter(
+                **{f"{lookup}__in": [team.pk]}
+            ).count()
+            for model, lookup, _ in TEAM_DESCENDANTS
+        }
+
+    def test_purges_every_row_of_the_team(self):
+        team, other = self.create_team("Team"), self.create_team("Other")
+        counts, other_counts = self.count_rows(team), self.count_rows(other)
+        self.assertTrue(all(counts.values()), counts)
+
+        self.assertEqual(purge_teams([team.pk], chunk_size=2), sum(counts.values()) + 1)
+
+        self.assertFalse(Team._base_manager.filter(pk=team.pk).exists())
+        self.assertFalse(any(self.count_rows(team).values()))
+        self.assertEqual(self.count_rows(other), other_counts)
+        self.assertEqual(verify_task_counters(), [])
+        self.assertEqual(verify_worklog_rollups(), [])
+
+    @override_settings(TEAM_DELETE_ASYNC=True)
+    def test_command_purges_the_deleting_teams(self):
+        team, other = self.create_team("Team"), self.create_team("Other")
+        with self.captureOnCommitCallbacks(execute=True):
+            self.assertFalse(delete_teams([team.pk]))
+        self.assertTrue(Team._base_manager.filter(pk=team.pk).exists())
+
+        call_command("purge_deleted_teams", stdout=StringIO())
+
+        self.assertFalse(Team._base_manager.filter(pk=team.pk).exists())
+        self.assertTrue(Team.objects.filter(pk=other.pk).exists())
@@ -1,8 +1,10 @@
 from django.urls import path
 
-from apps.teams.views import TeamView, TeamDetailView
+from apps.teams.views import TeamBulkView, TeamExportView, TeamView, TeamDetailView
 
 urlpatterns = [
     path("", TeamView.as_view(), name="teams"),
+    path("bulk/", TeamBulkView.as_view(), name="teams-bulk"),
+    path("export/", TeamExportView.as_view(), name="teams-export"),
     path("<uuid:pk>/", TeamDetailView.as_view(), name="team-detail"),
 ]
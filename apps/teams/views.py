@@ -1,34 +1,61 @@
 
 
-from django_filters.rest_framework import DjangoFilterBackend
 from drf_yasg import openapi
 from drf_yasg.utils import swagger_auto_schema
+from django.db import transaction
+from django.db.models import Count, Max
+from django.http import StreamingHttpResponse
+from django.utils import timezone
 from rest_framework import status
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
+from apps.teams.access import get_team_access
+from apps.teams.cache import invalidate_team_viewers, team_cache
+from apps.teams.deletion import delete_teams
+from apps.teams.exports import EXPORT_RESOURCES
 from apps.teams.filters import TeamFilter
 from apps.teams.models import Team
-from apps.teams.paginations import TeamPagination
-from apps.teams.serializers import TeamListSerializer, TeamSerializer, TeamCreateSerializer, TeamUpdateSerializer
+from apps.teams.paginations import TeamCursorPagination, TeamPagination
+from apps.teams.serializers import (
+    TeamBulkResultSerializer,
+    TeamBulkSerializer,
+    TeamCreateSerializer,
+    TeamListSerializer,
+    TeamSerializer,
+    TeamUpdateSerializer,
+)
+from apps.users.models import User
+from common.conditional import (
+    get_not_modified_response,
+    is_conditional_request,
+    make_weak_etag,
+    set_validators,
+)
+from common.exports import stream_csv, stream_ndjson
+from common.fast_serializers import get_compiled_serializer
+from common.renderers import CSVRenderer, NDJSONRenderer
 
 
 class TeamView(APIView):
     permission_classes = [IsAuthenticated]
     serializer_class = TeamSerializer
     pagination_class = TeamPagination
-    filter_backends = [DjangoFilterBackend]
+    cursor_pagination_class = TeamCursorPagination
     filter_class = TeamFilter
 
     @swagger_auto_schema(
         tags=["Teams"],
-        operation_description="Get all teams with pagination and search/filter",
+        operation_description=(
+            "Get all teams with pagination and search/filter. "
+            "Pass pagination=cursor for keyset pagination with opaque next/previous cursors."
+        ),
         manual_parameters=[
             openapi.Parameter(
                 "search",
                 openapi.IN_QUERY,
-                description="Search teams by name (case-insensitive partial match)",
+                description="Search teams by name (similarity-ranked on PostgreSQL, case-insensitive partial match elsewhere)",
                 type=openapi.TYPE_STRING,
                 required=False,
             ),
@@ -46,27 +73,114 @@ class TeamView(APIView):
                 type=openapi.TYPE_INTEGER,
                 required=False,
             ),
+            openapi.Parameter(
+                "pagination",
+                openapi.IN_QUERY,
+                description="Pagination mode: 'page' (default) or 'cursor' (not with search)",
+                type=openapi.TYPE_STRING,
+                enum=["page", "cursor"],
+                required=False,
+            ),
+            openapi.Parameter(
+                "cursor",
+                openapi.IN_QUERY,
+                description="Opaque cursor from a previous next/previous link (cursor mode)",
+                type=openapi.TYPE_STRING,
+                required=False,
+            ),
+            openapi.Parameter(
+                "include_total",
+                openapi.IN_QUERY,
+                description="Include an approximate total count (cursor mode)",
+                type=openapi.TYPE_BOOLEAN,
+                required=False,
+            ),
+            openapi.Parameter(
+                "fields",
+                openapi.IN_QUERY,
+                description="Comma-separated list of fields to return",
+                type=openapi.TYPE_STRING,
+                required=False,
+            ),
+            openapi.Parameter(
+                "omit",
+                openapi.IN_QUERY,
+                description="Comma-separated list of fields to leave out",
+                type=openapi.TYPE_STRING,
+                required=False,
+            ),
         ],
         responses={
             200: TeamListSerializer,
+            304: "Not Modified - The list matches the ETag sent in If-None-Match",
+            400: "Bad Request - Search combined with cursor pagination",
             401: "Unauthorized - Authentication credentials were not provided",
             403: "Forbidden - You do not have permission to perform this action",
         },
     )
     def get(self, request):
-        teams = Team.objects.filter(owner=request.user)
+        # Search results are ordered by rank, which keyset cursors over
+        # (created_at, id) cannot page through, so the two are not combined
+        paginator = self.get_paginator(request)
+        searching = bool(request.GET.get("search", "").strip())
+        if searching and isinstance(paginator, self.cursor_pagination_class):
+            return Response(
+                {"search": ["Search results cannot be paginated with a cursor"]},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        cache_key = team_cache.make_key(request.user.pk, request)
+        cached_response = team_cache.get_response(request, cache_key)
+        if cached_response is not None:
+            return cached_response
+
+        # Rows are read with values() and serialized by the compiled fast
+        # path, narrowed to the requested fields
+        field_params = self.serializer_class.get_field_params(request)
+        reader = get_compiled_serializer(self.serializer_class, **field_params)
+
+        teams = get_team_access(request).filter_teams(Team.objects.all())
+        teams = teams.order_by("-created_at", "-id").values(
+            *{*reader.value_names, "created_at", "id"}
+        )
 
         # Apply filters using django-filter
         filter_set = self.filter_class(request.GET, queryset=teams)
         if filter_set.is_valid():
             teams = filter_set.qs
 
+        # Answer conditional requests from a single aggregate query
+        etag = self.get_etag(request, teams)
+        not_modified = get_not_modified_response(request, etag)
+        if not_modified is not None:
+            return not_modified
+
         # Apply pagination
-        paginator = self.pagination_class()
         paginated_teams = paginator.paginate_queryset(teams, request)
 
-        serializer = self.serializer_class(paginated_teams, many=True)
-        return paginator.get_paginated_response(serializer.data)
+        response = set_validators(
+            paginator.get_paginated_response(reader.serialize(paginated_teams)), etag
+        )
+        return team_cache.set_response(cache_key, response, etag)
+
+    def get_etag(self, request, teams):
+        # Deletions lower the count, so the ETag (unlike a Last-Modified
+        # derived from max(updated_at)) also changes when a team is removed.
+        state = teams.order_by().aggregate(
+            count=Count("pk"), last_modified=Max("updated_at")
+        )
+        return make_weak_etag(
+            state["count"], state["last_modified"], request.get_full_path()
+        )
+
+    def get_paginator(self, request):
+        # Cursor mode is opt-in and skips the COUNT(*) and OFFSET scan
+        if (
+            request.GET.get("pagination") == "cursor"
+            or self.cursor_pagination_class.cursor_query_param in request.GET
+        ):
+            return self.cursor_pagination_class()
+        return self.pagination_class()
 
     @swagger_auto_schema(
         tags=["Teams"],
@@ -96,24 +210,70 @@ class TeamDetailView(APIView):
     @swagger_auto_schema(
         tags=["Teams"],
         operation_description="Get a specific team by ID",
+        manual_parameters=[
+            openapi.Parameter(
+                "fields",
+                openapi.IN_QUERY,
+                description="Comma-separated list of fields to return",
+                type=openapi.TYPE_STRING,
+                required=False,
+            ),
+            openapi.Parameter(
+                "omit",
+                openapi.IN_QUERY,
+                description="Comma-separated list of fields to leave out",
+                type=openapi.TYPE_STRING,
+                required=False,
+            ),
+        ],
         responses={
             200: TeamSerializer,
+            304: "Not Modified - The team matches If-None-Match or If-Modified-Since",
             401: "Unauthorized - Authentication credentials were not provided",
             403: "Forbidden - You do not have permission to perform this action",
             404: "Not Found - Team not found or you don't have permission to access it"
         },
     )
     def get(self, request, pk):
-        try:
-            team = Team.objects.get(pk=pk, owner=request.user)
-        except Team.DoesNotExist:
+        cache_key = team_cache.make_key(request.user.pk, request)
+        cached_response = team_cache.get_response(request, cache_key)
+        if cached_response is not None:
+            return cached_response
+
+        field_params = TeamSerializer.get_field_params(request)
+        only_fields = TeamSerializer(**field_params).get_only_fields()
+
+        access = get_team_access(request)
+        if is_conditional_request(request) and access.can_view(pk):
+            updated_at = (
+                Team.objects.filter(pk=pk)
+                .values_list("updated_at", flat=True)
+                .first()
+            )
+            if updated_at is not None:
+                not_modified = get_not_modified_response(
+                    request,
+                    self.get_etag(request, pk, updated_at),
+                    updated_at,
+                )
+                if not_modified is not None:
+                    return not_modified
+
+        team = self.get_team(pk, access.can_view, only_fields)
+        if team is None:
             return Response(
                 {"error": "Team not found or you don't have permission to access it"}, 
                 status=status.HTTP_404_NOT_FOUND
             )
-        
-        serializer = TeamSerializer(team)
-        return Response(serializer.data, status=status.HTTP_200_OK)
+
+        serializer = TeamSerializer(team, **field_params)
+        etag = self.get_etag(request, team.pk, team.updated_at)
+        response = set_validators(
+            Response(serializer.data, status=status.HTTP_200_OK),
+            etag,
+            team.updated_at,
+        )
+        return team_cache.set_response(cache_key, response, etag, team.updated_at)
 
     @swagger_auto_schema(
         tags=["Teams"],
@@ -128,9 +288,9 @@ class TeamDetailView(APIView):
         },
     )
     def put(self, request, pk):
-        try:
-            team = Team.objects.get(pk=pk, owner=request.user)
-        except Team.DoesNotExist:
+        access = get_team_access(request)
+        team = self.get_team(pk, access.can_manage)
+        if team is None:
             return Response(
                 {"error": "Team not found or you don't have permission to update it"}, 
                 status=status.HTTP_404_NOT_FOUND
@@ -138,6 +298,11 @@ class TeamDetailView(APIView):
         
         serializer = TeamUpdateSerializer(team, data=request.data, partial=False)
         if serializer.is_valid():
+            if not self.can_transfer(access, team, serializer.validated_data):
+                return Response(
+                    {"error": "Only the team owner can transfer ownership"},
+                    status=status.HTTP_403_FORBIDDEN,
+                )
             updated_team = serializer.save()
             response_serializer = TeamSerializer(updated_team)
             return Response(response_serializer.data, status=status.HTTP_200_OK)
@@ -156,9 +321,9 @@ class TeamDetailView(APIView):
         },
     )
     def patch(self, request, pk):
-        try:
-            team = Team.objects.get(pk=pk, owner=request.user)
-        except Team.DoesNotExist:
+        access = get_team_access(request)
+        team = self.get_team(pk, access.can_manage)
+        if team is None:
             return Response(
                 {"error": "Team not found or you don't have permission to update it"}, 
                 status=status.HTTP_404_NOT_FOUND
@@ -166,6 +331,11 @@ class TeamDetailView(APIView):
         
         serializer = TeamUpdateSerializer(team, data=request.data, partial=True)
         if serializer.is_valid():
+            if not self.can_transfer(access, team, serializer.validated_data):
+                return Response(
+                    {"error": "Only the team owner can transfer ownership"},
+                    status=status.HTTP_403_FORBIDDEN,
+                )
             updated_team = serializer.save()
             response_serializer = TeamSerializer(updated_team)
             return Response(response_serializer.data, status=status.HTTP_200_OK)
@@ -176,19 +346,246 @@ class TeamDetailView(APIView):
         operation_description="Delete a specific team",
         responses={
             204: "No Content - Team successfully deleted",
+            202: "Accepted - Team hidden and queued for deletion (TEAM_DELETE_ASYNC)",
             401: "Unauthorized - Authentication credentials were not provided",
             403: "Forbidden - You do not have permission to perform this action",
             404: "Not Found - Team not found or you don't have permission to delete it"
         },
     )
     def delete(self, request, pk):
-        try:
-            team = Team.objects.get(pk=pk, owner=request.user)
-        except Team.DoesNotExist:
+        team = self.get_team(pk, get_team_access(request).is_owner)
+        if team is None:
             return Response(
                 {"error": "Team not found or you don't have permission to delete it"}, 
                 status=status.HTTP_404_NOT_FOUND
             )
         
-        team.delete()
+        if not delete_teams([team.pk]):
+            return Response(status=status.HTTP_202_ACCEPTED)
         return Response(status=status.HTTP_204_NO_CONTENT)
+
+    def get_team(self, pk, has_access, only_fields=None):
+        """
+        Return the team if the resolved role passes ``has_access``, otherwise None.
+        """
+        if not has_access(pk):
+            return None
+        teams = Team.objects.filter(pk=pk)
+        if only_fields:
+            teams = teams.only(*only_fields, "updated_at")
+        return teams.first()
+
+    def get_etag(self, request, pk, updated_at):
+        # The query string selects the representation (?fields=, ?omit=)
+        return make_weak_etag(pk, updated_at.isoformat(), request.get_full_path())
+
+    def can_transfer(self, access, team, validated_data):
+        owner = validated_data.get("owner")
+        return owner is None or owner.pk == team.owner_id or access.is_owner(team.pk)
+
+
+class TeamBulkView(APIView):
+    permission_classes = [IsAuthenticated]
+    batch_size = 1000
+
+    @swagger_auto_schema(
+        tags=["Teams"],
+        operation_description=(
+            "Create, update and delete many teams in a single transaction. "
+            "Either every operation is applied or none is, and validation errors are reported per item."
+        ),
+        request_body=TeamBulkSerializer,
+        responses={
+            200: TeamBulkResultSerializer,
+            400: "Bad Request - Invalid input data, errors are reported per item",
+            401: "Unauthorized - Authentication credentials were not provided",
+            403: "Forbidden - You do not have permission to perform this action",
+        },
+    )
+    def post(self, request):
+        serializer = TeamBulkSerializer(data=request.data)
+        if not serializer.is_valid():
+            return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+
+        creates = serializer.validated_data.get("create", [])
+        updates = serializer.validated_data.get("update", [])
+        deletes = serializer.validated_data.get("delete", [])
+
+        # Resolve every referenced team and owner up front, one query each
+        access = get_team_access(request)
+        teams = Team.objects.filter(
+            pk__in=[item["id"] for item in updates] + deletes
+        ).in_bulk()
+        owners = User.objects.in_bulk(
+            {item["owner"] for item in updates if "owner" in item}
+        )
+
+        errors = self.get_errors(access, updates, deletes, teams, owners)
+        if errors:
+            return Response(errors, status=status.HTTP_400_BAD_REQUEST)
+
+        affected_user_ids = {request.user.pk, *owners}
+        affected_user_ids.update(team.owner_id for team in teams.values())
+
+        now = timezone.now()
+        updated_fields = {"updated_at"}
+        updated_teams = []
+        for item in updates:
+            team = teams[item["id"]]
+            if "name" in item:
+                team.name = item["name"]
+                updated_fields.add("name")
+            if "owner" in item:
+                team.owner = owners[item["owner"]]
+                updated_fields.add("owner")
+            # bulk_update() does not apply auto_now
+            team.updated_at = now
+            updated_teams.append(team)
+
+        with transaction.atomic():
+            created_teams = Team.objects.bulk_create(
+                [Team(owner=request.user, **item) for item in creates],
+                batch_size=self.batch_size,
+            )
+            if updated_teams:
+                Team.objects.bulk_update(
+                    updated_teams, sorted(updated_fields), batch_size=self.batch_size
+                )
+            if deletes:
+                delete_teams(deletes)
+
+            # bulk_create() and bulk_update() do not send post_save
+            transaction.on_commit(
+                lambda: invalidate_team_viewers(
+                    [team.pk for team in updated_teams], *affected_user_ids
+                )
+            )
+
+        return Response(
+            {
+                "create": TeamSerializer(created_teams, many=True).data,
+                "update": TeamSerializer(updated_teams, many=True).data,
+                "delete": [str(pk) for pk in deletes],
+            },
+            status=status.HTTP_200_OK,
+        )
+
+    def get_errors(self, access, updates, deletes, teams, owners):
+        errors = {}
+
+        update_errors = []
+        for item in updates:
+            item_errors = {}
+            if item["id"] not in teams or not access.can_manage(item["id"]):
+                item_errors["id"] = [
+                    "Team not found or you don't have permission to update it"
+                ]
+            elif (
+                "owner" in item
+                and item["owner"] != teams[item["id"]].owner_id
+                and not access.is_owner(item["id"])
+            ):
+                item_errors["owner"] = ["Only the team owner can transfer ownership"]
+            if "owner" in item and item["owner"] not in owners:
+                item_errors["owner"] = [
+                    f'Invalid pk "{item["owner"]}" - object does not exist.'
+                ]
+            update_errors.append(item_errors)
+        if any(update_errors):
+            errors["update"] = update_errors
+
+        delete_errors = {
+            index: ["Team not found or you don't have permission to delete it"]
+            for index, pk in enumerate(deletes)
+            if pk not in teams or not access.is_owner(pk)
+        }
+        if delete_errors:
+            errors["delete"] = delete_errors
+
+        return errors
+
+
+class TeamExportView(APIView):
+    permission_classes = [IsAuthenticated]
+    renderer_classes = [NDJSONRenderer, CSVRenderer]
+    chunk_size = 2000
+
+    @swagger_auto_schema(
+        tags=["Teams"],
+        operation_description=(
+            "Stream every team you can access, with its members, projects and tasks. "
+            "NDJSON tags each line with its type and includes all resources; "
+            "CSV exports the single resource given by the resource parameter."
+        ),
+        manual_parameters=[
+            openapi.Parameter(
+                "format",
+                openapi.IN_QUERY,
+                description="Export format (or send an Accept header)",
+                type=openapi.TYPE_STRING,
+                enum=["ndjson", "csv"],
+                required=False,
+            ),
+            openapi.Parameter(
+                "resource",
+                openapi.IN_QUERY,
+                description="Resources to export, comma-separated (CSV takes exactly one, default teams)",
+                type=openapi.TYPE_STRING,
+                required=False,
+            ),
+        ],
+        responses={
+            200: "Streamed NDJSON or CSV export",
+            400: "Bad Request - Unknown resource, or several resources requested as CSV",
+            401: "Unauthorized - Authentication credentials were not provided",
+        },
+    )
+    def get(self, request):
+        names = [
+            name.strip()
+            for name in request.GET.get("resource", "").split(",")
+            if name.strip()
+        ]
+        unknown = set(names) - set(EXPORT_RESOURCES)
+        if unknown:
+            return Response(
+                {"resource": [f"Unknown resource(s): {', '.join(sorted(unknown))}"]},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        access = get_team_access(request)
+        export_format = request.accepted_renderer.format
+        if export_format == "csv":
+            if len(names) > 1:
+                return Response(
+                    {"resource": ["CSV exports take a single resource"]},
+                    status=status.HTTP_400_BAD_REQUEST,
+                )
+            resource = EXPORT_RESOURCES[names[0] if names else "teams"]
+            content = stream_csv(
+                resource.get_rows(access, self.chunk_size), resource.columns
+            )
+            filename = f"{resource.name}.csv"
+        else:
+            resources = [
+                resource
+                for resource in EXPORT_RESOURCES.values()
+                if not names or resource.name in names
+            ]
+            content = self.stream_resources(access, resources)
+            filename = "teams.ndjson"
+
+        response = StreamingHttpResponse(
+            content, content_type=request.accepted_renderer.media_type
+        )
+        response["Content-Disposition"] = f'attachment; filename="{filename}"'
+        return response
+
+    def stream_resources(self, access, resources):
+        # Resources are queried one after the other as the stream is consumed
+        for resource in resources:
+            yield from stream_ndjson(
+                resource.get_rows(access, self.chunk_size),
+                resource.columns,
+                record_type=resource.name,
+            )
@@ -1,9 +1,10 @@
 from django.contrib import admin
 from django.contrib.auth.admin import UserAdmin
+from common.admin import EstimatedCountAdminMixin
 from .models import User
 
 
-class UserAccountAdmin(UserAdmin):
+class UserAccountAdmin(EstimatedCountAdminMixin, UserAdmin):
     list_display = ('id', 'username', 'email', 'is_staff', 'is_active',)
     list_filter = ('is_staff', 'is_active',)
     fieldsets = (
@@ -20,7 +21,9 @@ class UserAccountAdmin(UserAdmin):
             'fields': ('username', 'email', 'password1', 'password2', 'is_staff', 'is_active')}
          ),
     )
-    search_fields = ('username', 'email',)
+    # Prefix matches, served by the UPPER() indexes of the users table
+    search_fields = ('^username', '^email',)
+    # Served by the unique index on username
     ordering = ('username',)
     readonly_fields = ('id',)
 
@@ -0,0 +1,40 @@
+# Generated by Django 5.2 on 2026-10-18 00:52
+
+from django.db import migrations
+
+INDEXES = {
+    "user_email_upper_idx": "email",
+    "user_username_upper_idx": "username",
+}
+
+
+def recreate_indexes(schema_editor, opclass):
+    # The admin searches by prefix (istartswith, UPPER(column) LIKE 'X%'),
+    # which a plain index only serves under the C collation. With the
+    # pattern operator class it serves both prefix and exact lookups.
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    for name, column in INDEXES.items():
+        schema_editor.execute(f"DROP INDEX IF EXISTS {name}")
+        schema_editor.execute(
+            f'CREATE INDEX {name} ON users_user (UPPER("{column}"){opclass})'
+        )
+
+
+def use_pattern_ops(apps, schema_editor):
+    recreate_indexes(schema_editor, " text_pattern_ops")
+
+
+def use_default_ops(apps, schema_editor):
+    recreate_indexes(schema_editor, "")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("users", "0006_user_upper_indexes"),
+    ]
+
+    operations = [
+        migrations.RunPython(use_pattern_ops, use_default_ops),
+    ]
@@ -2,6 +2,7 @@ from uuid import uuid4
 
 from django.contrib.auth.models import AbstractUser
 from django.db import models
+from django.db.models.functions import Upper
 
 
 class User(AbstractUser):
@@ -15,3 +16,10 @@ class User(AbstractUser):
     class Meta:
         verbose_name = "User Account"
         verbose_name_plural = "User Accounts"
+        indexes = [
+            # Case-insensitive exact and prefix lookups (iexact, istartswith),
+            # e.g. the admin search. On PostgreSQL they are created with the
+            # text_pattern_ops operator class (migration 0007).
+            models.Index(Upper("email"), name="user_email_upper_idx"),
+            models.Index(Upper("username"), name="user_username_upper_idx"),
+        ]
@@ -1,9 +1,10 @@
 from rest_framework import serializers
 
 from apps.users.models import User
+from common.serializers import DynamicFieldsMixin
 
 
-class UserProfileSerializer(serializers.ModelSerializer):
+class UserProfileSerializer(DynamicFieldsMixin, serializers.ModelSerializer):
     class Meta:
         model = User
         fields = [
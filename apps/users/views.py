@@ -1,3 +1,4 @@
+from drf_yasg import openapi
 from drf_yasg.utils import swagger_auto_schema
 from rest_framework import status
 from rest_framework.permissions import IsAuthenticated
@@ -16,10 +17,30 @@ class UserProfileView(APIView):
     @swagger_auto_schema(
         tags=["Users"],
         operation_description="Get current user profile",
+        manual_parameters=[
+            openapi.Parameter(
+                "fields",
+                openapi.IN_QUERY,
+                description="Comma-separated list of fields to return",
+                type=openapi.TYPE_STRING,
+                required=False,
+            ),
+            openapi.Parameter(
+                "omit",
+                openapi.IN_QUERY,
+                description="Comma-separated list of fields to leave out",
+                type=openapi.TYPE_STRING,
+                required=False,
+            ),
+        ],
         responses={200: UserProfileSerializer},
     )
     def get(self, request):
-        serializer = self.serializer_class(request.user)
+        # The user is already loaded by authentication, so only serialization
+        # is narrowed here.
+        serializer = self.serializer_class(
+            request.user, **self.serializer_class.get_field_params(request)
+        )
         return Response(serializer.data, status=status.HTTP_200_OK)
 
     @swagger_auto_schema(
@@ -0,0 +1,17 @@
+from django.contrib import admin
+
+from apps.worklogs.models import WorkLog
+from common.admin import EstimatedCountAdminMixin
+
+
+class WorkLogAdmin(EstimatedCountAdminMixin, admin.ModelAdmin):
+    list_display = ("date", "user", "task", "minutes")
+    list_select_related = ("user", "task")
+    list_filter = ("date",)
+    raw_id_fields = ("task", "user")
+    # Copied from the task on save
+    exclude = ("project",)
+    list_per_page = 10
+
+
+admin.site.register(WorkLog, WorkLogAdmin)
@@ -0,0 +1,9 @@
+from django.apps import AppConfig
+
+
+class WorklogsConfig(AppConfig):
+    default_auto_field = "django.db.models.BigAutoField"
+    name = "apps.worklogs"
+
+    def ready(self):
+        from apps.worklogs import signals  # noqa: F401
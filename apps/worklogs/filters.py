@@ -0,0 +1,15 @@
+import django_filters
+
+from apps.worklogs.models import WorkLog
+
+
+class WorkLogFilter(django_filters.FilterSet):
+    project = django_filters.UUIDFilter(field_name="project")
+    task = django_filters.UUIDFilter(field_name="task")
+    user = django_filters.UUIDFilter(field_name="user")
+    date_before = django_filters.DateFilter(field_name="date", lookup_expr="lte")
+    date_after = django_filters.DateFilter(field_name="date", lookup_expr="gte")
+
+    class Meta:
+        model = WorkLog
+        fields = []
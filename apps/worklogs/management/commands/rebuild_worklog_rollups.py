@@ -0,0 +1,33 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.worklogs.rollups import rebuild_worklog_rollups, verify_worklog_rollups
+
+
+class Command(BaseCommand):
+    help = (
+        "Recompute the per-day and per-week work log rollups from the work log "
+        "table, or only report rollups that have drifted"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--verify",
+            action="store_true",
+            help="Only compare the rollups with the work log table",
+        )
+
+    def handle(self, *args, **options):
+        if not options["verify"]:
+            rows = rebuild_worklog_rollups()
+            self.stdout.write(f"Rebuilt {rows:,} rollup row(s)")
+            return
+
+        mismatches = verify_worklog_rollups()
+        for model_name, key, stored, actual in mismatches:
+            self.stdout.write(f"{model_name} {key}: stored {stored}, actual {actual}")
+        if mismatches:
+            raise CommandError(
+                f"{len(mismatches)} rollup(s) out of date, run without --verify "
+                "to rebuild them"
+            )
+        self.stdout.write("Work log rollups are up to date")
@@ -0,0 +1,4 @@
+from apps.worklogs.models.rollup import WorkLogDay, WorkLogWeek
+from apps.worklogs.models.worklog import WorkLog
+
+__all__ = ["WorkLog", "WorkLogDay", "WorkLogWeek"]
@@ -0,0 +1,50 @@
+from django.db import models
+
+from apps.projects.models import Project
+from apps.tasks.models import Task
+from apps.users.models import User
+
+
+class WorkLogRollup(models.Model):
+    """
+    Minutes logged per task and user over a period, kept up to date by the
+    work log signals (see apps.worklogs.rollups).
+    """
+
+    project = models.ForeignKey(
+        Project, on_delete=models.CASCADE, related_name="+", db_index=False
+    )
+    task = models.ForeignKey(
+        Task, on_delete=models.CASCADE, related_name="+", db_index=False
+    )
+    user = models.ForeignKey(
+        User, on_delete=models.CASCADE, related_name="+", db_index=False
+    )
+    # First day of the period
+    period = models.DateField()
+    minutes = models.IntegerField(default=0)
+
+    class Meta:
+        abstract = True
+
+
+class WorkLogDay(WorkLogRollup):
+    class Meta:
+        unique_together = ("task", "user", "period")
+        indexes = [
+            models.Index(fields=["project", "period"], name="worklog_day_project_idx"),
+            models.Index(fields=["user", "period"], name="worklog_day_user_idx"),
+        ]
+
+
+class WorkLogWeek(WorkLogRollup):
+    """
+    Weeks start on Monday.
+    """
+
+    class Meta:
+        unique_together = ("task", "user", "period")
+        indexes = [
+            models.Index(fields=["project", "period"], name="worklog_week_project_idx"),
+            models.Index(fields=["user", "period"], name="worklog_week_user_idx"),
+        ]
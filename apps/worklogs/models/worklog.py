@@ -0,0 +1,54 @@
+from uuid import uuid4
+
+from django.core.validators import MaxValueValidator, MinValueValidator
+from django.db import models
+
+from apps.projects.models import Project
+from apps.tasks.models import Task
+from apps.users.models import User
+
+
+class WorkLog(models.Model):
+    """
+    Time spent by a user on a task on a given day.
+
+    The project is copied from the task, so that the rollups (see
+    apps.worklogs.rollups) can be keyed and scoped without a join.
+    """
+
+    id = models.UUIDField(primary_key=True, default=uuid4, editable=False)
+    task = models.ForeignKey(Task, on_delete=models.CASCADE, related_name="work_logs")
+    project = models.ForeignKey(
+        Project, on_delete=models.CASCADE, related_name="work_logs", db_index=False
+    )
+    # Indexed as the leading column of the index below
+    user = models.ForeignKey(
+        User, on_delete=models.CASCADE, related_name="work_logs", db_index=False
+    )
+    date = models.DateField()
+    minutes = models.PositiveIntegerField(
+        validators=[MinValueValidator(1), MaxValueValidator(24 * 60)]
+    )
+    note = models.TextField(blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        indexes = [
+            # A user's logs, most recent day first (the list ordering)
+            models.Index(fields=["user", "-date", "-id"], name="worklog_user_date_idx"),
+        ]
+
+    def __str__(self):
+        return f"{self.minutes} min on {self.date}"
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        # Remember the rolled up key and minutes so that an update can move
+        # them between rollup rows
+        instance._loaded_rollup = {
+            name: instance.__dict__.get(name)
+            for name in ("project_id", "task_id", "user_id", "date", "minutes")
+        }
+        return instance
@@ -0,0 +1,126 @@
+from collections import Counter
+from datetime import timedelta
+
+from django.db import connection, transaction
+from django.db.models import F, Sum
+
+from apps.worklogs.models import WorkLog, WorkLogDay, WorkLogWeek
+
+# Rollup models and the start of the period a day belongs to
+ROLLUPS = {
+    "day": (WorkLogDay, lambda day: day),
+    "week": (WorkLogWeek, lambda day: day - timedelta(days=day.weekday())),
+}
+
+
+def adjust_worklog_rollups(deltas):
+    """
+    Apply ``{(project_id, task_id, user_id, date): minutes}`` changes to the
+    day and week rollups.
+    """
+    deltas = {key: delta for key, delta in deltas.items() if delta}
+    for model, get_period in ROLLUPS.values():
+        periods = Counter()
+        for (project_id, task_id, user_id, day), delta in deltas.items():
+            periods[project_id, task_id, user_id, get_period(day)] += delta
+        # Rows are always updated in key order so that concurrent writers
+        # cannot deadlock on each other
+        for (project_id, task_id, user_id, period), delta in sorted(periods.items()):
+            increment(
+                model,
+                delta,
+                project_id=project_id,
+                task_id=task_id,
+                user_id=user_id,
+                period=period,
+            )
+
+
+def increment(model, delta, project_id, **key):
+    rows = model.objects.filter(**key)
+    if not delta or rows.update(minutes=F("minutes") + delta) or delta < 0:
+        return
+    # Rows are created on first use. A decrement of a missing row is dropped,
+    # as it can only happen while its task or user is deleted.
+    model.objects.get_or_create(**key, defaults={"project_id": project_id})
+    rows.update(minutes=F("minutes") + delta)
+
+
+def get_rollup_key(values):
+    return (
+        values["project_id"],
+        values["task_id"],
+        values["user_id"],
+        values["date"],
+    )
+
+
+def sum_work_logs(period):
+    """
+    Sum the logged minutes per ``(project_id, task_id, user_id, period)``
+    from the work log table, returning a ``Counter``.
+    """
+    _, get_period = ROLLUPS[period]
+    rows = (
+        WorkLog.objects.values_list("project_id", "task_id", "user_id", "date")
+        .annotate(total=Sum("minutes"))
+        .order_by()
+    )
+    totals = Counter()
+    for project_id, task_id, user_id, day, total in rows:
+        totals[project_id, task_id, user_id, get_period(day)] += total
+    return totals
+
+
+def get_stored_rollups(period):
+    model, _ = ROLLUPS[period]
+    return Counter(
+        {
+            (project_id, task_id, user_id, period_start): minutes
+            for project_id, task_id, user_id, period_start, minutes in model.objects.values_list(
+                "project_id", "task_id", "user_id", "period", "minutes"
+            )
+        }
+    )
+
+
+def verify_worklog_rollups():
+    """
+    Compare the stored rollups with the work log table. Returns a list of
+    ``(model_name, key, stored, actual)`` mismatches.
+    """
+    mismatches = []
+    for period, (model, _) in ROLLUPS.items():
+        stored, actual = get_stored_rollups(period), sum_work_logs(period)
+        for key in sorted(set(stored) | set(actual)):
+            if stored[key] != actual[key]:
+                mismatches.append((model.__name__, key, stored[key], actual[key]))
+    return mismatches
+
+
+@transaction.atomic
+def rebuild_worklog_rollups():
+    """
+    Recompute every rollup from the work log table.
+    """
+    if connection.vendor == "postgresql":
+        # Block work log writes (not reads) until the new rollups are committed
+        with connection.cursor() as cursor:
+            cursor.execute(f"LOCK TABLE {WorkLog._meta.db_table} IN SHARE MODE")
+
+    rows = 0
+    for period, (model, _) in ROLLUPS.items():
+        totals = sum_work_logs(period)
+        model.objects.all().delete()
+        model.objects.bulk_create(
+            model(
+                project_id=project_id,
+                task_id=task_id,
+                user_id=user_id,
+                period=period_start,
+                minutes=minutes,
+            )
+            for (project_id, task_id, user_id, period_start), minutes in totals.items()
+        )
+        rows += len(totals)
+    return rows
@@ -0,0 +1,111 @@
+from rest_framework import serializers
+
+from apps.worklogs.models import WorkLog
+from apps.worklogs.rollups import ROLLUPS
+from common.serializers import DynamicFieldsMixin
+
+# Columns a report can be broken down by, besides the period
+REPORT_GROUPS = ("project", "task", "user")
+
+
+class WorkLogSerializer(DynamicFieldsMixin, serializers.ModelSerializer):
+    class Meta:
+        model = WorkLog
+        fields = "__all__"
+
+
+class WorkLogCreateSerializer(serializers.ModelSerializer):
+    """
+    Serializer for logging time on a task of one of the user's teams.
+    Expects the requesting user's TeamAccessResolver as ``access`` in the context.
+    """
+
+    class Meta:
+        model = WorkLog
+        fields = ["task", "date", "minutes", "note"]
+
+    def validate_task(self, task):
+        if not self.context["access"].can_view(task.project.team_id):
+            raise serializers.ValidationError(
+                f'Invalid pk "{task.pk}" - object does not exist.'
+            )
+        return task
+
+
+class WorkLogUpdateSerializer(serializers.ModelSerializer):
+    """
+    Serializer for correcting a work log. All fields are optional; a log
+    cannot be moved to another task.
+    """
+
+    class Meta:
+        model = WorkLog
+        fields = ["date", "minutes", "note"]
+
+
+class WorkLogReportSerializer(serializers.Serializer):
+    """
+    Query parameters of the work log report.
+    """
+
+    team = serializers.UUIDField(required=False)
+    project = serializers.UUIDField(required=False)
+    user = serializers.UUIDField(required=False)
+    period = serializers.ChoiceField(choices=list(ROLLUPS), default="week")
+    start = serializers.DateField(required=False)
+    end = serializers.DateField(required=False)
+    group_by = serializers.CharField(
+        required=False,
+        help_text=f"Comma-separated list of {', '.join(REPORT_GROUPS)}",
+    )
+
+    def validate_group_by(self, value):
+        groups = [group.strip() for group in value.split(",") if group.strip()]
+        unknown = sorted(set(groups) - set(REPORT_GROUPS))
+        if unknown:
+            raise serializers.ValidationError(
+                f"Unknown group(s): {', '.join(unknown)}."
+            )
+        return list(dict.fromkeys(groups))
+
+    def validate(self, attrs):
+        if ("team" in attrs) == ("project" in attrs):
+            raise serializers.ValidationError("Pass exactly one of project or team.")
+        if "start" in attrs and "end" in attrs and attrs["start"] > attrs["end"]:
+            raise serializers.ValidationError(
+                {"end": ["The end date must not be before the start date."]}
+            )
+        attrs.setdefault("group_by", [])
+        return attrs
+
+
+class WorkLogReportRowSerializer(serializers.Serializer):
+    period = serializers.DateField(help_text="First day of the period")
+    project = serializers.UUIDField(required=False)
+    task = serializers.UUIDField(required=False)
+    user = serializers.UUIDField(required=False)
+    minutes = serializers.IntegerField()
+
+
+class WorkLogReportResultSerializer(serializers.Serializer):
+    """
+    Serializer for documenting work log reports in Swagger.
+    """
+
+    period = serializers.ChoiceField(choices=list(ROLLUPS))
+    results = WorkLogReportRowSerializer(many=True)
+    total_minutes = serializers.IntegerField()
+
+
+class WorkLogListSerializer(serializers.Serializer):
+    """
+    Serializer for documenting work log pages in Swagger.
+    """
+
+    next = serializers.URLField(
+        allow_null=True, help_text="URL to the next (older) page, if any"
+    )
+    previous = serializers.URLField(
+        allow_null=True, help_text="URL to the previous (newer) page, if any"
+    )
+    results = WorkLogSerializer(many=True)
@@ -0,0 +1,45 @@
+from collections import Counter
+
+from django.db.models.signals import post_save, pre_delete, pre_save
+from django.dispatch import receiver
+
+from apps.worklogs.models import WorkLog
+from apps.worklogs.rollups import adjust_worklog_rollups, get_rollup_key
+
+
+def get_rollup_values(instance):
+    return {
+        "project_id": instance.project_id,
+        "task_id": instance.task_id,
+        "user_id": instance.user_id,
+        "date": instance.date,
+        "minutes": instance.minutes,
+    }
+
+
+@receiver(pre_save, sender=WorkLog)
+def set_worklog_project(sender, instance, **kwargs):
+    # The project follows the task, also when the log moves to another task
+    loaded = getattr(instance, "_loaded_rollup", None)
+    if loaded is None or loaded["task_id"] != instance.task_id:
+        instance.project_id = instance.task.project_id
+
+
+@receiver(post_save, sender=WorkLog)
+def roll_up_saved_worklog(sender, instance, created, **kwargs):
+    deltas = Counter()
+    loaded = getattr(instance, "_loaded_rollup", None)
+    if not created and loaded is not None:
+        deltas[get_rollup_key(loaded)] -= loaded["minutes"]
+    values = get_rollup_values(instance)
+    deltas[get_rollup_key(values)] += values["minutes"]
+    adjust_worklog_rollups(deltas)
+    instance._loaded_rollup = values
+
+
+# Rolled up before the delete (in the same transaction), like the task
+# counters, as the task may already be gone by post_delete
+@receiver(pre_delete, sender=WorkLog)
+def roll_up_deleted_worklog(sender, instance, **kwargs):
+    values = getattr(instance, "_loaded_rollup", None) or get_rollup_values(instance)
+    adjust_worklog_rollups({get_rollup_key(values): -values["minutes"]})
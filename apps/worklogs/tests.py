@@ -0,0 +1,131 @@
+from datetime import date
+
+from django.test import TestCase
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from apps.projects.models import Project
+from apps.tasks.models import Task
+from apps.teams.models import Team, TeamMember
+from apps.users.models import User
+from apps.worklogs.models import WorkLogDay, WorkLogWeek
+from apps.worklogs.rollups import rebuild_worklog_rollups, verify_worklog_rollups
+from common.models import TeamRole
+
+
+class WorkLogRollupTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.owner = User.objects.create_user(
+            email="owner@example.com", username="owner", password="password"
+        )
+        cls.member = User.objects.create_user(
+            email="member@example.com", username="member", password="password"
+        )
+        cls.team = Team.objects.create(name="Team", owner=cls.owner)
+        TeamMember.objects.create(team=cls.team, user=cls.member, role=TeamRole.MEMBER)
+        cls.project = Project.objects.create(name="Project", team=cls.team)
+        cls.task = Task.objects.create(project=cls.project, title="Task")
+
+    def setUp(self):
+        self.client = APIClient()
+        self.client.force_authenticate(self.member)
+
+    def log(self, day, minutes, task=None):
+        response = self.client.post(
+            reverse("worklogs"),
+            {"task": str((task or self.task).pk), "date": day, "minutes": minutes},
+            format="json",
+        )
+        self.assertEqual(response.status_code, 201, response.content)
+        return response.json()["id"]
+
+    def get_report(self, **params):
+        response = self.client.get(
+            reverse("worklog-report"), {"project": self.project.pk, **params}
+        )
+        self.assertEqual(response.status_code, 200, response.content)
+        return response.json()
+
+    def test_rollups_follow_creates_updates_and_deletes(self):
+        # Monday and Wednesday of one week, then the next Monday
+        first = self.log("2026-10-12", 30)
+        second = self.log("2026-10-14", 45)
+        self.log("2026-10-19", 60)
+
+        self.client.patch(
+            reverse("worklog-detail", args=[first]),
+            {"date": "2026-10-13", "minutes": 90},
+            format="json",
+        )
+        self.client.delete(reverse("worklog-detail", args=[second]))
+
+        self.assertEqual(verify_worklog_rollups(), [])
+        self.assertEqual(
+            dict(
+                WorkLogDay.objects.filter(minutes__gt=0).values_list(
+                    "period", "minutes"
+                )
+            ),
+            {date(2026, 10, 13): 90, date(2026, 10, 19): 60},
+        )
+        self.assertEqual(
+            dict(WorkLogWeek.objects.values_list("period", "minutes")),
+            {date(2026, 10, 12): 90, date(2026, 10, 19): 60},
+        )
+
+    def test_rebuild_matches_incremental_rollups(self):
+        self.log("2026-10-12", 30)
+        self.log("2026-10-14", 45)
+        WorkLogWeek.objects.update(minutes=0)
+        self.assertNotEqual(verify_worklog_rollups(), [])
+
+        self.assertEqual(rebuild_worklog_rollups(), 3)
+        self.assertEqual(verify_worklog_rollups(), [])
+
+    def test_report(self):
+        other = Task.objects.create(project=self.project, title="Other")
+        self.log("2026-10-12", 30)
+        self.log("2026-10-14", 45, task=other)
+        self.log("2026-10-19", 60)
+
+        report = self.get_report()
+        self.assertEqual(
+            report["results"],
+            [
+                {"period": "2026-10-12", "minutes": 75},
+                {"period": "2026-10-19", "minutes": 60},
+            ],
+        )
+        self.assertEqual(report["total_minutes"], 135)
+
+        report = self.get_report(period="day", start="2026-10-13", group_by="task")
+        self.assertEqual(
+            report["results"],
+            [
+                {"period": "2026-10-14", "task": str(other.pk), "minutes": 45},
+                {"period": "2026-10-19", "task": str(self.task.pk), "minutes": 60},
+            ],
+        )
+
+    def test_report_parameters_are_validated(self):
+        for params in [
+            {"team": self.team.pk},
+            {"group_by": "team"},
+            {"start": "2026-10-20", "end": "2026-10-19"},
+        ]:
+            with self.subTest(params=params):
+                response = self.client.get(
+                    reverse("worklog-report"), {"project": self.project.pk, **params}
+                )
+                self.assertEqual(response.status_code, 400)
+
+    def test_report_of_another_team_is_not_found(self):
+        stranger = User.objects.create_user(
+            email="stranger@example.com", username="stranger", password="password"
+        )
+        self.client.force_authenticate(stranger)
+        response = self.client.get(
+            reverse("worklog-report"), {"project": self.project.pk}
+        )
+        self.assertEqual(response.status_code, 404)
@@ -0,0 +1,9 @@
+from django.urls import path
+
+from apps.worklogs.views import WorkLogDetailView, WorkLogReportView, WorkLogView
+
+urlpatterns = [
+    path("", WorkLogView.as_view(), name="worklogs"),
+    path("report/", WorkLogReportView.as_view(), name="worklog-report"),
+    path("<uuid:pk>/", WorkLogDetailView.as_view(), name="worklog-detail"),
+]
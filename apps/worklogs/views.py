@@ -0,0 +1,313 @@
+from django.db.models import Sum
+from django_filters.utils import translate_validation
+from drf_yasg import openapi
+from drf_yasg.utils import swagger_auto_schema
+from rest_framework import status
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from apps.projects.models import Project
+from apps.teams.access import get_team_access
+from apps.worklogs.filters import WorkLogFilter
+from apps.worklogs.models import WorkLog
+from apps.worklogs.paginations import WorkLogPagination
+from apps.worklogs.rollups import ROLLUPS
+from apps.worklogs.serializers import (
+    WorkLogCreateSerializer,
+    WorkLogListSerializer,
+    WorkLogReportResultSerializer,
+    WorkLogReportSerializer,
+    WorkLogSerializer,
+    WorkLogUpdateSerializer,
+)
+from common.fast_serializers import get_compiled_serializer
+
+
+def get_query_parameter(name, description, type=openapi.TYPE_STRING, **kwargs):
+    return openapi.Parameter(
+        name, openapi.IN_QUERY, description=description, type=type, **kwargs
+    )
+
+
+class WorkLogView(APIView):
+    permission_classes = [IsAuthenticated]
+    serializer_class = WorkLogSerializer
+    pagination_class = WorkLogPagination
+    filter_class = WorkLogFilter
+
+    @swagger_auto_schema(
+        tags=["Work logs"],
+        operation_description=(
+            "List the work logs of your teams' projects, most recent day first, "
+            "with keyset pagination"
+        ),
+        manual_parameters=[
+            get_query_parameter("project", "Project ID", format=openapi.FORMAT_UUID),
+            get_query_parameter("task", "Task ID", format=openapi.FORMAT_UUID),
+            get_query_parameter("user", "User ID", format=openapi.FORMAT_UUID),
+            get_query_parameter(
+                "date_before",
+                "Logged on or before this day",
+                format=openapi.FORMAT_DATE,
+            ),
+            get_query_parameter(
+                "date_after", "Logged on or after this day", format=openapi.FORMAT_DATE
+            ),
+            get_query_parameter("cursor", "Opaque pagination cursor"),
+            get_query_parameter(
+                "page_size", "Number of logs per page (max 200)", openapi.TYPE_INTEGER
+            ),
+            get_query_parameter("fields", "Comma-separated list of fields to return"),
+            get_query_parameter("omit", "Comma-separated list of fields to leave out"),
+        ],
+        responses={
+            200: WorkLogListSerializer,
+            400: "Bad Request - Invalid filter value",
+            401: "Unauthorized - Authentication credentials were not provided",
+        },
+    )
+    def get(self, request):
+        field_params = self.serializer_class.get_field_params(request)
+        reader = get_compiled_serializer(self.serializer_class, **field_params)
+
+        work_logs = get_team_access(request).filter_by_team(
+            WorkLog.objects.all(), lookup="project__team"
+        )
+        work_logs = work_logs.values(*{*reader.value_names, "date", "id"})
+
+        filter_set = self.filter_class(request.GET, queryset=work_logs)
+        if not filter_set.is_valid():
+            return Response(
+                translate_validation(filter_set.errors).detail,
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        paginator = self.pagination_class()
+        page = paginator.paginate_queryset(filter_set.qs, request)
+        return paginator.get_paginated_response(reader.serialize(page))
+
+    @swagger_auto_schema(
+        tags=["Work logs"],
+        operation_description="Log time spent on a task of one of your teams",
+        request_body=WorkLogCreateSerializer,
+        responses={
+            201: WorkLogSerializer,
+            400: "Bad Request - Invalid input data",
+            401: "Unauthorized - Authentication credentials were not provided",
+        },
+    )
+    def post(self, request):
+        serializer = WorkLogCreateSerializer(
+            data=request.data, context={"access": get_team_access(request)}
+        )
+        if serializer.is_valid():
+            work_log = serializer.save(user=request.user)
+            return Response(
+                WorkLogSerializer(work_log).data, status=status.HTTP_201_CREATED
+            )
+        return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+
+
+class WorkLogDetailView(APIView):
+    permission_classes = [IsAuthenticated]
+
+    @swagger_auto_schema(
+        tags=["Work logs"],
+        operation_description="Get a specific work log by ID",
+        responses={
+            200: WorkLogSerializer,
+            401: "Unauthorized - Authentication credentials were not provided",
+            404: "Not Found - Work log not found or you don't have permission to access it",
+        },
+    )
+    def get(self, request, pk):
+        work_log = get_work_log(request, pk)
+        if work_log is None:
+            return Response(
+                {
+                    "error": "Work log not found or you don't have permission to access it"
+                },
+                status=status.HTTP_404_NOT_FOUND,
+            )
+        return Response(WorkLogSerializer(work_log).data, status=status.HTTP_200_OK)
+
+    @swagger_auto_schema(
+        tags=["Work logs"],
+        operation_description=(
+            "Correct a work log (its author or a team owner/admin only)"
+        ),
+        request_body=WorkLogUpdateSerializer,
+        responses={
+            200: WorkLogSerializer,
+            400: "Bad Request - Invalid input data",
+            401: "Unauthorized - Authentication credentials were not provided",
+            404: "Not Found - Work log not found or you don't have permission to update it",
+        },
+    )
+    def patch(self, request, pk):
+        work_log = get_work_log(request, pk, manage=True)
+        if work_log is None:
+            return Response(
+                {
+                    "error": "Work log not found or you don't have permission to update it"
+                },
+                status=status.HTTP_404_NOT_FOUND,
+            )
+
+        serializer = WorkLogUpdateSerializer(work_log, data=request.data, partial=True)
+        if serializer.is_valid():
+            work_log = serializer.save()
+            return Response(WorkLogSerializer(work_log).data, status=status.HTTP_200_OK)
+        return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+
+    @swagger_auto_schema(
+        tags=["Work logs"],
+        operation_description=(
+            "Delete a work log (its author or a team owner/admin only)"
+        ),
+        responses={
+            204: "No Content - Work log successfully deleted",
+            401: "Unauthorized - Authentication credentials were not provided",
+            404: "Not Found - Work log not found or you don't have permission to delete it",
+        },
+    )
+    def delete(self, request, pk):
+        work_log = get_work_log(request, pk, manage=True)
+        if work_log is None:
+            return Response(
+                {
+                    "error": "Work log not found or you don't have permission to delete it"
+                },
+                status=status.HTTP_404_NOT_FOUND,
+            )
+
+        work_log.delete()
+        return Response(status=status.HTTP_204_NO_CONTENT)
+
+
+class WorkLogReportView(APIView):
+    permission_classes = [IsAuthenticated]
+
+    @swagger_auto_schema(
+        tags=["Work logs"],
+        operation_description=(
+            "Get the minutes logged in a project or a team per day or week, "
+            "optionally broken down by project, task and user. Read from "
+            "incrementally maintained rollups, never from the work logs."
+        ),
+        manual_parameters=[
+            get_query_parameter("project", "Project ID", format=openapi.FORMAT_UUID),
+            get_query_parameter("team", "Team ID", format=openapi.FORMAT_UUID),
+            get_query_parameter("user", "Only this user", format=openapi.FORMAT_UUID),
+            get_query_parameter(
+                "period", "Period length (default week)", enum=list(ROLLUPS)
+            ),
+            get_query_parameter(
+                "start",
+                "First day to include (rounded down to its period)",
+                format=openapi.FORMAT_DATE,
+            ),
+            get_query_parameter(
+                "end", "Last day to include", format=openapi.FORMAT_DATE
+            ),
+            get_query_parameter(
+                "group_by",
+                "Comma-separated list of project, task and user",
+            ),
+        ],
+        responses={
+            200: WorkLogReportResultSerializer,
+            400: "Bad Request - Invalid query parameters",
+            401: "Unauthorized - Authentication credentials were not provided",
+            404: "Not Found - Project or team not found or you don't have permission to access it",
+        },
+    )
+    def get(self, request):
+        serializer = WorkLogReportSerializer(data=request.query_params)
+        if not serializer.is_valid():
+            return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+        params = serializer.validated_data
+
+        model, get_period = ROLLUPS[params["period"]]
+        access = get_team_access(request)
+        project_id = params.get("project")
+        if project_id is not None:
+            team_id = (
+                Project.objects.filter(pk=project_id)
+                .values_list("team_id", flat=True)
+                .first()
+            )
+            if team_id is None or not access.can_view(team_id):
+                return Response(
+                    {
+                        "error": "Project not found or you don't have permission to access it"
+                    },
+                    status=status.HTTP_404_NOT_FOUND,
+                )
+            rollups = model.objects.filter(project_id=project_id)
+        else:
+            team_id = params["team"]
+            if not access.can_view(team_id):
+                return Response(
+                    {
+                        "error": "Team not found or you don't have permission to access it"
+                    },
+                    status=status.HTTP_404_NOT_FOUND,
+                )
+            rollups = model.objects.filter(
+                project_id__in=Project.objects.filter(team_id=team_id).values("pk")
+            )
+
+        # Served by the (project, period) and (user, period) indexes
+        if "user" in params:
+            rollups = rollups.filter(user_id=params["user"])
+        if "start" in params:
+            rollups = rollups.filter(period__gte=get_period(params["start"]))
+        if "end" in params:
+            rollups = rollups.filter(period__lte=params["end"])
+
+        groups = {f"{group}_id": group for group in params["group_by"]}
+        rows = (
+            rollups.values("period", *groups)
+            .annotate(total=Sum("minutes"))
+            .filter(total__gt=0)
+            .order_by("period", *groups)
+        )
+        results = [
+            {
+                "period": row["period"],
+                **{group: row[column] for column, group in groups.items()},
+                "minutes": row["total"],
+            }
+            for row in rows
+        ]
+        return Response(
+            {
+                "period": params["period"],
+                "results": results,
+                "total_minutes": sum(row["minutes"] for row in results),
+            },
+            status=status.HTTP_200_OK,
+        )
+
+
+def get_work_log(request, pk, manage=False):
+    """
+    Return the work log if it belongs to one of the user's teams, otherwise
+    None. With ``manage``, only its author or a team owner/admin gets it.
+    """
+    access = get_team_access(request)
+    work_log = (
+        access.filter_by_team(WorkLog.objects.filter(pk=pk), lookup="project__team")
+        .select_related("project")
+        .first()
+    )
+    if (
+        manage
+        and work_log is not None
+        and work_log.user_id != request.user.pk
+        and not access.can_manage(work_log.project.team_id)
+    ):
+        return None
+    return work_log
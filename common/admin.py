@@ -1,3 +1,47 @@
-from django.contrib import admin
+from django.conf import settings
+from django.core.paginator import Paginator
+from django.db import connections
+from django.utils.functional import cached_property
 
-# Register your models here.
+from common.db import estimate_count, estimate_table_count
+
+
+class EstimatedCountPaginator(Paginator):
+    """
+    Paginator for admin changelists of large tables.
+
+    On PostgreSQL the number of rows comes from the table statistics
+    (``reltuples``) when the changelist is not filtered, and from the
+    planner's estimate when it is. Either is used once it reaches
+    ``ADMIN_ESTIMATED_COUNT_THRESHOLD``; smaller results are counted
+    exactly, which is cheap and keeps the page links exact.
+    """
+
+    @cached_property
+    def count(self):
+        queryset = self.object_list
+        if (
+            hasattr(queryset, "query")
+            and connections[queryset.db].vendor == "postgresql"
+        ):
+            if queryset.query.has_filters():
+                estimate = estimate_count(queryset)
+            else:
+                estimate = estimate_table_count(queryset.model, queryset.db)
+            if estimate is not None and (
+                estimate >= settings.ADMIN_ESTIMATED_COUNT_THRESHOLD
+            ):
+                return estimate
+        return super().count
+
+
+class EstimatedCountAdminMixin:
+    """
+    Changelist settings for large tables: estimated page counts, and no
+    second COUNT(*) of the whole table to show next to filtered results.
+    Set ``list_select_related`` to the foreign keys in ``list_display``, as
+    the default follows every non-null foreign key.
+    """
+
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
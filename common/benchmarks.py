@@ -0,0 +1,31 @@
+import statistics
+import time
+
+
+def measure(func, repeat=20, warmup=2):
+    """
+    Call ``func`` repeatedly and return latency statistics in milliseconds.
+    """
+    for _ in range(warmup):
+        func()
+
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append((time.perf_counter() - start) * 1000)
+
+    timings.sort()
+    return {
+        "min": timings[0],
+        "p50": statistics.median(timings),
+        "p95": timings[min(len(timings) - 1, int(len(timings) * 0.95))],
+        "mean": statistics.fmean(timings),
+    }
+
+
+def format_stats(label, stats):
+    return (
+        f"{label:<32} min={stats['min']:8.2f}ms p50={stats['p50']:8.2f}ms "
+        f"p95={stats['p95']:8.2f}ms mean={stats['mean']:8.2f}ms"
+    )
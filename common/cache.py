@@ -0,0 +1,133 @@
+import time
+from hashlib import md5
+
+from django.core.cache import cache
+from rest_framework.response import Response
+
+from common.conditional import get_not_modified_response, set_validators
+
+registry = {}
+
+
+class VersionedCache:
+    """
+    Response cache partitioned by scope (usually a user id).
+
+    Every scope has a version key that is part of each entry key, so bumping
+    the version invalidates all of the scope's entries at once without having
+    to know or delete them. Stale entries simply expire.
+    """
+
+    def __init__(self, namespace, timeout=None):
+        self.namespace = namespace
+        self.timeout = timeout
+        registry[namespace] = self
+
+    def get_version(self, scope):
+        key = self._version_key(scope)
+        version = cache.get(key)
+        if version is None:
+            # Seed from the clock so that an evicted version key can never
+            # resurrect entries stored under an earlier version.
+            cache.add(key, time.time_ns(), timeout=None)
+            version = cache.get(key)
+        # A backend that stores nothing (the dummy cache) never has entries
+        # to invalidate
+        return 0 if version is None else version
+
+    def bump(self, *scopes):
+        for scope in {scope for scope in scopes if scope is not None}:
+            key = self._version_key(scope)
+            try:
+                cache.incr(key)
+            except ValueError:
+                cache.set(key, time.time_ns(), timeout=None)
+
+    def make_key(self, scope, request):
+        url = md5(request.build_absolute_uri().encode(), usedforsecurity=False)
+        return f"{self.namespace}:{scope}:{self.get_version(scope)}:{url.hexdigest()}"
+
+    def get_or_set(self, scope, name, default):
+        """
+        Return a named value for the scope's current version, computing it
+        with ``default()`` on a miss.
+        """
+        key = f"{self.namespace}:{scope}:{self.get_version(scope)}:{name}"
+        value = cache.get(key)
+        if value is None:
+            value = default()
+            cache.set(key, value, timeout=self.timeout)
+        return value
+
+    def get(self, key):
+        entry = cache.get(key)
+        self._count("hits" if entry is not None else "misses")
+        return entry
+
+    def set(self, key, entry):
+        cache.set(key, entry, timeout=self.timeout)
+
+    def get_response(self, request, key):
+        """
+        Return the cached response for a key, answering conditional requests
+        from the stored validators, or None on a miss.
+        """
+        entry = self.get(key)
+        if entry is None:
+            return None
+
+        etag, last_modified = entry["etag"], entry["last_modified"]
+        response = get_not_modified_response(request, etag, last_modified)
+        if response is None:
+            response = set_validators(
+                Response(entry["data"], status=entry["status"]), etag, last_modified
+            )
+        response["X-Cache"] = "HIT"
+        return response
+
+    def set_response(self, key, response, etag, last_modified=None):
+        self.set(
+            key,
+            {
+                "data": response.data,
+                "status": response.status_code,
+                "etag": etag,
+                "last_modified": last_modified,
+            },
+        )
+        response["X-Cache"] = "MISS"
+        return response
+
+    def stats(self):
+        counters = cache.get_many([self._stats_key("hits"), self._stats_key("misses")])
+        hits = counters.get(self._stats_key("hits"), 0)
+        misses = counters.get(self._stats_key("misses"), 0)
+        total = hits + misses
+        return {
+            "hits": hits,
+            "misses": misses,
+            "hit_rate": round(hits / total, 4) if total else None,
+        }
+
+    def reset_stats(self):
+        cache.delete_many([self._stats_key("hits"), self._stats_key("misses")])
+
+    def _count(self, outcome):
+        # Best effort: the counter is dropped when the backend does not keep
+        # it (the dummy cache stores nothing, so incr() always fails)
+        key = self._stats_key(outcome)
+        try:
+            cache.incr(key)
+        except ValueError:
+            if cache.add(key, 1, timeout=None):
+                return
+            try:
+                cache.incr(key)
+            except ValueError:
+                pass
+
+    def _version_key(self, scope):
+        return f"{self.namespace}:version:{scope}"
+
+    def _stats_key(self, outcome):
+        return f"{self.namespace}:stats:{outcome}"
@@ -0,0 +1,43 @@
+from hashlib import md5
+
+from django.utils.cache import get_conditional_response, patch_cache_control
+from django.utils.http import http_date
+
+
+def make_weak_etag(*parts):
+    """
+    Build a weak ETag from the given validator parts.
+    """
+    digest = md5(
+        ":".join(str(part) for part in parts).encode(), usedforsecurity=False
+    ).hexdigest()
+    return f'W/"{digest}"'
+
+
+def is_conditional_request(request):
+    return "HTTP_IF_NONE_MATCH" in request.META or (
+        "HTTP_IF_MODIFIED_SINCE" in request.META
+    )
+
+
+def get_not_modified_response(request, etag, last_modified=None):
+    """
+    Return a 304 (or 412) response when the request preconditions match the
+    given validators, otherwise None.
+    """
+    timestamp = int(last_modified.timestamp()) if last_modified else None
+    response = get_conditional_response(request, etag=etag, last_modified=timestamp)
+    if response is not None:
+        set_validators(response, etag, last_modified)
+    return response
+
+
+def set_validators(response, etag, last_modified=None):
+    """
+    Attach ETag/Last-Modified headers and require revalidation on every use.
+    """
+    response["ETag"] = etag
+    if last_modified:
+        response["Last-Modified"] = http_date(last_modified.timestamp())
+    patch_cache_control(response, private=True, no_cache=True)
+    return response
@@ -0,0 +1,97 @@
+import json
+
+from django.db import connections, transaction
+
+
+def estimate_count(queryset):
+    """
+    Return the planner's row estimate for a queryset on PostgreSQL.
+
+    Falls back to an exact COUNT(*) on other database backends.
+    """
+    connection = connections[queryset.db]
+    if connection.vendor != "postgresql":
+        return queryset.count()
+
+    sql, params = queryset.values("pk").query.sql_with_params()
+    with connection.cursor() as cursor:
+        cursor.execute(f"EXPLAIN (FORMAT JSON) {sql}", params)
+        plan = cursor.fetchone()[0]
+
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return int(plan[0]["Plan"]["Plan Rows"])
+
+
+def estimate_table_count(model, using="default"):
+    """
+    Return the number of rows of a model's table as last recorded by
+    VACUUM/ANALYZE in ``pg_class.reltuples`` (summed over the partitions of
+    a partitioned table), without reading the table.
+
+    Returns None on other database backends, or when the table has not been
+    analyzed yet.
+    """
+    connection = connections[using]
+    if connection.vendor != "postgresql":
+        return None
+
+    with connection.cursor() as cursor:
+        # Leaf tables only: the parent of a partitioned table holds no rows
+        cursor.execute(
+            "SELECT min(reltuples), sum(reltuples) FROM pg_class "
+            "WHERE relkind = 'r' AND (oid = %s::regclass OR oid IN "
+            "(SELECT inhrelid FROM pg_inherits WHERE inhparent = %s::regclass))",
+            [model._meta.db_table] * 2,
+        )
+        lowest, total = cursor.fetchone()
+    # reltuples is -1 until the table is first analyzed
+    if lowest is None or lowest < 0:
+        return None
+    return int(total)
+
+
+def delete_in_chunks(queryset, chunk_size=5000):
+    """
+    Delete the rows of a queryset, in its order, with plain DELETE statements
+    of at most ``chunk_size`` rows, each in its own transaction.
+
+    Unlike ``QuerySet.delete()`` no objects are loaded, no signals are sent
+    and no cascades are followed, so rows referencing these must be deleted
+    first. Returns the number of deleted rows.
+    """
+    model, using = queryset.model, queryset.db
+    pks = queryset.values_list("pk", flat=True)
+    # Select and delete each chunk in one statement where the database
+    # allows LIMIT in an IN subquery (PostgreSQL, SQLite)
+    subquery = connections[using].features.allow_sliced_subqueries_with_in
+    deleted = 0
+    while True:
+        with transaction.atomic(using=using):
+            chunk = pks[:chunk_size] if subquery else list(pks[:chunk_size])
+            rows = model._base_manager.using(using).filter(pk__in=chunk)
+            count = rows._raw_delete(using)
+        deleted += count
+        if count < chunk_size:
+            return deleted
+
+
+def update_in_chunks(queryset, chunk_size=1000, **values):
+    """
+    Apply ``QuerySet.update(**values)`` with UPDATE statements of at most
+    ``chunk_size`` rows, within the caller's transaction.
+
+    The update must take rows out of the queryset (e.g. rewrite the value it
+    filters on), otherwise the same rows would be selected again.
+    Returns the number of updated rows.
+    """
+    model, using = queryset.model, queryset.db
+    pks = queryset.order_by().values_list("pk", flat=True)
+    subquery = connections[using].features.allow_sliced_subqueries_with_in
+    updated = 0
+    while True:
+        chunk = pks[:chunk_size] if subquery else list(pks[:chunk_size])
+        count = model._base_manager.using(using).filter(pk__in=chunk).update(**values)
+        updated += count
+        if count < chunk_size:
+            return updated
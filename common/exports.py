@@ -0,0 +1,55 @@
+import csv
+import datetime
+from itertools import batched
+
+from common.renderers import ORJSONRenderer
+
+
+def to_primitive(value):
+    """
+    Convert a database value to the representation used in API responses.
+    """
+    if isinstance(value, datetime.datetime):
+        value = value.isoformat()
+        return value[:-6] + "Z" if value.endswith("+00:00") else value
+    if isinstance(value, datetime.date):
+        return value.isoformat()
+    return value
+
+
+class EchoBuffer:
+    """
+    File-like object that hands back what is written, for csv.writer.
+    """
+
+    def write(self, value):
+        return value
+
+
+def stream_ndjson(rows, columns, record_type=None, batch_size=500):
+    """
+    Yield NDJSON lines for ``values_list()`` rows, a batch at a time.
+    """
+    renderer = ORJSONRenderer()
+    for batch in batched(rows, batch_size):
+        lines = []
+        for row in batch:
+            record = {"type": record_type} if record_type else {}
+            record.update(zip(columns, row))
+            lines.append(renderer.render(record))
+        yield b"\n".join(lines) + b"\n"
+
+
+def stream_csv(rows, columns, batch_size=500):
+    """
+    Yield a CSV header followed by ``values_list()`` rows, a batch at a time.
+    """
+    writer = csv.writer(EchoBuffer())
+    yield writer.writerow(columns)
+    for batch in batched(rows, batch_size):
+        yield "".join(
+            writer.writerow(
+                ["" if value is None else to_primitive(value) for value in row]
+            )
+            for row in batch
+        )
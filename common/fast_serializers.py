@@ -0,0 +1,166 @@
+from functools import lru_cache
+
+from django.core.exceptions import ImproperlyConfigured
+from django.utils import timezone
+from rest_framework import relations, serializers
+from rest_framework.settings import ISO_8601, api_settings
+
+TEXT_COLUMNS = {"CharField", "TextField", "EmailField", "SlugField", "URLField"}
+
+
+class CompiledReadSerializer:
+    """
+    Read-only fast path for a ModelSerializer.
+
+    The serializer's fields are compiled once into ``(name, column, kind)``
+    steps that turn ``QuerySet.values()`` rows into exactly the primitives
+    ``to_representation`` would produce, without instantiating models or
+    dispatching through every field for every row.
+    """
+
+    def __init__(self, serializer):
+        self.model = serializer.Meta.model
+        self.steps = [self.compile_field(field) for field in serializer.fields.values()]
+        self.value_names = [column for _, column, _, _ in self.steps]
+
+    def compile_field(self, field):
+        opts = self.model._meta
+        concrete = {
+            model_field.name: model_field for model_field in opts.concrete_fields
+        }
+        if field.source not in concrete:
+            raise ImproperlyConfigured(
+                f"Field '{field.field_name}' with source '{field.source}' cannot "
+                "be compiled; only concrete model fields are supported."
+            )
+
+        if isinstance(field, relations.PrimaryKeyRelatedField):
+            if field.pk_field is not None:
+                return field.field_name, field.source, "generic", field.pk_field
+            return field.field_name, field.source, "identity", field
+        if isinstance(field, (relations.RelatedField, serializers.BaseSerializer)):
+            raise ImproperlyConfigured(
+                f"Field '{field.field_name}' is a relation or nested serializer "
+                "and cannot be compiled."
+            )
+
+        if isinstance(field, serializers.ChoiceField):
+            kind = "choice"
+        elif isinstance(field, serializers.DateTimeField) and self.is_iso(
+            field, api_settings.DATETIME_FORMAT
+        ):
+            kind = "datetime"
+        elif isinstance(field, serializers.DateField) and self.is_iso(
+            field, api_settings.DATE_FORMAT
+        ):
+            kind = "date"
+        elif isinstance(field, serializers.UUIDField) and (
+            field.uuid_format == "hex_verbose"
+        ):
+            kind = "str"
+        elif type(field).to_representation is serializers.CharField.to_representation:
+            # Text columns already come back from the database as str
+            text_column = concrete[field.source].get_internal_type() in TEXT_COLUMNS
+            kind = "identity" if text_column else "str"
+        else:
+            kind = "generic"
+        return field.field_name, field.source, kind, field
+
+    @staticmethod
+    def is_iso(field, default_format):
+        output_format = getattr(field, "format", default_format)
+        return output_format is not None and output_format.lower() == ISO_8601
+
+    def get_converters(self):
+        converters = []
+        for name, column, kind, field in self.steps:
+            if kind == "identity":
+                convert = None
+            elif kind == "str":
+                convert = str
+            elif kind == "choice":
+                convert = self.choice_converter(field)
+            elif kind == "datetime":
+                convert = self.datetime_converter(field)
+            elif kind == "date":
+                convert = self.date_converter
+            else:
+                convert = field.to_representation
+            converters.append((name, column, convert))
+        return converters
+
+    @staticmethod
+    def choice_converter(field):
+        choices = field.choice_strings_to_values
+
+        def convert(value):
+            if value == "":
+                return value
+            return choices.get(str(value), value)
+
+        return convert
+
+    @staticmethod
+    def datetime_converter(field):
+        # Resolved once per call, as the current timezone can change per request
+        field_timezone = (
+            field.timezone if hasattr(field, "timezone") else field.default_timezone()
+        )
+        if field_timezone is None:
+            return field.to_representation
+
+        def convert(value):
+            if isinstance(value, str):
+                return value
+            if value.utcoffset() is None:
+                value = timezone.make_aware(value, field_timezone)
+            else:
+                value = value.astimezone(field_timezone)
+            value = value.isoformat()
+            if value.endswith("+00:00"):
+                value = value[:-6] + "Z"
+            return value
+
+        return convert
+
+    @staticmethod
+    def date_converter(value):
+        return value if isinstance(value, str) else value.isoformat()
+
+    def serialize(self, rows):
+        """
+        Serialize an iterable of ``values()`` rows into a list of dicts.
+        """
+        converters = self.get_converters()
+        data = []
+        for row in rows:
+            item = {}
+            for name, column, convert in converters:
+                value = row[column]
+                if value is not None and convert is not None:
+                    value = convert(value)
+                item[name] = value
+            data.append(item)
+        return data
+
+
+@lru_cache(maxsize=128)
+def _compile(serializer_class, fields, omit):
+    kwargs = {}
+    if fields is not None:
+        kwargs["fields"] = list(fields)
+    if omit is not None:
+        kwargs["omit"] = list(omit)
+    return CompiledReadSerializer(serializer_class(**kwargs))
+
+
+def get_compiled_serializer(serializer_class, fields=None, omit=None):
+    """
+    Return the cached compiled serializer for a serializer class and an
+    optional sparse fieldset.
+    """
+    return _compile(
+        serializer_class,
+        tuple(fields) if fields is not None else None,
+        tuple(omit) if omit is not None else None,
+    )
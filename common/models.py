@@ -17,3 +17,17 @@ class TaskPriority(models.TextChoices):
 class TeamRole(models.TextChoices):
     ADMIN = "admin"
     MEMBER = "member"
+
+
+class ActivityAction(models.TextChoices):
+    CREATED = "created"
+    UPDATED = "updated"
+    DELETED = "deleted"
+    IMPORTED = "imported"
+
+
+class ActivityTarget(models.TextChoices):
+    TEAM = "team"
+    MEMBER = "member"
+    PROJECT = "project"
+    TASK = "task"
@@ -0,0 +1,199 @@
+import binascii
+import json
+from base64 import urlsafe_b64decode, urlsafe_b64encode
+
+from django.core.exceptions import ValidationError
+from django.db.models import Q
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination
+from rest_framework.response import Response
+from rest_framework.utils.urls import replace_query_param
+
+from common.db import estimate_count
+
+
+class KeysetPagination(BasePagination):
+    """
+    Keyset (cursor) pagination over a composite, unique ordering.
+
+    Pages are located with a ``WHERE (a, b) < (x, y)`` style filter instead of
+    OFFSET, so deep pages cost the same as the first one when the ordering is
+    backed by an index. Cursors are opaque, url-safe tokens.
+    """
+
+    page_size = 10
+    page_size_query_param = "page_size"
+    max_page_size = 100
+    cursor_query_param = "cursor"
+    total_query_param = "include_total"
+    invalid_cursor_message = "Invalid cursor"
+
+    # The last field must be unique so that every row has a distinct position.
+    ordering = ("-created_at", "-id")
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.request = request
+        self.base_url = request.build_absolute_uri()
+        self.page_size = self.get_page_size(request)
+        self.total = None
+
+        cursor = self.decode_cursor(request, queryset.model)
+        position, reverse = cursor if cursor else (None, False)
+
+        if request.query_params.get(self.total_query_param) in ("1", "true"):
+            self.total = estimate_count(queryset)
+
+        ordering = self._get_ordering(reverse)
+        queryset = queryset.order_by(*ordering)
+        if position is not None:
+            queryset = queryset.filter(self._keyset_filter(ordering, position))
+
+        results = list(queryset[: self.page_size + 1])
+        has_more = len(results) > self.page_size
+        results = results[: self.page_size]
+
+        if reverse:
+            results.reverse()
+            self.has_next = position is not None
+            self.has_previous = has_more
+        else:
+            self.has_next = has_more
+            self.has_previous = position is not None
+
+        self.page = results
+        return results
+
+    def get_page_size(self, request):
+        try:
+            page_size = int(request.query_params[self.page_size_query_param])
+        except (KeyError, ValueError):
+            return self.page_size
+        if page_size <= 0:
+            return self.page_size
+        return min(page_size, self.max_page_size)
+
+    def get_paginated_response(self, data):
+        payload = {
+            "next": self.get_next_link(),
+            "previous": self.get_previous_link(),
+            "results": data,
+        }
+        if self.total is not None:
+            payload = {"count": self.total, **payload}
+        return Response(payload)
+
+    def get_next_link(self):
+        if not self.has_next or not self.page:
+            return None
+        return self.encode_cursor(self._get_position(self.page[-1]), reverse=False)
+
+    def get_previous_link(self):
+        if not self.has_previous or not self.page:
+            return None
+        return self.encode_cursor(self._get_position(self.page[0]), reverse=True)
+
+    def encode_cursor(self, position, reverse):
+        token = json.dumps({"p": position, "r": int(reverse)}, separators=(",", ":"))
+        encoded = urlsafe_b64encode(token.encode("ascii")).decode("ascii")
+        return replace_query_param(self.base_url, self.cursor_query_param, encoded)
+
+    def decode_cursor(self, request, model):
+        """
+        Return the ``(position, reverse)`` of the request's cursor, or None.
+        The position is parsed with the fields of the ordering, so that a
+        tampered cursor is rejected here rather than by the database.
+        """
+        encoded = request.query_params.get(self.cursor_query_param)
+        if not encoded:
+            return None
+
+        try:
+            token = json.loads(urlsafe_b64decode(encoded.encode("ascii")))
+            position = token["p"]
+            reverse = bool(token.get("r", 0))
+        except (
+            AttributeError,
+            TypeError,
+            ValueError,
+            KeyError,
+            UnicodeError,
+            binascii.Error,
+        ):
+            raise NotFound(self.invalid_cursor_message)
+
+        if (
+            not isinstance(position, list)
+            or len(position) != len(self.ordering)
+            or not all(isinstance(value, str) for value in position)
+        ):
+            raise NotFound(self.invalid_cursor_message)
+
+        try:
+            position = [
+                model._meta.get_field(field.lstrip("-")).to_python(value)
+                for field, value in zip(self.ordering, position)
+            ]
+        except ValidationError:
+            raise NotFound(self.invalid_cursor_message)
+        return position, reverse
+
+    def get_schema_operation_parameters(self, view):
+        return [
+            {
+                "name": self.cursor_query_param,
+                "required": False,
+                "in": "query",
+                "description": "Opaque pagination cursor",
+                "schema": {"type": "string"},
+            },
+            {
+                "name": self.page_size_query_param,
+                "required": False,
+                "in": "query",
+                "description": "Number of results to return per page",
+                "schema": {"type": "integer"},
+            },
+            {
+                "name": self.total_query_param,
+                "required": False,
+                "in": "query",
+                "description": "Include an approximate total count",
+                "schema": {"type": "boolean"},
+            },
+        ]
+
+    def _get_ordering(self, reverse):
+        if not reverse:
+            return list(self.ordering)
+        return [
+            field[1:] if field.startswith("-") else f"-{field}"
+            for field in self.ordering
+        ]
+
+    def _get_position(self, instance):
+        position = []
+        for field in self.ordering:
+            # Rows may be model instances or values() dicts
+            name = field.lstrip("-")
+            value = (
+                instance[name]
+                if isinstance(instance, dict)
+                else getattr(instance, name)
+            )
+            position.append(
+                value.isoformat() if hasattr(value, "isoformat") else str(value)
+            )
+        return position
+
+    def _keyset_filter(self, ordering, position):
+        # Expands (a, b) < (x, y) into (a < x) OR (a = x AND b < y) so that the
+        # composite index can be used on every database backend.
+        condition = Q()
+        for index, field in enumerate(ordering):
+            name = field.lstrip("-")
+            lookup = "lt" if field.startswith("-") else "gt"
+            clause = Q(**{f"{name}__{lookup}": position[index]})
+            for prefix, value in zip(ordering[:index], position[:index]):
+                clause &= Q(**{prefix.lstrip("-"): value})
+            condition |= clause
+        return condition
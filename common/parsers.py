@@ -0,0 +1,26 @@
+import orjson
+from django.conf import settings
+from rest_framework.exceptions import ParseError
+from rest_framework.parsers import JSONParser
+
+from common.renderers import ORJSONRenderer
+
+
+class ORJSONParser(JSONParser):
+    """
+    JSONParser backed by orjson, falling back to JSONParser for non UTF-8
+    payloads.
+    """
+
+    renderer_class = ORJSONRenderer
+
+    def parse(self, stream, media_type=None, parser_context=None):
+        parser_context = parser_context or {}
+        encoding = parser_context.get("encoding", settings.DEFAULT_CHARSET).lower()
+        if encoding not in ("utf-8", "utf8"):
+            return super().parse(stream, media_type, parser_context)
+
+        try:
+            return orjson.loads(stream.read())
+        except orjson.JSONDecodeError as exc:
+            raise ParseError("JSON parse error - %s" % str(exc))
@@ -0,0 +1,57 @@
+import orjson
+from rest_framework.renderers import JSONRenderer
+from rest_framework.utils.encoders import JSONEncoder
+
+
+class ORJSONRenderer(JSONRenderer):
+    """
+    JSONRenderer backed by orjson.
+
+    UUIDs, datetimes, dates and dict/list subclasses are encoded natively,
+    anything else (Decimals, lazy strings, querysets, ...) goes through DRF's
+    own encoder so the output matches JSONRenderer's compact output. Pretty
+    printing falls back to JSONRenderer.
+    """
+
+    options = orjson.OPT_UTC_Z | orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+    default = staticmethod(JSONEncoder().default)
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b""
+
+        renderer_context = renderer_context or {}
+        indent = self.get_indent(accepted_media_type, renderer_context)
+        if indent is not None or not self.compact:
+            return super().render(data, accepted_media_type, renderer_context)
+
+        ret = orjson.dumps(data, default=self.default, option=self.options)
+
+        # Escape U+2028 and U+2029 like JSONRenderer, so the output stays a
+        # strict javascript subset.
+        if b"\xe2\x80\xa8" in ret or b"\xe2\x80\xa9" in ret:
+            ret = ret.replace(b"\xe2\x80\xa8", b"\\u2028").replace(
+                b"\xe2\x80\xa9", b"\\u2029"
+            )
+        return ret
+
+
+class NDJSONRenderer(ORJSONRenderer):
+    """
+    Content negotiation target for newline-delimited JSON streams.
+
+    Streaming views write the body themselves; anything rendered through this
+    class (e.g. error responses) is a single JSON document.
+    """
+
+    media_type = "application/x-ndjson"
+    format = "ndjson"
+
+
+class CSVRenderer(ORJSONRenderer):
+    """
+    Content negotiation target for CSV streams, see NDJSONRenderer.
+    """
+
+    media_type = "text/csv"
+    format = "csv"
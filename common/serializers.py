@@ -0,0 +1,60 @@
+from rest_framework import serializers
+
+
+class DynamicFieldsMixin:
+    """
+    ModelSerializer mixin that lets clients pick fields with ``?fields=a,b``
+    or drop them with ``?omit=c``.
+
+    ``get_only_fields()`` maps the remaining fields back to model columns so
+    the queryset can be narrowed with ``only()`` to match.
+    """
+
+    fields_query_param = "fields"
+    omit_query_param = "omit"
+
+    def __init__(self, *args, fields=None, omit=None, **kwargs):
+        super().__init__(*args, **kwargs)
+
+        unknown = set(fields or ()) | set(omit or ())
+        unknown -= set(self.fields)
+        if unknown:
+            raise serializers.ValidationError(
+                {"fields": [f"Unknown field(s): {', '.join(sorted(unknown))}"]}
+            )
+
+        if fields is not None:
+            for name in set(self.fields) - set(fields):
+                self.fields.pop(name)
+        for name in omit or ():
+            self.fields.pop(name, None)
+
+    @classmethod
+    def get_field_params(cls, request):
+        """
+        Return the ``fields`` and ``omit`` keyword arguments for a request.
+        """
+        params = {}
+        for key, query_param in (
+            ("fields", cls.fields_query_param),
+            ("omit", cls.omit_query_param),
+        ):
+            value = request.query_params.get(query_param, "")
+            names = [name.strip() for name in value.split(",") if name.strip()]
+            if names:
+                params[key] = names
+        return params
+
+    def get_only_fields(self):
+        """
+        Return the concrete model fields needed to serialize the selected
+        fields, always including the primary key.
+        """
+        opts = self.Meta.model._meta
+        concrete = {field.name for field in opts.concrete_fields}
+        names = {opts.pk.name}
+        for field in self.fields.values():
+            source = field.source.split(".")[0]
+            if source in concrete:
+                names.add(source)
+        return sorted(names)
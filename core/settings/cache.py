@@ -1 +1,38 @@
+import os
 
+from core.settings.common import BASE_DIR
+
+# Cache
+# https://docs.djangoproject.com/en/5.2/topics/cache/
+#
+# CACHE_BACKEND selects one of the configurations below. "redis" works with any
+# Redis-compatible server through the `redis` package.
+
+CACHE_BACKEND = os.getenv("CACHE_BACKEND", "locmem")
+CACHE_TIMEOUT = int(os.getenv("CACHE_TIMEOUT", "300"))
+
+CACHE_BACKENDS = {
+    "locmem": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        "LOCATION": "taskforce",
+    },
+    "file": {
+        "BACKEND": "django.core.cache.backends.filebased.FileBasedCache",
+        "LOCATION": os.getenv("CACHE_LOCATION", str(BASE_DIR / ".cache")),
+    },
+    "redis": {
+        "BACKEND": "django.core.cache.backends.redis.RedisCache",
+        "LOCATION": os.getenv("REDIS_URL", "redis://localhost:6379/0"),
+    },
+    "dummy": {
+        "BACKEND": "django.core.cache.backends.dummy.DummyCache",
+    },
+}
+
+CACHES = {
+    "default": {
+        **CACHE_BACKENDS[CACHE_BACKEND],
+        "TIMEOUT": CACHE_TIMEOUT,
+        "KEY_PREFIX": "taskforce",
+    }
+}
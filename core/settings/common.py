@@ -35,6 +35,7 @@ DEFAULT_APPS = [
     "django.contrib.sessions",
     "django.contrib.messages",
     "django.contrib.staticfiles",
+    "django.contrib.postgres",
 ]
 
 THIRD_PARTY_APPS = [
@@ -54,6 +55,9 @@ LOCAL_APPS = [
     "apps.projects",
     "apps.teams",
     "apps.tasks",
+    "apps.activity",
+    "apps.worklogs",
+    "apps.search",
 ]
 
 INSTALLED_APPS = DEFAULT_APPS + THIRD_PARTY_APPS + LOCAL_APPS
@@ -66,6 +70,7 @@ MIDDLEWARE = [
     "django.middleware.common.CommonMiddleware",
     "django.middleware.csrf.CsrfViewMiddleware",
     "django.contrib.auth.middleware.AuthenticationMiddleware",
+    "apps.activity.middleware.ActivityMiddleware",
     "django.contrib.messages.middleware.MessageMiddleware",
     "django.middleware.clickjacking.XFrameOptionsMiddleware",
 ]
@@ -129,7 +134,12 @@ REST_FRAMEWORK = {
         "rest_framework.permissions.IsAuthenticated",
     ],
     "DEFAULT_RENDERER_CLASSES": [
-        "rest_framework.renderers.JSONRenderer",
+        "common.renderers.ORJSONRenderer",
+    ],
+    "DEFAULT_PARSER_CLASSES": [
+        "common.parsers.ORJSONParser",
+        "rest_framework.parsers.FormParser",
+        "rest_framework.parsers.MultiPartParser",
     ],
     "DEFAULT_FILTER_BACKENDS": [
         "django_filters.rest_framework.DjangoFilterBackend",
@@ -138,3 +148,50 @@ REST_FRAMEWORK = {
     "PAGE_SIZE": 20,
     "EXCEPTION_HANDLER": "rest_framework.views.exception_handler",
 }
+
+
+# Team deletion
+# Deleted teams are hidden immediately and their rows removed in chunks. With
+# TEAM_DELETE_ASYNC=True the API only marks them, leaving the purge to
+# `python manage.py purge_deleted_teams` (run it from a worker or cron).
+
+TEAM_DELETE_ASYNC = os.getenv("TEAM_DELETE_ASYNC", "False") == "True"
+TEAM_DELETE_CHUNK_SIZE = int(os.getenv("TEAM_DELETE_CHUNK_SIZE", "5000"))
+
+
+# Activity log
+# On PostgreSQL the log is partitioned by month. Run
+# `python manage.py manage_activity_partitions` daily to create the coming
+# months and drop those older than the retention.
+
+ACTIVITY_RETENTION_MONTHS = int(os.getenv("ACTIVITY_RETENTION_MONTHS", "12"))
+ACTIVITY_PARTITIONS_AHEAD = int(os.getenv("ACTIVITY_PARTITIONS_AHEAD", "3"))
+
+
+# Admin
+# Changelists of large tables (common.admin.EstimatedCountPaginator) show
+# PostgreSQL's row estimates instead of exact counts from this many rows on.
+
+ADMIN_ESTIMATED_COUNT_THRESHOLD = int(
+    os.getenv("ADMIN_ESTIMATED_COUNT_THRESHOLD", "10000")
+)
+
+
+# Natural-language task creation
+# Lines are parsed by deterministic grammars (apps.tasks.parsing), then passed
+# to TASK_PARSER_MODEL, the dotted path of a TaskModel subclass, e.g. one
+# calling a language model. The default stub leaves them unchanged; set it
+# empty to skip the stage.
+
+TASK_PARSER_MODEL = os.getenv("TASK_PARSER_MODEL", "apps.tasks.parsing.StubTaskModel")
+
+
+# API schema
+# The OpenAPI schema is generated at build time by
+# `python manage.py generate_openapi_schema` and served from memory. Without
+# the generated files it is generated on first use, once per process.
+
+OPENAPI_SCHEMA_DIR = os.getenv("OPENAPI_SCHEMA_DIR", str(BASE_DIR / "openapi"))
+
+SWAGGER_SETTINGS = {"SPEC_URL": ("schema-json", {"format": ".json"})}
+REDOC_SETTINGS = {"SPEC_URL": ("schema-json", {"format": ".json"})}
@@ -20,21 +20,15 @@ from django.conf.urls.static import static
 from django.contrib import admin
 from django.http import HttpResponse
 from django.urls import include, path
-from drf_yasg import openapi
 from drf_yasg.views import get_schema_view
 from rest_framework.permissions import AllowAny
 
-schema_view = get_schema_view(
-    openapi.Info(
-        title="Taskforce HQ API",
-        default_version="v1",
-        description="Your intelligent AI-powered task management HQ.",
-        contact=openapi.Contact(email="muttakinhasib@outlook.com"),
-        license=openapi.License(name="MIT License"),
-    ),
-    public=True,
-    permission_classes=(AllowAny,),
-)
+from api.schema import API_INFO
+from api.views import SchemaView
+
+# Only renders the UI pages, which load the schema from schema-json (see
+# SWAGGER_SETTINGS)
+schema_view = get_schema_view(API_INFO, public=True, permission_classes=(AllowAny,))
 
 
 def health_check(request):
@@ -46,9 +40,7 @@ urlpatterns = [
     path("api/", include("api.urls")),
     path("admin/", admin.site.urls),
     path("health/", health_check, name="health_check"),
-    path(
-        "swagger<format>/", schema_view.without_ui(cache_timeout=0), name="schema-json"
-    ),
+    path("swagger<format>/", SchemaView.as_view(), name="schema-json"),
     path(
         "swagger/",
         schema_view.with_ui("swagger", cache_timeout=0),